@@ -1,21 +1,120 @@
-from flask import Flask, render_template, request
+from flask import Flask, Response, jsonify, render_template, request, stream_with_context
+import heapq
+import json
 import os
-from process import ResumeProcessor
-import pandas as pd
+import threading
+import time
+from process import ResumeProcessor, document_id
+from resume_analyzer import metrics
+from resume_analyzer.isolation import Budget
+from resume_analyzer.jd_cache import JobDescriptionCache
+from resume_analyzer.profiling import PipelineProfiler
+from resume_analyzer.ranking import ScoreMatrix
+from resume_analyzer.results import HtmlStore
+from resume_analyzer.search import CandidateIndex
 
 # Flask app initialization
 app = Flask(__name__)
 
+# Rendered NER visualizations, kept compressed and out of the score results
+ner_store = HtmlStore(max_entries=int(os.environ.get('RESUME_ANALYZER_NER_CACHE', '256')))
+
 # Initialize the ResumeProcessor
-processor = ResumeProcessor()
+processor = ResumeProcessor(
+    ner_store=ner_store,
+    # Optional SQLite candidate index every scored upload is added to, for
+    # process_shortlist and skill search across past uploads
+    index=CandidateIndex(os.environ['RESUME_ANALYZER_INDEX']) if os.environ.get('RESUME_ANALYZER_INDEX') else None,
+    # Near-duplicate uploads reuse the scores of the first copy when a
+    # similarity threshold such as 0.9 is set; off by default
+    dedup_threshold=float(os.environ.get('RESUME_ANALYZER_DEDUP_THRESHOLD') or 0) or None,
+    # With RESUME_ANALYZER_ISOLATION=1 every uploaded document is analyzed in
+    # its own forked process with a CPU time, wall-clock and memory budget, so
+    # one bad file cannot stall an upload. Off by default: a child forked while
+    # another request thread holds a lock (logging, the NER store) can block
+    # on it forever, so only turn it on with single-threaded workers
+    budget=Budget.from_env() if os.environ.get('RESUME_ANALYZER_ISOLATION') == '1' else None,
+    # Fuzzy skill and title matching, e.g. "ReactJS" with "React.js"; needs rapidfuzz
+    fuzzy_cutoff=float(os.environ['RESUME_ANALYZER_FUZZY_CUTOFF']) if os.environ.get('RESUME_ANALYZER_FUZZY_CUTOFF') else None,
+    # Recruiters upload the same job descriptions again and again; they are
+    # analyzed once and optionally persisted across restarts
+    jd_cache=JobDescriptionCache(
+        max_entries=int(os.environ.get('RESUME_ANALYZER_JD_CACHE_SIZE', '128')),
+        directory=os.environ.get('RESUME_ANALYZER_JD_CACHE_DIR') or None,
+    ),
+)
 
 # Configure file upload folder
 UPLOAD_FOLDER = 'uploads'
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)  # Ensure the folder exists
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
+# Per-request profiling (?profile=1) is only honoured when explicitly enabled
+app.config['PROFILING_ENABLED'] = os.environ.get('RESUME_ANALYZER_PROFILING') == '1'
+app.config['PROFILE_FOLDER'] = os.environ.get('RESUME_ANALYZER_PROFILE_DIR', 'profiles')
+
+# Resumes scored together per streamed chunk; small chunks get the first
+# results to the browser sooner, large ones batch the embedding better
+app.config['STREAM_BATCH_SIZE'] = int(os.environ.get('RESUME_ANALYZER_STREAM_BATCH_SIZE', '4'))
+# Length of the ranking streamed after every result, unless the form sets "top"
+app.config['STREAM_TOP_N'] = int(os.environ.get('RESUME_ANALYZER_STREAM_TOP_N', '10'))
+
+# Whether this process, or the master it was forked from, has warmed up the
+# models; /readyz reports not ready until then
+warm_up_state = {'started': False, 'ready': False, 'error': None, 'seconds': None}
+warm_up_lock = threading.Lock()
+# Set once the warm-up has finished, whether or not it succeeded
+warm_up_done = threading.Event()
+
 # Store parsed resume data in memory (or use a more permanent solution)
 analysis = {}
+# Document IDs (content hashes) of each analysed resume and its job description,
+# to look up their NER HTML
+documents = {}
+# Component scores of every analysed resume, for re-ranking without re-processing
+score_matrix = ScoreMatrix()
+
+def warm_up():
+    """Run representative documents through every stage of the processor.
+
+    wsgi.py calls this before the workers are forked; otherwise it runs in
+    the background, started by the first /readyz probe or by ``python app.py``.
+    """
+    with warm_up_lock:
+        if warm_up_state['started']:
+            return
+        warm_up_state['started'] = True
+
+    start = time.perf_counter()
+    try:
+        processor.warm_up()
+    except Exception as e:
+        # e.g. a model that is not installed; stay not ready
+        app.logger.error('Warm-up failed: %s', e)
+        warm_up_state['error'] = str(e)
+    else:
+        warm_up_state['seconds'] = round(time.perf_counter() - start, 3)
+        warm_up_state['ready'] = True
+        app.logger.info('Warm-up finished in %.1fs', warm_up_state['seconds'])
+    finally:
+        warm_up_done.set()
+
+
+def start_warm_up():
+    """Warm up in a background thread, unless that has already started."""
+    if not warm_up_state['started']:
+        threading.Thread(target=warm_up, name='warm-up', daemon=True).start()
+
+
+def wait_for_warm_up():
+    """Block until the warm-up has finished, starting it if need be.
+
+    Every uploaded document is analyzed in a process forked from this one,
+    which must not happen while the warm-up thread is still loading models.
+    """
+    start_warm_up()
+    warm_up_done.wait()
+
 
 @app.route('/')
 def index():
@@ -23,49 +122,169 @@ def index():
     return render_template('index.html')
 
 
-@app.route('/parsing-result', methods=['POST'])
-def parse_resumes():
-    """Handle multiple resumes and a single JD upload, parsing, and scoring."""
+def profiling_requested():
+    """Whether the current request asked for a profile report."""
+    flag = request.args.get('profile') or request.form.get('profile')
+    return (app.config['PROFILING_ENABLED'] or app.debug) and flag == '1'
+
+
+def save_uploads():
+    """Save the uploaded resumes and job description to the upload folder.
+
+    Returns (resume_paths, jd_path, error): resume_paths maps every saved
+    resume path to its file name, and error is a response to return instead
+    if the upload is incomplete.
+    """
     if 'resumes' not in request.files or 'job_description' not in request.files:
-        return 'Resumes or JD file is missing.', 400
+        return None, None, ('Resumes or JD file is missing.', 400)
 
     resumes = request.files.getlist('resumes')
     jd_file = request.files['job_description']
 
     if not jd_file or jd_file.filename == '':
-        return 'No JD file selected.', 400
+        return None, None, ('No JD file selected.', 400)
     if not resumes or len(resumes) == 0:
-        return 'No resumes selected.', 400
+        return None, None, ('No resumes selected.', 400)
 
     # Save the JD file temporarily
     jd_path = os.path.join(app.config['UPLOAD_FOLDER'], jd_file.filename)
     jd_file.save(jd_path)
 
-    try:
-        for resume_file in resumes:
-            if resume_file.filename == '':
-                continue
+    resume_paths = {}
+    for resume_file in resumes:
+        if resume_file.filename == '':
+            continue
+
+        # Save each resume file temporarily
+        resume_path = os.path.join(app.config['UPLOAD_FOLDER'], resume_file.filename)
+        resume_file.save(resume_path)
+        resume_paths[resume_path] = resume_file.filename
+    return resume_paths, jd_path, None
+
+
+def remove_uploads(resume_paths, jd_path):
+    """Clean up the uploaded files."""
+    for path in list(resume_paths) + [jd_path]:
+        if os.path.exists(path):
+            os.remove(path)
 
-            # Save each resume file temporarily
-            resume_path = os.path.join(app.config['UPLOAD_FOLDER'], resume_file.filename)
-            resume_file.save(resume_path)
 
-            # Process each resume against the JD
-            scores = processor.process_resume(resume_path, jd_path)
-            analysis[resume_file.filename] = scores
+def record_result(name, resume_path, jd_id, result):
+    """Keep a scored resume for the details page and re-ranking.
 
-            # Clean up the uploaded resume file
-            os.remove(resume_path)
+    The details page finds the NER HTML of the resume and job description by
+    their content hashes, because the uploaded files are removed (or replaced
+    by a later upload with the same name) once the request finishes.
+    """
+    analysis[name] = result
+    documents[name] = (document_id(resume_path), jd_id)
+    score_matrix.add(name, result)
 
-        # Clean up the JD file
-        os.remove(jd_path)
 
-        sorted_results = dict(sorted(analysis.items(), key=lambda item: item[1]['total_score'], reverse=True))
-        print("SORTED RESULTS", sorted_results)
+@app.route('/parsing-result', methods=['POST'])
+def parse_resumes():
+    """Handle multiple resumes and a single JD upload, parsing, and scoring."""
+    resume_paths, jd_path, error = save_uploads()
+    if error:
+        return error
+
+    metrics.IN_PROGRESS.inc()
+    try:
+        wait_for_warm_up()
+        if profiling_requested():
+            # Profile each resume on its own so every report covers one document
+            batch_scores = {}
+            for resume_path in resume_paths:
+                profiler = PipelineProfiler()
+                batch_scores[resume_path] = processor.process_resume(resume_path, jd_path, profiler)
+                profiler.write_report(app.config['PROFILE_FOLDER'], resume_path)
+        else:
+            # Process all resumes against the JD in one batch
+            batch_scores = processor.process_batch(list(resume_paths), jd_path)
+        # Files that could not be parsed or exceeded their budget
+        failed = [name for path, name in resume_paths.items() if path not in batch_scores]
+        jd_id = document_id(jd_path)
+        for resume_path, result in batch_scores.items():
+            record_result(resume_paths[resume_path], resume_path, jd_id, result)
+
+        sorted_results = dict(sorted(analysis.items(), key=lambda item: item[1].total_score, reverse=True))
+        app.logger.debug('Scored %d resumes', len(batch_scores))
         # Render results in the template
-        return render_template('result.html', results=sorted_results)
+        return render_template('result.html', results=sorted_results, failed=failed)
     except Exception as e:
         return f"Error processing files: {e}", 500
+    finally:
+        remove_uploads(resume_paths, jd_path)
+        metrics.IN_PROGRESS.dec()
+
+
+def server_sent_event(event, data):
+    """Format one server-sent event with a JSON payload."""
+    return f'event: {event}\ndata: {json.dumps(data)}\n\n'
+
+
+def ranking_event(ranking, provisional):
+    """Format a "ranking" event from (total score, resume) pairs, best first."""
+    return server_sent_event('ranking', {
+        'provisional': provisional,
+        'top': [{'resume': name, 'total_score': score} for score, name in ranking],
+    })
+
+
+@app.route('/parsing-result/stream', methods=['POST'])
+def stream_results():
+    """Score an upload and stream each result as soon as it is ready.
+
+    Takes the same form as /parsing-result and responds with server-sent
+    events: "start", then "result" or "failed" for every resume, each result
+    followed by a provisional "ranking" of the top candidates so far, then
+    the final "ranking" of the whole upload, and finally "done". Provisional
+    rankings can still change as later resumes arrive; only the final one,
+    with "provisional" false, is the ranking of the upload. An "error" event
+    ends the stream if the upload cannot be processed.
+    """
+    resume_paths, jd_path, error = save_uploads()
+    if error:
+        return error
+    top = request.form.get('top', type=int) or app.config['STREAM_TOP_N']
+
+    def generate():
+        metrics.IN_PROGRESS.inc()
+        try:
+            yield server_sent_event('start', {'total': len(resume_paths)})
+            wait_for_warm_up()
+            job_description = processor.prepare_job_description(jd_path)
+            if not job_description:
+                yield server_sent_event('error', {'message': 'Could not process the job description.'})
+                return
+            jd_id = document_id(jd_path)
+
+            scored, done = [], 0
+            results = processor.iter_batch(
+                list(resume_paths), job_description, batch_size=app.config['STREAM_BATCH_SIZE']
+            )
+            for resume_path, result in results:
+                name = resume_paths[resume_path]
+                done += 1
+                if result is None:
+                    yield server_sent_event('failed', {'resume': name, 'done': done})
+                    continue
+
+                record_result(name, resume_path, jd_id, result)
+                scored.append((result.total_score, name))
+                yield server_sent_event('result', {'resume': name, 'done': done, 'scores': result.to_dict()})
+                yield ranking_event(heapq.nlargest(top, scored), provisional=True)
+            yield ranking_event(heapq.nlargest(top, scored), provisional=False)
+            yield server_sent_event('done', {'scored': len(scored), 'failed': done - len(scored)})
+        except Exception as e:
+            yield server_sent_event('error', {'message': f'Error processing files: {e}'})
+        finally:
+            remove_uploads(resume_paths, jd_path)
+            metrics.IN_PROGRESS.dec()
+
+    # Proxies such as nginx must pass the events through unbuffered
+    headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers=headers)
 
 
 @app.route('/details')
@@ -75,15 +294,74 @@ def resume_details():
 
     if not resume_name:
         return "Resume not specified.", 400
-    print("ANALYSIS", analysis)
     resume_data = analysis.get(resume_name)
 
     if not resume_data:
         return "Resume details not found.", 404
 
-    # Pass data to the template
-    return render_template('detail.html', data=resume_data)
+    # NER HTML may have been evicted from the bounded store; the page then
+    # shows empty visualizations
+    resume_id, jd_id = documents[resume_name]
+    return render_template(
+        'detail.html',
+        data=resume_data,
+        resume_ner=ner_store.get(resume_id) or '',
+        job_ner=ner_store.get(jd_id) or '',
+    )
+
+
+@app.route('/rerank', methods=['POST'])
+def rerank():
+    """Re-rank all analysed resumes with new score weights.
+
+    Expects a JSON body like {"weights": {"skills_match": 0.5, ...}, "top": 10}.
+    """
+    payload = request.get_json(silent=True) or {}
+    weights = payload.get('weights')
+    top = payload.get('top')
+    if not isinstance(weights, dict):
+        return jsonify(error='A "weights" object is required.'), 400
+    if top is not None and (not isinstance(top, int) or top < 1):
+        return jsonify(error='"top" must be a positive integer.'), 400
+
+    try:
+        ranking = score_matrix.rerank(weights, top=top)
+    except (TypeError, ValueError) as e:
+        return jsonify(error=str(e)), 400
+
+    return jsonify(ranking=[{'resume': resume, 'total_score': score} for resume, score in ranking])
+
+
+@app.route('/healthz')
+def healthz():
+    """Liveness probe: the process is up and serving requests."""
+    return jsonify(status='ok')
+
+
+@app.route('/readyz')
+def readyz():
+    """Readiness probe: 503 until the models are warmed up.
+
+    The first probe starts the warm-up if nothing else has, so a load
+    balancer never routes uploads to a worker that would load models lazily.
+    """
+    start_warm_up()
+    if warm_up_state['ready']:
+        return jsonify(status='ready', warm_up_seconds=warm_up_state['seconds'])
+    if warm_up_state['error']:
+        return jsonify(status='failed', error=warm_up_state['error']), 503
+    return jsonify(status='warming up'), 503
+
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Expose pipeline metrics in the Prometheus text format."""
+    return Response(metrics.expose(), mimetype='text/plain; version=0.0.4')
 
 
 if __name__ == '__main__':
+    # The debug reloader runs this module in a watcher process and again in
+    # the server process it starts; only the server process warms up
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_warm_up()
     app.run(debug=True)
@@ -0,0 +1,395 @@
+"""Score a directory or manifest of resumes against one or more job descriptions.
+
+Results are streamed to a JSONL or CSV file while they are computed. Every
+finished (job description, resume) pair is recorded in a checkpoint file, so
+an interrupted run picks up where it left off when started again with the
+same arguments.
+
+Usage:
+    python batch_score.py resumes/ --jd jd.pdf --output results.jsonl --workers 4
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from process import ResumeProcessor
+from resume_analyzer.dedup import DEFAULT_THRESHOLD
+from resume_analyzer.document_parsing import DocumentParser
+from resume_analyzer.isolation import MIB, Budget
+from resume_analyzer.jd_cache import JobDescriptionCache
+from resume_analyzer.matching import FUZZY_CUTOFF
+from resume_analyzer.results import ScoreResult
+from resume_analyzer.search import CandidateIndex
+
+logger = logging.getLogger(__name__)
+
+SCORE_FIELDS = [
+    "total_score",
+    "skills_match",
+    "experience_match",
+    "education_match",
+    "job_title_relevance",
+    "overall_similarity",
+]
+CSV_FIELDS = (
+    ["job_description", "resume", "status"]
+    + SCORE_FIELDS
+    + ["matching_skills", "missing_skills", "email", "phone", "location"]
+    + ["partial", "duplicate_of"]
+)
+
+
+def collect_resumes(source: str) -> List[str]:
+    """
+    List the resumes to score.
+
+    Args:
+        source (str): A directory, searched recursively for supported files,
+            or a manifest file: one path per line, or a JSON list of paths or of
+            ``{"path": ..., "kind": ...}`` entries as written by benchmarks.corpus
+
+    Returns:
+        List[str]: Resume paths in a stable order
+    """
+    path = Path(source)
+    if path.is_dir():
+        return sorted(
+            str(file)
+            for file in path.rglob("*")
+            if file.suffix.lower() in DocumentParser.SUPPORTED_FORMATS
+        )
+
+    if path.suffix.lower() == ".json":
+        with open(path) as f:
+            entries = json.load(f)
+        return [
+            entry if isinstance(entry, str) else entry["path"]
+            for entry in entries
+            if isinstance(entry, str) or entry.get("kind", "resume") == "resume"
+        ]
+
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def to_record(jd_path: str, resume_path: str, result: Optional[ScoreResult]) -> Dict:
+    """Flatten the scores of one resume into an output record."""
+    record = {"job_description": jd_path, "resume": resume_path}
+    if result is None:
+        record["status"] = "failed"
+        return record
+
+    scores = result.to_dict()
+    contact = scores.pop("contact")
+    record["status"] = "scored"
+    record.update({field: scores[field] for field in SCORE_FIELDS})
+    record["matching_skills"] = scores["matching_skills"]
+    record["missing_skills"] = scores["missing_skills"]
+    record.update({key: contact[key] for key in ("email", "phone", "location")})
+    record["partial"] = scores["partial"]
+    record["duplicate_of"] = scores["duplicate_of"]
+    return record
+
+
+class ResultWriter:
+    """Appends records to a JSONL or CSV file, flushing after every chunk."""
+
+    def __init__(self, path: str, fmt: str):
+        self.fmt = fmt
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, "a", newline="")
+        if fmt == "csv":
+            self.writer = csv.DictWriter(self.file, fieldnames=CSV_FIELDS)
+            if is_new:
+                self.writer.writeheader()
+
+    def write(self, record: Dict):
+        if self.fmt == "csv":
+            row = dict(record)
+            for field in ("matching_skills", "missing_skills"):
+                row[field] = "; ".join(row.get(field) or [])
+            self.writer.writerow(row)
+        else:
+            self.file.write(json.dumps(record) + "\n")
+
+    def sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        self.file.close()
+
+
+class Checkpoint:
+    """Append-only log of the (job description, resume) pairs already done."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Set[Tuple[str, str]] = set()
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    jd_path, sep, resume_path = line.rstrip("\n").partition("\t")
+                    # A torn last line from a crash is simply redone
+                    if sep and resume_path:
+                        self.done.add((jd_path, resume_path))
+        self.file = open(path, "a")
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self.done
+
+    def add_many(self, keys: Iterable[Tuple[str, str]]):
+        for jd_path, resume_path in keys:
+            self.file.write(f"{jd_path}\t{resume_path}\n")
+            self.done.add((jd_path, resume_path))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        self.file.close()
+
+
+def run(
+    processor: ResumeProcessor,
+    resume_paths: List[str],
+    jd_paths: List[str],
+    writer: ResultWriter,
+    checkpoint: Checkpoint,
+    workers: int,
+    batch_size: int,
+    pipeline_workers: Optional[Tuple[int, int]] = None,
+) -> Dict[str, int]:
+    """Score every pending pair and stream the results to ``writer``.
+
+    With ``pipeline_workers``, a (parse, extract) pair of pool sizes, resumes
+    go through ``ResumeProcessor.build_pipeline`` instead of ``iter_batch``.
+    """
+    counts = {"scored": 0, "failed": 0, "skipped": 0}
+
+    for jd_path in jd_paths:
+        pending = [path for path in resume_paths if (jd_path, path) not in checkpoint]
+        counts["skipped"] += len(resume_paths) - len(pending)
+        if not pending:
+            continue
+
+        job_description = processor.prepare_job_description(jd_path)
+        if not job_description:
+            logger.error(f"Could not parse job description {jd_path}, skipping it")
+            continue
+
+        logger.info(f"Scoring {len(pending)} resumes against {jd_path}")
+        start = time.perf_counter()
+        records: List[Dict] = []
+        pipeline = None
+        if pipeline_workers is not None:
+            pipeline = processor.build_pipeline(
+                job_description, *pipeline_workers, batch_size=batch_size
+            )
+            results = pipeline.run((path, path) for path in pending)
+        else:
+            results = processor.iter_batch(
+                pending, job_description, workers=workers, batch_size=batch_size
+            )
+        for i, (resume_path, result) in enumerate(results, start=1):
+            records.append(to_record(jd_path, resume_path, result))
+
+            # Records are written and checkpointed together once per chunk, and
+            # only after they are on disk, so an interrupted run redoes at most
+            # the chunk it was working on
+            if len(records) >= batch_size or i == len(pending):
+                for record in records:
+                    writer.write(record)
+                    counts[record["status"]] += 1
+                writer.sync()
+                checkpoint.add_many(
+                    (record["job_description"], record["resume"]) for record in records
+                )
+                records = []
+                rate = i / (time.perf_counter() - start)
+                logger.info(f"{i}/{len(pending)} resumes done ({rate:.1f}/s)")
+
+        if pipeline is not None:
+            for stage, stats in pipeline.report().items():
+                logger.info(
+                    f"Stage {stage}: {stats['workers']} workers, "
+                    f"{stats['utilization']:.0%} utilized, "
+                    f"{stats['blocked_seconds']:.1f}s blocked downstream, "
+                    f"{stats['starved_seconds']:.1f}s waiting for input"
+                )
+
+    return counts
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("resumes", help="Directory of resumes or manifest file")
+    arg_parser.add_argument(
+        "--jd",
+        action="append",
+        required=True,
+        help="Job description to score against; may be given more than once",
+    )
+    arg_parser.add_argument("--output", required=True, help="JSONL or CSV file")
+    arg_parser.add_argument(
+        "--format",
+        choices=["jsonl", "csv"],
+        help="Output format; inferred from the output file extension by default",
+    )
+    arg_parser.add_argument(
+        "--checkpoint", help="Checkpoint file (default: <output>.checkpoint)"
+    )
+    arg_parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Discard the output and checkpoint of a previous run",
+    )
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes used to parse and extract resumes",
+    )
+    arg_parser.add_argument("--batch-size", type=int, default=64)
+    arg_parser.add_argument(
+        "--pipeline",
+        metavar="PARSE,EXTRACT",
+        help="Run parsing and extraction in separate pools of these sizes, e.g. "
+        "2,4, with scoring in its own batching thread; reports the utilization "
+        "of every stage",
+    )
+    arg_parser.add_argument(
+        "--dedup-threshold",
+        type=float,
+        help="Similarity above which near-duplicate resumes reuse the scores "
+        f"of the first one, e.g. {DEFAULT_THRESHOLD}; by default every resume "
+        "is scored",
+    )
+    arg_parser.add_argument(
+        "--cascade-fraction",
+        type=float,
+        help="Only fully score this fraction of each batch, ranked by skills and "
+        "job title; the rest get partial scores",
+    )
+    arg_parser.add_argument(
+        "--cascade-threshold",
+        type=float,
+        help="Also fully score resumes whose skills and job title screening score "
+        "(0-1) reaches this value",
+    )
+    arg_parser.add_argument(
+        "--fuzzy-cutoff",
+        type=float,
+        nargs="?",
+        const=FUZZY_CUTOFF,
+        help=f"Also match skills and job titles fuzzily (needs rapidfuzz), at this "
+        f"minimum similarity from 0 to 100 (default {FUZZY_CUTOFF})",
+    )
+    arg_parser.add_argument(
+        "--jd-cache",
+        metavar="DIR",
+        help="Persist analyzed job descriptions to DIR and reuse them across runs",
+    )
+    arg_parser.add_argument(
+        "--index",
+        metavar="DB",
+        help="Also add every analyzed resume to this SQLite candidate index",
+    )
+    default_budget = Budget()
+    arg_parser.add_argument(
+        "--cpu-seconds",
+        type=int,
+        default=default_budget.cpu_seconds,
+        help="CPU time one resume may take before it is killed and marked failed",
+    )
+    arg_parser.add_argument(
+        "--wall-seconds",
+        type=float,
+        default=default_budget.wall_seconds,
+        help="Wall-clock time one resume may take before it is killed",
+    )
+    arg_parser.add_argument(
+        "--memory-mb",
+        type=int,
+        default=default_budget.memory_bytes // MIB,
+        help="Memory one resume may allocate before it is killed",
+    )
+    arg_parser.add_argument(
+        "--no-isolation",
+        action="store_true",
+        help="Analyze resumes in-process, without per-document budgets",
+    )
+    args = arg_parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    fmt = args.format or ("csv" if args.output.lower().endswith(".csv") else "jsonl")
+    checkpoint_path = args.checkpoint or f"{args.output}.checkpoint"
+    if args.restart:
+        for path in (args.output, checkpoint_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    pipeline_workers = None
+    if args.pipeline:
+        try:
+            parse_workers, extract_workers = map(int, args.pipeline.split(","))
+        except ValueError:
+            arg_parser.error("--pipeline expects two worker counts, e.g. 2,4")
+        pipeline_workers = (parse_workers, extract_workers)
+
+    resume_paths = collect_resumes(args.resumes)
+    if not resume_paths:
+        logger.error(f"No resumes found in {args.resumes}")
+        return 1
+
+    processor = ResumeProcessor(
+        dedup_threshold=args.dedup_threshold or None,
+        cascade_fraction=args.cascade_fraction,
+        cascade_threshold=args.cascade_threshold,
+        fuzzy_cutoff=args.fuzzy_cutoff,
+        index=CandidateIndex(args.index) if args.index else None,
+        jd_cache=(
+            JobDescriptionCache(directory=args.jd_cache) if args.jd_cache else None
+        ),
+        budget=(
+            None
+            if args.no_isolation
+            else Budget(args.cpu_seconds, args.wall_seconds, args.memory_mb * MIB)
+        ),
+    )
+    writer = ResultWriter(args.output, fmt)
+    checkpoint = Checkpoint(checkpoint_path)
+    try:
+        counts = run(
+            processor,
+            resume_paths,
+            args.jd,
+            writer,
+            checkpoint,
+            args.workers,
+            args.batch_size,
+            pipeline_workers,
+        )
+    except KeyboardInterrupt:
+        logger.warning("Interrupted; run again with the same arguments to resume")
+        return 130
+    finally:
+        writer.close()
+        checkpoint.close()
+
+    logger.info(
+        f"Done: {counts['scored']} scored, {counts['failed']} failed, "
+        f"{counts['skipped']} already done in a previous run"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
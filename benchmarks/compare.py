@@ -0,0 +1,86 @@
+"""Compare two benchmark result files and report regressions.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json --threshold 10
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, Tuple
+
+Key = Tuple[str, str, str, str]
+
+
+def load(path: str) -> Dict[Key, Dict]:
+    with open(path) as f:
+        report = json.load(f)
+    return {
+        (entry["stage"], entry["variant"], entry["size"], entry["format"]): entry
+        for entry in report["results"]
+    }
+
+
+def compare(
+    baseline: Dict[Key, Dict],
+    candidate: Dict[Key, Dict],
+    threshold: float,
+    metric: str = "median_ms",
+) -> int:
+    """
+    Print a comparison table of two runs.
+
+    Args:
+        baseline (Dict): Results of the reference run
+        candidate (Dict): Results of the run under test
+        threshold (float): Slowdown in percent above which a stage regressed
+        metric (str): Statistic to compare
+
+    Returns:
+        int: Number of regressed stages
+    """
+    regressions = 0
+    print(
+        f"{'stage':<22} {'variant':<7} {'size':<7} {'format':<6} "
+        f"{'before':>10} {'after':>10} {'change':>8}"
+    )
+    for key in sorted(baseline.keys() & candidate.keys()):
+        before = baseline[key][metric]
+        after = candidate[key][metric]
+        change = (after - before) / before * 100 if before else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(
+            f"{key[0]:<22} {key[1]:<7} {key[2]:<7} {key[3]:<6} "
+            f"{before:10.2f} {after:10.2f} {change:+7.1f}%{flag}"
+        )
+
+    for key in sorted(baseline.keys() ^ candidate.keys()):
+        side = "baseline" if key in baseline else "candidate"
+        print(f"{' / '.join(key)}: only in {side}")
+
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("baseline")
+    arg_parser.add_argument("candidate")
+    arg_parser.add_argument(
+        "--threshold", type=float, default=10.0, help="Allowed slowdown in percent"
+    )
+    arg_parser.add_argument("--metric", default="median_ms")
+    args = arg_parser.parse_args()
+
+    regressions = compare(
+        load(args.baseline), load(args.candidate), args.threshold, args.metric
+    )
+    if regressions:
+        print(f"{regressions} stage(s) regressed by more than {args.threshold}%")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+"""Deterministic generator of synthetic resumes and job descriptions.
+
+The same seed always produces the same documents, so benchmark runs on
+different machines or commits are measured on identical inputs.
+
+Usage:
+    python -m benchmarks.corpus --output benchmarks/corpus --count 5
+"""
+
+import argparse
+import csv
+import json
+import random
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+SIZES = {
+    # size: (number of positions, bullets per position, extra skills)
+    "small": (2, 3, 8),
+    "medium": (5, 5, 20),
+    "large": (15, 8, 45),
+}
+
+FORMATS = ("pdf", "docx")
+
+COMMON_SKILLS = [
+    "Python",
+    "Java",
+    "JavaScript",
+    "SQL",
+    "AWS",
+    "Docker",
+    "Kubernetes",
+    "React",
+    "Flask",
+    "PostgreSQL",
+    "Git",
+    "Linux",
+    "Machine Learning",
+    "Data Analysis",
+    "Project Management",
+    "Customer Service",
+    "Communication",
+    "Excel",
+]
+
+FIRST_NAMES = ["Alex", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Sam", "Avery"]
+LAST_NAMES = ["Smith", "Garcia", "Chen", "Patel", "Johnson", "Kim", "Nguyen", "Brown"]
+CITIES = ["New York, NY", "Seattle, WA", "Austin, TX", "Boston, MA", "Denver, CO"]
+COMPANIES = [
+    "Acme Corp",
+    "Globex",
+    "Initech",
+    "Umbrella Labs",
+    "Hooli",
+    "Stark Industries",
+]
+UNIVERSITIES = ["University of Washington", "State University", "Tech Institute"]
+FIELDS = ["Computer Science", "Business Administration", "Hospitality Management"]
+MONTHS = ["January", "March", "May", "June", "August", "October"]
+VERBS = ["Led", "Built", "Designed", "Improved", "Maintained", "Delivered", "Automated"]
+OBJECTS = [
+    "a customer facing platform",
+    "internal reporting tools",
+    "the data pipeline",
+    "guest services operations",
+    "a microservices architecture",
+    "the onboarding process",
+]
+
+
+def _read_column(path: str, column: str) -> List[str]:
+    with open(path, encoding="utf-8") as f:
+        return [
+            row[column].strip()
+            for row in csv.DictReader(f)
+            if row[column] and row[column].strip().isascii()
+        ]
+
+
+@lru_cache(maxsize=None)
+def _vocabulary() -> Dict[str, List[str]]:
+    """Load skills, titles and degrees from the project's data files."""
+    return {
+        "skills": _read_column("data/skills_list.csv", "skill_name"),
+        "titles": _read_column("data/job_title.csv", "job_title"),
+        "degrees": [
+            degree
+            for degree in _read_column("data/degrees.csv", "degree_title")
+            if len(degree) > 4
+        ],
+    }
+
+
+def _skills(rng: random.Random, count: int) -> List[str]:
+    vocabulary = _vocabulary()["skills"]
+    picked = rng.sample(COMMON_SKILLS, min(6, len(COMMON_SKILLS)))
+    picked += rng.sample(vocabulary, count)
+    return list(dict.fromkeys(picked))
+
+
+def _bullet(rng: random.Random, skills: Sequence[str]) -> str:
+    return (
+        f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using "
+        f"{rng.choice(skills)} and {rng.choice(skills)}, improving results by "
+        f"{rng.randint(5, 60)}%."
+    )
+
+
+def generate_resume(seed: str, size: str = "medium") -> str:
+    """
+    Generate the text of a synthetic resume.
+
+    Args:
+        seed (str): Seed for the random generator
+        size (str): One of ``SIZES``
+
+    Returns:
+        str: Resume text
+    """
+    rng = random.Random(f"resume-{seed}-{size}")
+    positions, bullets, extra_skills = SIZES[size]
+    vocabulary = _vocabulary()
+    skills = _skills(rng, extra_skills)
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    titles = rng.sample(vocabulary["titles"], positions)
+
+    lines = [
+        f"{first} {last}",
+        f"Email: {first.lower()}.{last.lower()}@example.com",
+        f"Phone: 555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        rng.choice(CITIES),
+        "",
+        "SUMMARY",
+        f"{titles[0]} with {rng.randint(1, 20)} years of experience in "
+        f"{', '.join(skills[:3])}.",
+        "",
+        "EXPERIENCE",
+    ]
+
+    year = 2024
+    for title in titles:
+        start = year - rng.randint(1, 4)
+        end = "Present" if year == 2024 else f"{rng.choice(MONTHS)} {year}"
+        lines += [
+            title,
+            f"{rng.choice(COMPANIES)}, {rng.choice(CITIES)}",
+            f"{rng.choice(MONTHS)} {start} - {end}",
+        ]
+        lines += [_bullet(rng, skills) for _ in range(bullets)]
+        lines.append("")
+        year = start
+
+    lines += [
+        "EDUCATION",
+        f"{rng.choice(vocabulary['degrees']).title()} in {rng.choice(FIELDS)}",
+        rng.choice(UNIVERSITIES),
+        f"Graduation: {rng.choice(MONTHS)} {year - 1}",
+        "",
+        "SKILLS",
+        ", ".join(skills),
+    ]
+    return "\n".join(lines)
+
+
+def generate_job_description(seed: str, size: str = "medium") -> str:
+    """
+    Generate the text of a synthetic job description.
+
+    Args:
+        seed (str): Seed for the random generator
+        size (str): One of ``SIZES``
+
+    Returns:
+        str: Job description text
+    """
+    rng = random.Random(f"jd-{seed}-{size}")
+    positions, bullets, extra_skills = SIZES[size]
+    vocabulary = _vocabulary()
+    skills = _skills(rng, max(4, extra_skills // 2))
+    title = rng.choice(vocabulary["titles"])
+
+    lines = [
+        f"Job Title: {title}",
+        f"Company: {rng.choice(COMPANIES)}",
+        f"Location: {rng.choice(CITIES)}",
+        "",
+        "Responsibilities:",
+    ]
+    lines += [_bullet(rng, skills) for _ in range(positions * 2)]
+    lines += [
+        "",
+        "Requirements:",
+        f"- {rng.randint(1, 10)}+ years of experience as a {title}.",
+        f"- {rng.choice(vocabulary['degrees']).title()} in {rng.choice(FIELDS)}.",
+        f"- Proficiency in {', '.join(skills[: len(skills) // 2])}.",
+        f"- Experience with {', '.join(skills[len(skills) // 2:])}.",
+    ]
+    lines += [_bullet(rng, skills) for _ in range(bullets)]
+    return "\n".join(lines)
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _wrap(text: str, width: int = 90) -> List[str]:
+    lines = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split():
+            if line and len(line) + len(word) + 1 > width:
+                lines.append(line)
+                line = word
+            else:
+                line = f"{line} {word}" if line else word
+        lines.append(line)
+    return lines
+
+
+def write_pdf(text: str, path: str, lines_per_page: int = 55):
+    """
+    Write text to a minimal single-font PDF.
+
+    Only the standard Helvetica font is used, so no PDF library is needed.
+
+    Args:
+        text (str): ASCII text to write
+        path (str): Destination file
+        lines_per_page (int): Number of text lines per page
+    """
+    lines = _wrap(text)
+    pages = [
+        lines[i : i + lines_per_page] for i in range(0, len(lines), lines_per_page)
+    ] or [[]]
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+        b"/Encoding /WinAnsiEncoding >>",
+    ]
+    page_numbers = []
+    for page_lines in pages:
+        body = "BT /F1 10 Tf 13 TL 50 770 Td "
+        body += " ".join(f"({_pdf_escape(line)}) Tj T*" for line in page_lines)
+        body += " ET"
+        stream = body.encode("latin-1", "replace")
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+        content_number = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % content_number
+        )
+        page_numbers.append(len(objects))
+
+    kids = b" ".join(b"%d 0 R" % number for number in page_numbers)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(pages))
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref_offset,
+    )
+
+    Path(path).write_bytes(bytes(output))
+
+
+def write_docx(text: str, path: str):
+    """Write text to a DOCX file, one paragraph per line."""
+    from docx import Document
+
+    document = Document()
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    document.save(path)
+
+
+def generate_corpus(
+    directory: str,
+    count: int = 3,
+    sizes: Sequence[str] = tuple(SIZES),
+    formats: Sequence[str] = FORMATS,
+    seed: int = 0,
+) -> List[Dict[str, str]]:
+    """
+    Write a synthetic corpus of resumes and job descriptions.
+
+    Args:
+        directory (str): Output directory, created if missing
+        count (int): Number of resumes per size and format
+        sizes (Sequence[str]): Document sizes to generate
+        formats (Sequence[str]): File formats to generate
+        seed (int): Base seed
+
+    Returns:
+        List of manifest entries with ``kind``, ``size``, ``format`` and ``path``
+    """
+    writers = {"pdf": write_pdf, "docx": write_docx}
+    output = Path(directory)
+    output.mkdir(parents=True, exist_ok=True)
+
+    manifest = []
+    for size in sizes:
+        for fmt in formats:
+            documents = [
+                ("job_description", generate_job_description(f"{seed}-0", size))
+            ]
+            documents += [
+                ("resume", generate_resume(f"{seed}-{i}", size)) for i in range(count)
+            ]
+            for i, (kind, text) in enumerate(documents):
+                name = "jd" if kind == "job_description" else f"resume_{i - 1:03d}"
+                path = output / f"{size}_{name}.{fmt}"
+                writers[fmt](text, str(path))
+                manifest.append(
+                    {"kind": kind, "size": size, "format": fmt, "path": str(path)}
+                )
+
+    with open(output / "manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--output", default="benchmarks/corpus")
+    arg_parser.add_argument("--count", type=int, default=3)
+    arg_parser.add_argument("--sizes", nargs="+", default=list(SIZES), choices=SIZES)
+    arg_parser.add_argument("--formats", nargs="+", default=FORMATS, choices=FORMATS)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    manifest = generate_corpus(
+        args.output, args.count, args.sizes, args.formats, args.seed
+    )
+    print(f"Wrote {len(manifest)} documents to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
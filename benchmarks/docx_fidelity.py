@@ -0,0 +1,158 @@
+"""Check the streaming DOCX backend against python-docx, for fidelity and speed.
+
+For every DOCX file, the reference is every paragraph python-docx can reach:
+body paragraphs, paragraphs in (nested) table cells, and header and footer
+paragraphs. The report gives the share of those the "xml" backend returns as
+lines, how much text each backend returns, and their median parse times.
+The samples in data/ are always checked, plus a generated document with a
+table, header and footer, plus synthetic resumes written by benchmarks.corpus.
+Exits with status 1 if the "xml" backend misses a reference paragraph.
+
+Usage:
+    python -m benchmarks.docx_fidelity --synthetic 3 --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+from benchmarks.corpus import generate_corpus
+from resume_analyzer.document_parsing import DocumentParser
+
+SAMPLE_DIRS = ("data/Resumes", "data/JDs")
+
+
+def write_layout_fixture(path: str):
+    """A resume laid out the way templates often are: header and tables."""
+    from docx import Document
+
+    document = Document()
+    section = document.sections[0]
+    section.header.paragraphs[0].text = "Jordan Kim | jordan.kim@example.com"
+    section.footer.paragraphs[0].text = "References available on request"
+    document.add_paragraph("Summary")
+    document.add_paragraph("Data engineer with 6 years of experience.")
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "Skills"
+    table.cell(0, 1).text = "Python, SQL, Apache Spark"
+    table.cell(1, 0).text = "Education"
+    inner = table.cell(1, 1).add_table(rows=1, cols=1)
+    inner.cell(0, 0).text = "BS in Computer Science"
+    document.save(path)
+
+
+def _table_paragraphs(tables) -> Iterable[str]:
+    for table in tables:
+        for row in table.rows:
+            for cell in row.cells:
+                yield from (paragraph.text for paragraph in cell.paragraphs)
+                yield from _table_paragraphs(cell.tables)
+
+
+def reference_paragraphs(path: str) -> Set[str]:
+    """Non-empty paragraph texts python-docx finds anywhere in a document."""
+    from docx import Document
+
+    document = Document(path)
+    texts = [paragraph.text for paragraph in document.paragraphs]
+    texts += _table_paragraphs(document.tables)
+    for section in document.sections:
+        for part in (section.header, section.footer):
+            texts += [paragraph.text for paragraph in part.paragraphs]
+            texts += _table_paragraphs(part.tables)
+    return {text.strip() for text in texts if text.strip()}
+
+
+def parse_timed(path: str, backend: str, repeat: int) -> Dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = DocumentParser.parse_docx(path, backend=backend) or ""
+        samples.append(time.perf_counter() - start)
+    return {"text": text, "ms": statistics.median(samples) * 1000}
+
+
+def check(paths: List[str], repeat: int) -> List[Dict]:
+    rows = []
+    for path in paths:
+        reference = reference_paragraphs(path)
+        xml = parse_timed(path, "xml", repeat)
+        python_docx = parse_timed(path, "python-docx", repeat)
+        lines = {line.strip() for line in xml["text"].split("\n")}
+        # Paragraphs with line breaks span several lines of the output
+        missing = sorted(
+            text
+            for text in reference
+            if not all(part.strip() in lines for part in text.split("\n"))
+        )
+        rows.append(
+            {
+                "path": path,
+                "coverage": 1 - len(missing) / len(reference) if reference else 1.0,
+                "missing": missing,
+                "xml_chars": len(xml["text"]),
+                "python_docx_chars": len(python_docx["text"]),
+                "xml_ms": xml["ms"],
+                "python_docx_ms": python_docx["ms"],
+            }
+        )
+    return rows
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=2,
+        help="Synthetic resumes per size added from benchmarks.corpus",
+    )
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--output", help="Also write the report as JSON")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = sorted(
+            str(path)
+            for sample_dir in SAMPLE_DIRS
+            for path in Path(sample_dir).glob("*.docx")
+        )
+        fixture = str(Path(directory) / "layout_fixture.docx")
+        write_layout_fixture(fixture)
+        paths.append(fixture)
+        if args.synthetic:
+            manifest = generate_corpus(
+                directory, count=args.synthetic, formats=["docx"]
+            )
+            paths += [entry["path"] for entry in manifest]
+
+        rows = check(paths, args.repeat)
+
+    print(
+        f"{'document':<45} {'coverage':>8} {'xml chars':>9} {'p-docx chars':>12} "
+        f"{'xml ms':>7} {'p-docx ms':>9}"
+    )
+    for row in rows:
+        print(
+            f"{Path(row['path']).name:<45} {row['coverage']:>8.1%} "
+            f"{row['xml_chars']:>9} {row['python_docx_chars']:>12} "
+            f"{row['xml_ms']:>7.2f} {row['python_docx_ms']:>9.2f}"
+        )
+        for text in row["missing"]:
+            print(f"    missing: {text[:70]!r}")
+    speedups = [row["python_docx_ms"] / row["xml_ms"] for row in rows]
+    print(f"\nMedian speedup of the xml backend: {statistics.median(speedups):.1f}x")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+    return 0 if all(not row["missing"] for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""Measure recall and latency of EmbeddingStore searches against exact search.
+
+Vectors are taken from a .npy file of real embeddings, or generated around
+random cluster centres, which resembles how resume embeddings group by
+occupation. Queries are held-out vectors of the same distribution. For every
+scan (binary, int8) and shortlist size the report gives recall@k, the share of
+the exact top k that the two-phase search returns, and the latency per query.
+
+Usage:
+    python -m benchmarks.embedding_store --size 200000 --k 10 --shortlist 100 400
+"""
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from resume_analyzer.embedding_store import EmbeddingStore
+
+
+def synthetic_vectors(
+    size: int, dim: int, clusters: int = 50, seed: int = 0
+) -> np.ndarray:
+    """Float32 vectors scattered around random cluster centres."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(clusters, dim))
+    labels = rng.integers(0, clusters, size=size)
+    noise = rng.normal(scale=0.8, size=(size, dim))
+    return (centres[labels] + noise).astype(np.float32)
+
+
+def exact_top_k(vectors: np.ndarray, queries: np.ndarray, k: int) -> List[set]:
+    """Row indices of the ``k`` most cosine-similar vectors, per query."""
+    vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    tops = []
+    for query in queries:
+        scores = vectors @ (query / np.linalg.norm(query))
+        tops.append(set(np.argpartition(-scores, k - 1)[:k].tolist()))
+    return tops
+
+
+def run(
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    k: int,
+    shortlists: Sequence[int],
+) -> Dict:
+    start = time.perf_counter()
+    truth = exact_top_k(vectors, queries, k)
+    exact_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        store = EmbeddingStore(directory, embedding_id="benchmark")
+        store.add([str(i) for i in range(len(vectors))], vectors)
+        for coarse in ("binary", "int8"):
+            for shortlist in shortlists:
+                recalls, samples = [], []
+                for query, expected in zip(queries, truth):
+                    start = time.perf_counter()
+                    found = store.search(query, k, shortlist=shortlist, coarse=coarse)
+                    samples.append(time.perf_counter() - start)
+                    recalls.append(len(expected & {int(i) for i, _ in found}) / k)
+                rows.append(
+                    {
+                        "scan": coarse,
+                        "shortlist": shortlist,
+                        "recall": statistics.mean(recalls),
+                        "ms": statistics.median(samples) * 1000,
+                    }
+                )
+        disk = store.disk_bytes()
+
+    return {
+        "vectors": len(vectors),
+        "dim": vectors.shape[1],
+        "k": k,
+        "exact_ms": exact_ms,
+        "bytes_per_vector": {kind: size / len(vectors) for kind, size in disk.items()},
+        "searches": rows,
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--embeddings", help=".npy file of (n, dim) embeddings")
+    arg_parser.add_argument("--size", type=int, default=100000)
+    arg_parser.add_argument("--dim", type=int, default=384)
+    arg_parser.add_argument("--queries", type=int, default=100)
+    arg_parser.add_argument("--k", type=int, default=10)
+    arg_parser.add_argument(
+        "--shortlist", type=int, nargs="+", default=[100, 400, 1600]
+    )
+    arg_parser.add_argument("--output", help="Also write the report as JSON")
+    args = arg_parser.parse_args()
+
+    if args.embeddings:
+        vectors = np.load(args.embeddings).astype(np.float32)
+    else:
+        vectors = synthetic_vectors(args.size + args.queries, args.dim)
+    vectors, queries = vectors[: -args.queries], vectors[-args.queries :]
+
+    report = run(vectors, queries, args.k, args.shortlist)
+
+    print(f"{report['vectors']} vectors of {report['dim']} dimensions")
+    print(
+        "Bytes per vector: "
+        + ", ".join(
+            f"{kind} {size:g}" for kind, size in report["bytes_per_vector"].items()
+        )
+    )
+    print(f"Exact search: {report['exact_ms']:.2f} ms per query\n")
+    print(f"{'scan':>6} {'shortlist':>9} {'recall@' + str(args.k):>9} {'ms':>8}")
+    for row in report["searches"]:
+        print(
+            f"{row['scan']:>6} {row['shortlist']:>9} {row['recall']:>9.3f} "
+            f"{row['ms']:>8.2f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
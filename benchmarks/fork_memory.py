@@ -0,0 +1,153 @@
+"""Measure shared and private memory of forked scoring workers.
+
+Mirrors the gunicorn deployment: the master builds a ``ResumeProcessor``,
+optionally warms it up and freezes the heap, then forks several workers that
+each score the same resumes. Every worker reports its memory from
+``/proc/self/smaps_rollup`` while all of them are still alive, so the
+proportional set size (PSS) reflects the pages they share.
+
+Usage:
+    python -m benchmarks.fork_memory --workers 4
+    python -m benchmarks.fork_memory --workers 4 --no-preload
+"""
+
+import argparse
+import gc
+import json
+import os
+import signal
+import sys
+import tempfile
+from typing import Dict, List
+
+from benchmarks.corpus import generate_corpus
+
+MIB = 2**20
+
+
+def memory_rollup() -> Dict[str, int]:
+    """Shared, private and proportional memory of this process, in bytes."""
+    values = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                values[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    return {
+        "rss": values["Rss"],
+        "pss": values["Pss"],
+        "shared": values["Shared_Clean"] + values["Shared_Dirty"],
+        "private": values["Private_Clean"] + values["Private_Dirty"],
+    }
+
+
+def run_worker(processor, resume_paths: List[str], jd_path: str, report_fd: int):
+    """Score the resumes, report memory, then wait for the master to finish."""
+    try:
+        for path in resume_paths:
+            processor.process_resume(path, jd_path)
+        report = memory_rollup()
+    except Exception as e:
+        # Always report, or the master would wait for this worker forever
+        report = {"error": repr(e)}
+    os.write(report_fd, (json.dumps(report) + "\n").encode())
+    # Stay alive until every sibling has reported; the master kills us
+    while True:
+        signal.pause()
+
+
+def measure(workers: int, preload: bool, freeze: bool, documents: int) -> Dict:
+    from process import ResumeProcessor
+
+    with tempfile.TemporaryDirectory() as directory:
+        manifest = generate_corpus(
+            directory, count=documents, sizes=["medium"], formats=["pdf"]
+        )
+        jd_path = next(d["path"] for d in manifest if d["kind"] == "job_description")
+        resume_paths = [d["path"] for d in manifest if d["kind"] == "resume"]
+
+        processor = ResumeProcessor()
+        if preload:
+            gc.disable()
+            processor.warm_up()
+            if freeze:
+                gc.freeze()
+            gc.enable()
+        master = memory_rollup()
+
+        read_fd, write_fd = os.pipe()
+        pids = []
+        for _ in range(workers):
+            pid = os.fork()
+            if pid == 0:
+                os.close(read_fd)
+                try:
+                    run_worker(processor, resume_paths, jd_path, write_fd)
+                finally:
+                    os._exit(0)
+            pids.append(pid)
+        os.close(write_fd)
+
+        with os.fdopen(read_fd) as reports:
+            results = [json.loads(reports.readline()) for _ in pids]
+        for pid in pids:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+
+    errors = [result["error"] for result in results if "error" in result]
+    if errors:
+        raise RuntimeError(f"Worker failed: {errors[0]}")
+
+    return {
+        "workers": workers,
+        "preload": preload,
+        "freeze": freeze,
+        "master": master,
+        "per_worker": results,
+        "total_pss": master["pss"] + sum(result["pss"] for result in results),
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--workers", type=int, default=4)
+    arg_parser.add_argument(
+        "--documents", type=int, default=5, help="Resumes scored by every worker"
+    )
+    arg_parser.add_argument(
+        "--no-preload",
+        action="store_true",
+        help="Let every worker load its own models, as without preload_app",
+    )
+    arg_parser.add_argument(
+        "--no-freeze", action="store_true", help="Skip gc.freeze() before forking"
+    )
+    arg_parser.add_argument("--output", help="Also write the report as JSON")
+    args = arg_parser.parse_args()
+
+    report = measure(
+        args.workers, not args.no_preload, not args.no_freeze, args.documents
+    )
+
+    master = report["master"]
+    print(
+        f"master: rss {master['rss'] / MIB:.1f} MiB, "
+        f"private {master['private'] / MIB:.1f} MiB"
+    )
+    print(f"{'worker':>6} {'rss':>9} {'shared':>9} {'private':>9} {'pss':>9}  (MiB)")
+    for i, worker in enumerate(report["per_worker"]):
+        print(
+            f"{i:>6} {worker['rss'] / MIB:>9.1f} {worker['shared'] / MIB:>9.1f} "
+            f"{worker['private'] / MIB:>9.1f} {worker['pss'] / MIB:>9.1f}"
+        )
+    print(f"total PSS of master and workers: {report['total_pss'] / MIB:.1f} MiB")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        sys.exit("This benchmark needs Linux /proc/self/smaps_rollup")
+    main()
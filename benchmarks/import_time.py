@@ -0,0 +1,107 @@
+"""Check that importing the pipeline modules stays fast and lightweight.
+
+Every module is imported in a fresh interpreter, so results do not depend on
+what an earlier import already loaded. A module fails the check when its
+import takes longer than the budget or pulls in one of the heavy
+dependencies that are meant to be imported on first use.
+
+Usage:
+    python -m benchmarks.import_time --budget 1.0
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+MODULES = [
+    "resume_analyzer.document_parsing",
+    "resume_analyzer.preprocessing",
+    "resume_analyzer.extraction",
+    "resume_analyzer.vectorization",
+    "resume_analyzer.scoring",
+    "process",
+    "batch_score",
+]
+
+HEAVY_MODULES = [
+    "torch",
+    "sentence_transformers",
+    "spacy",
+    "gensim",
+    "sklearn",
+    "pdfplumber",
+    "docx",
+    "bs4",
+    "fuzzywuzzy",
+    "rapidfuzz",
+    "pandas",
+]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"seconds": seconds, "heavy": heavy}}))
+"""
+
+
+def measure(module: str, repeat: int = 3) -> Dict:
+    """
+    Import a module in fresh interpreters and report the fastest import.
+
+    Args:
+        module (str): Dotted module name
+        repeat (int): Number of interpreters to start
+
+    Returns:
+        Dict: ``seconds`` of the fastest import and the ``heavy`` modules loaded
+    """
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        runs.append(json.loads(output.splitlines()[-1]))
+    return min(runs, key=lambda run: run["seconds"])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument(
+        "--budget", type=float, default=1.0, help="Import time budget in seconds"
+    )
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("modules", nargs="*", default=MODULES)
+    args = arg_parser.parse_args(argv)
+
+    failures = 0
+    print(f"{'module':<36} {'import (ms)':>12}  heavy dependencies")
+    for module in args.modules:
+        try:
+            result = measure(module, args.repeat)
+        except subprocess.CalledProcessError as e:
+            print(f"{module:<36} {'error':>12}  {e.stderr.strip().splitlines()[-1]}")
+            failures += 1
+            continue
+
+        failed = result["seconds"] > args.budget or result["heavy"]
+        failures += bool(failed)
+        print(
+            f"{module:<36} {result['seconds'] * 1000:>12.1f}  "
+            f"{', '.join(result['heavy']) or '-'}{'  FAIL' if failed else ''}"
+        )
+
+    if failures:
+        print(f"\n{failures} module(s) over the {args.budget:.2f} s budget or eager")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
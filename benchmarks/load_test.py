@@ -0,0 +1,416 @@
+"""Load test the web app with concurrent resume uploads.
+
+Starts the app locally, with Flask's threaded server or with gunicorn, and
+posts multipart uploads to ``/parsing-result`` the way the form in
+``templates/index.html`` does: several ``resumes`` files and one
+``job_description`` file. The documents come from benchmarks.corpus. The
+server runs with the offline stand-ins of ``benchmarks.stand_in_models``
+unless ``--real-models`` is given, so the test runs without downloads and
+measures the web stack, parsing, extraction and scoring rather than SBERT.
+
+Every combination of concurrency (uploads in flight) and batch size
+(resumes per upload) runs for ``--duration`` seconds. For each one the
+report gives throughput, p50/p95/p99 latency, error rate and the peak RSS of
+the server and its workers. Uploads can succeed while some of their
+documents fail analysis; those are counted separately, from the app's
+/metrics. The JSON report also holds the RSS samples over time.
+
+Usage:
+    python -m benchmarks.load_test --concurrency 1 4 16 --batch-size 1 5 20
+    python -m benchmarks.load_test --server gunicorn --workers 4 --duration 60
+    python -m benchmarks.load_test --url http://127.0.0.1:8000  # already running
+"""
+
+import argparse
+import itertools
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from benchmarks.corpus import generate_corpus
+
+MIB = 2**20
+# Documents whose isolated analysis failed, counted by the app
+FAILURE_METRIC = "resume_analyzer_isolation_failures_total"
+
+# (file name, contents)
+Upload = Tuple[str, bytes]
+
+
+def multipart_body(files: Sequence[Tuple[str, str, bytes]]) -> Tuple[bytes, str]:
+    """
+    Encode files as multipart/form-data.
+
+    Args:
+        files: (field name, file name, contents) of every file
+
+    Returns:
+        Tuple of (body, Content-Type header)
+    """
+    boundary = uuid.uuid4().hex
+    parts = []
+    for field, filename, content in files:
+        parts.append(
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n".encode()
+        )
+        parts.append(content)
+        parts.append(b"\r\n")
+    parts.append(f"--{boundary}--\r\n".encode())
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+def post_upload(
+    url: str, resumes: Sequence[Upload], jd: Upload, timeout: float
+) -> Tuple[int, float]:
+    """Post one upload; returns (HTTP status, 0 if there was none; seconds)."""
+    body, content_type = multipart_body(
+        [("resumes", name, content) for name, content in resumes]
+        + [("job_description", jd[0], jd[1])]
+    )
+    request = urllib.request.Request(
+        url, data=body, headers={"Content-Type": content_type}, method="POST"
+    )
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except (urllib.error.URLError, OSError):
+        status = 0
+    return status, time.perf_counter() - start
+
+
+def metric_total(base_url: str, name: str) -> Optional[float]:
+    """Sum of every sample of a metric on the app's /metrics endpoint.
+
+    Under gunicorn this is the count of whichever worker answers.
+    """
+    try:
+        with urllib.request.urlopen(base_url + "/metrics", timeout=10) as response:
+            text = response.read().decode()
+    except (urllib.error.URLError, OSError):
+        return None
+    return sum(
+        float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line.startswith(name) and line[len(name)] in " {"
+    )
+
+
+def process_tree(pid: int) -> List[int]:
+    """A process and all of its descendants, from /proc."""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces but ends with ")"
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    tree, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        tree.append(current)
+        pending.extend(children.get(current, []))
+    return tree
+
+
+def rss_bytes(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+class RssSampler(threading.Thread):
+    """Samples the RSS of a server process tree at a fixed interval."""
+
+    def __init__(self, pid: int, interval: float = 0.5):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.label = ""
+        self.samples: List[Dict] = []
+        self._done = threading.Event()
+        self._start = time.perf_counter()
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            processes = {pid: rss_bytes(pid) for pid in process_tree(self.pid)}
+            self.samples.append(
+                {
+                    "seconds": round(time.perf_counter() - self._start, 2),
+                    "level": self.label,
+                    "total_rss": sum(processes.values()),
+                    "max_process_rss": max(processes.values(), default=0),
+                    "processes": len(processes),
+                }
+            )
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(
+    server: str, port: int, workers: int, stand_in: bool, log_path: str
+) -> subprocess.Popen:
+    """Start the app in the background, logging to ``log_path``."""
+    env = dict(os.environ)
+    if server == "gunicorn":
+        env["RESUME_ANALYZER_BIND"] = f"127.0.0.1:{port}"
+        env["RESUME_ANALYZER_WORKERS"] = str(workers)
+        command = ["gunicorn", "-c", "gunicorn.conf.py", "wsgi:app"]
+    else:
+        command = ["flask", "--app", "app", "run", "--port", str(port)]
+        command += ["--with-threads", "--no-reload"]
+    # The launcher patches the model loaders before the server imports the app
+    launcher = ["benchmarks.stand_in_models"] if stand_in else []
+    command = [sys.executable, "-m", *launcher, *command]
+    with open(log_path, "wb") as log:
+        return subprocess.Popen(command, env=env, stdout=log, stderr=log)
+
+
+def wait_until_ready(
+    base_url: str, process: Optional[subprocess.Popen], timeout: float
+):
+    """Poll /readyz until the app has warmed up its models."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"Server exited with status {process.returncode}")
+        try:
+            with urllib.request.urlopen(base_url + "/readyz", timeout=5):
+                return
+        except urllib.error.HTTPError as e:
+            state = json.loads(e.read() or b"{}")
+            if state.get("status") == "failed":
+                raise RuntimeError(f"Warm-up failed: {state.get('error')}")
+        except (urllib.error.URLError, OSError):
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"Server was not ready within {timeout:g}s")
+
+
+def load_documents(directory: str, count: int) -> Tuple[List[Upload], List[Upload]]:
+    """Generate resumes and job descriptions, returned as (name, bytes)."""
+    manifest = generate_corpus(directory, count=count, sizes=["small", "medium"])
+    documents = {"resume": [], "job_description": []}
+    for entry in manifest:
+        path = Path(entry["path"])
+        documents[entry["kind"]].append((path.name, path.read_bytes()))
+    return documents["resume"], documents["job_description"]
+
+
+def run_level(
+    url: str,
+    resumes: List[Upload],
+    jds: List[Upload],
+    concurrency: int,
+    batch_size: int,
+    duration: float,
+    timeout: float,
+) -> Dict:
+    """Keep ``concurrency`` uploads in flight for ``duration`` seconds."""
+    results: List[Tuple[int, float]] = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client(worker: int):
+        offset = worker * batch_size
+        for n in itertools.count():
+            if time.perf_counter() >= deadline:
+                return
+            start = offset + n * batch_size * concurrency
+            # Unique file names, since the app saves uploads by file name
+            batch = [
+                (f"{worker}-{n}-{i}-{name}", content)
+                for i, (name, content) in enumerate(
+                    resumes[(start + j) % len(resumes)] for j in range(batch_size)
+                )
+            ]
+            jd_name, jd_content = jds[(worker + n) % len(jds)]
+            outcome = post_upload(
+                url, batch, (f"{worker}-{n}-{jd_name}", jd_content), timeout
+            )
+            with lock:
+                results.append(outcome)
+
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(target=client, args=(worker,)) for worker in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = np.array([seconds for status, seconds in results if status == 200])
+    errors = sum(1 for status, _ in results if status != 200)
+    p50, p95, p99 = (
+        np.percentile(latencies, [50, 95, 99]) if len(latencies) else (np.nan,) * 3
+    )
+    return {
+        "concurrency": concurrency,
+        "batch_size": batch_size,
+        "requests": len(results),
+        "throughput": (len(results) - errors) / elapsed,
+        "resumes_per_second": (len(results) - errors) * batch_size / elapsed,
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99),
+        "error_rate": errors / len(results) if results else 0.0,
+    }
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    arg_parser.add_argument("--batch-size", type=int, nargs="+", default=[1, 5])
+    arg_parser.add_argument(
+        "--duration", type=float, default=20, help="Seconds per combination"
+    )
+    arg_parser.add_argument("--server", choices=["flask", "gunicorn"], default="flask")
+    arg_parser.add_argument(
+        "--workers", type=int, default=4, help="gunicorn worker processes"
+    )
+    arg_parser.add_argument(
+        "--url", help="Test an app that is already running instead of starting one"
+    )
+    arg_parser.add_argument(
+        "--real-models",
+        action="store_true",
+        help="Use the installed spaCy and SBERT models instead of the stand-ins",
+    )
+    arg_parser.add_argument(
+        "--timeout", type=float, default=120, help="Seconds before an upload fails"
+    )
+    arg_parser.add_argument(
+        "--startup-timeout",
+        type=float,
+        default=300,
+        help="Seconds to wait for the server to warm up and report ready",
+    )
+    arg_parser.add_argument("--output", help="Also write the report as JSON")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        resumes, jds = load_documents(directory, max(args.batch_size))
+
+        process = sampler = None
+        base_url = args.url
+        if base_url is None:
+            port = free_port()
+            base_url = f"http://127.0.0.1:{port}"
+            log_path = os.path.join(directory, "server.log")
+            process = start_server(
+                args.server, port, args.workers, not args.real_models, log_path
+            )
+        try:
+            try:
+                wait_until_ready(base_url, process, args.startup_timeout)
+            except RuntimeError as e:
+                if process is not None:
+                    sys.stderr.write(Path(log_path).read_text()[-4000:])
+                print(e, file=sys.stderr)
+                return 1
+            if process is not None:
+                sampler = RssSampler(process.pid)
+                sampler.start()
+
+            rows = []
+            for concurrency, batch_size in itertools.product(
+                args.concurrency, args.batch_size
+            ):
+                if sampler is not None:
+                    sampler.label = f"{concurrency}x{batch_size}"
+                failures = metric_total(base_url, FAILURE_METRIC)
+                row = run_level(
+                    base_url + "/parsing-result",
+                    resumes,
+                    jds,
+                    concurrency,
+                    batch_size,
+                    args.duration,
+                    args.timeout,
+                )
+                # Documents that failed inside otherwise successful uploads
+                after = metric_total(base_url, FAILURE_METRIC)
+                row["failed_documents"] = (
+                    int(after - failures)
+                    if failures is not None and after is not None
+                    else None
+                )
+                if sampler is not None:
+                    row["peak_rss"] = max(
+                        (
+                            sample["total_rss"]
+                            for sample in sampler.samples
+                            if sample["level"] == sampler.label
+                        ),
+                        default=0,
+                    )
+                rows.append(row)
+        finally:
+            if sampler is not None:
+                sampler.stop()
+            if process is not None:
+                process.terminate()
+                try:
+                    process.wait(timeout=30)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+
+    print(
+        f"{'conc':>4} {'batch':>5} {'reqs':>5} {'req/s':>7} {'resumes/s':>9} "
+        f"{'p50 s':>7} {'p95 s':>7} {'p99 s':>7} {'errors':>7} {'failed docs':>11} "
+        f"{'peak RSS':>9}"
+    )
+    for row in rows:
+        peak = f"{row['peak_rss'] / MIB:.0f} MiB" if "peak_rss" in row else "-"
+        print(
+            f"{row['concurrency']:>4} {row['batch_size']:>5} {row['requests']:>5} "
+            f"{row['throughput']:>7.2f} {row['resumes_per_second']:>9.2f} "
+            f"{row['p50']:>7.2f} {row['p95']:>7.2f} {row['p99']:>7.2f} "
+            f"{row['error_rate']:>7.1%} {'-' if row['failed_documents'] is None else row['failed_documents']:>11} {peak:>9}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {"levels": rows, "rss": sampler.samples if sampler else []},
+                f,
+                indent=2,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""Compare fp32 and int8 dynamic-quantized SBERT inference on CPU.
+
+Every document is cleaned the way the pipeline cleans it and then encoded
+one at a time, as ``ResumeScorer.compute_similarity`` does. The report gives
+the per-document encode time of both models at each thread count, and how
+much the resume / job description similarity scores drift under int8.
+
+Usage:
+    python -m benchmarks.quantization --threads 1 4 --output quant.json
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from benchmarks.corpus import generate_job_description, generate_resume
+
+SAMPLE_DIRS = {"resume": "data/Resumes", "job_description": "data/JDs"}
+
+
+def load_texts(synthetic: int) -> Tuple[List[str], List[str]]:
+    """
+    Cleaned resume and job description texts to encode.
+
+    Args:
+        synthetic (int): Synthetic resumes to add to the bundled samples; one
+            synthetic job description is added per five resumes
+
+    Returns:
+        Tuple of (resume texts, job description texts)
+    """
+    from resume_analyzer.document_parsing import DocumentParser
+    from resume_analyzer.preprocessing import TextCleaner
+
+    parser = DocumentParser()
+    raw = {"resume": [], "job_description": []}
+    for kind, directory in SAMPLE_DIRS.items():
+        for path in sorted(Path(directory).iterdir()):
+            text = parser.parse(str(path))
+            if text:
+                raw[kind].append(text)
+    sizes = ["small", "medium", "large"]
+    raw["resume"] += [
+        generate_resume(f"quant-{i}", sizes[i % 3]) for i in range(synthetic)
+    ]
+    raw["job_description"] += [
+        generate_job_description(f"quant-{i}", sizes[i % 3])
+        for i in range(max(1, synthetic // 5))
+    ]
+
+    cleaner = TextCleaner()
+    clean = {
+        kind: [" ".join(cleaner.clean_text(text)) for text in texts]
+        for kind, texts in raw.items()
+    }
+    return clean["resume"], clean["job_description"]
+
+
+def encode_timed(
+    vectorizer, texts: Sequence[str], repeat: int
+) -> Tuple[np.ndarray, List[float]]:
+    """Encode texts one at a time; return the embeddings and per-call seconds."""
+    vectorizer.get_word_embeddings(texts[0])  # warm up
+    samples = []
+    embeddings = []
+    for _ in range(repeat):
+        embeddings = []
+        for text in texts:
+            start = time.perf_counter()
+            embeddings.append(vectorizer.get_word_embeddings(text))
+            samples.append(time.perf_counter() - start)
+    return np.vstack(embeddings), samples
+
+
+def similarity_matrix(resumes: np.ndarray, jds: np.ndarray) -> np.ndarray:
+    """Cosine similarity of every resume (rows) to every job description."""
+    resumes = resumes / np.linalg.norm(resumes, axis=1, keepdims=True)
+    jds = jds / np.linalg.norm(jds, axis=1, keepdims=True)
+    return resumes @ jds.T
+
+
+def drift(fp32: np.ndarray, int8: np.ndarray) -> Dict[str, float]:
+    """Differences between the fp32 and int8 similarity matrices."""
+    diff = np.abs(fp32 - int8)
+    same_top = np.argmax(fp32, axis=0) == np.argmax(int8, axis=0)
+    # Rank correlation of the resume ordering per job description
+    fp32_ranks = np.argsort(np.argsort(-fp32, axis=0), axis=0)
+    int8_ranks = np.argsort(np.argsort(-int8, axis=0), axis=0)
+    n = fp32.shape[0]
+    spearman = (
+        1 - 6 * ((fp32_ranks - int8_ranks) ** 2).sum(axis=0) / (n * (n**2 - 1))
+        if n > 1
+        else np.ones(fp32.shape[1])
+    )
+    return {
+        "mean_abs_drift": float(diff.mean()),
+        "max_abs_drift": float(diff.max()),
+        "same_top_resume": float(same_top.mean()),
+        "min_spearman": float(spearman.min()),
+    }
+
+
+def run(threads: Sequence[int], repeat: int, synthetic: int) -> Dict:
+    import torch
+
+    from resume_analyzer.vectorization import TextVectorizer
+
+    resumes, jds = load_texts(synthetic)
+    texts = resumes + jds
+    models = {
+        "fp32": TextVectorizer(quantize=False),
+        "int8": TextVectorizer(quantize=True),
+    }
+
+    timings = []
+    embeddings = {}
+    for n_threads in threads:
+        torch.set_num_threads(n_threads)
+        medians = {}
+        for name, vectorizer in models.items():
+            embeddings[name], samples = encode_timed(vectorizer, texts, repeat)
+            medians[name] = statistics.median(samples) * 1000
+        timings.append(
+            {
+                "threads": n_threads,
+                "fp32_ms": medians["fp32"],
+                "int8_ms": medians["int8"],
+                "speedup": medians["fp32"] / medians["int8"],
+            }
+        )
+
+    similarities = {
+        name: similarity_matrix(vectors[: len(resumes)], vectors[len(resumes) :])
+        for name, vectors in embeddings.items()
+    }
+    return {
+        "documents": {"resumes": len(resumes), "job_descriptions": len(jds)},
+        "timings": timings,
+        "drift": drift(similarities["fp32"], similarities["int8"]),
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=20,
+        help="Synthetic resumes added to the samples in data/",
+    )
+    arg_parser.add_argument("--output", help="Also write the report as JSON")
+    args = arg_parser.parse_args()
+
+    report = run(args.threads, args.repeat, args.synthetic)
+
+    print(
+        f"{report['documents']['resumes']} resumes, "
+        f"{report['documents']['job_descriptions']} job descriptions\n"
+    )
+    print(f"{'threads':>7} {'fp32 (ms)':>10} {'int8 (ms)':>10} {'speedup':>8}")
+    for row in report["timings"]:
+        print(
+            f"{row['threads']:>7} {row['fp32_ms']:>10.2f} "
+            f"{row['int8_ms']:>10.2f} {row['speedup']:>7.2f}x"
+        )
+    d = report["drift"]
+    print(
+        f"\nSimilarity drift: mean {d['mean_abs_drift']:.4f}, "
+        f"max {d['max_abs_drift']:.4f}; same top resume for "
+        f"{d['same_top_resume']:.0%} of job descriptions; "
+        f"min Spearman {d['min_spearman']:.3f}"
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Measure the memory held per stored score result.
+
+Resumes from the synthetic corpus are run through the real pipeline. The
+retained size of the resulting ``ScoreResult`` records is compared with the
+score dicts the app used to keep, which also embedded the rendered resume
+and job description NER HTML. Objects shared between results, such as the
+job description HTML or interned skill names, are counted once.
+
+Usage:
+    python -m benchmarks.result_memory --count 200
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+from typing import Any, Iterable, Set
+
+from benchmarks.corpus import generate_corpus
+
+
+def retained_size(objects: Iterable[Any]) -> int:
+    """Total size of the objects and everything they reference, shared objects once."""
+    seen: Set[int] = set()
+    stack = list(objects)
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__slots__"):
+            stack.extend(
+                getattr(obj, name) for name in obj.__slots__ if hasattr(obj, name)
+            )
+        elif hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+    return total
+
+
+def legacy_scores(result, resume, job_description) -> dict:
+    """The score dict ``ResumeScorer`` returned before ``ScoreResult``."""
+    scores = result.to_dict()
+    scores["resume_ner"] = resume.get("ner", "")
+    scores["job_ner"] = job_description.get("ner", "")
+    return scores
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--count", type=int, default=200)
+    arg_parser.add_argument("--size", default="medium")
+    arg_parser.add_argument("--output", help="Also write the report as JSON")
+    args = arg_parser.parse_args()
+
+    from process import ResumeProcessor
+
+    processor = ResumeProcessor()
+    with tempfile.TemporaryDirectory() as directory:
+        manifest = generate_corpus(
+            directory, count=args.count, sizes=[args.size], formats=["pdf"]
+        )
+        jd_path = next(
+            doc["path"] for doc in manifest if doc["kind"] == "job_description"
+        )
+        job_description = processor.analyze_job_description(jd_path)
+        resumes = [
+            processor.analyze_resume(doc["path"])
+            for doc in manifest
+            if doc["kind"] == "resume"
+        ]
+    resumes = [resume for resume in resumes if resume]
+    results = processor.scorer.score_batch(resumes, job_description)
+    legacy = [
+        legacy_scores(result, resume, job_description)
+        for result, resume in zip(results, resumes)
+    ]
+    gc.collect()
+
+    report = {
+        "results": len(results),
+        "legacy_bytes_per_result": retained_size(legacy) / len(legacy),
+        "compact_bytes_per_result": retained_size(results) / len(results),
+        "compact_json_bytes_per_result": sum(len(r.to_json()) for r in results)
+        / len(results),
+    }
+    report["reduction"] = (
+        report["legacy_bytes_per_result"] / report["compact_bytes_per_result"]
+    )
+
+    print(f"{report['results']} results")
+    print(f"score dict with NER HTML: {report['legacy_bytes_per_result']:>10.0f} B")
+    print(f"ScoreResult:              {report['compact_bytes_per_result']:>10.0f} B")
+    print(
+        f"ScoreResult as JSON:      {report['compact_json_bytes_per_result']:>10.0f} B"
+    )
+    print(f"reduction:                {report['reduction']:>10.1f}x")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""Stage-by-stage micro-benchmarks for the resume processing pipeline.
+
+Every stage is timed separately and end to end on a synthetic corpus, in a
+cold variant (model construction plus the first call) and a warm variant
+(repeated calls on already loaded models). Results are written as JSON so
+that two runs can be compared with ``python -m benchmarks.compare``.
+
+Usage:
+    python -m benchmarks.run --output bench.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+from benchmarks.corpus import FORMATS, SIZES, generate_corpus
+
+EXTRACT_STAGES = [
+    "extract_contact_info",
+    "extract_education",
+    "extract_skills",
+    "extract_experience",
+    "extract_job_titles",
+]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summary statistics of a list of durations, in milliseconds."""
+    samples_ms = sorted(sample * 1000 for sample in samples)
+    p95_index = min(len(samples_ms) - 1, int(round(0.95 * (len(samples_ms) - 1))))
+    return {
+        "n": len(samples_ms),
+        "mean_ms": statistics.fmean(samples_ms),
+        "median_ms": statistics.median(samples_ms),
+        "p95_ms": samples_ms[p95_index],
+        "min_ms": samples_ms[0],
+        "max_ms": samples_ms[-1],
+    }
+
+
+def time_call(func: Callable, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+class Benchmark:
+    """Collects timings keyed by stage, variant, document size and format."""
+
+    def __init__(self, repeat: int = 3):
+        self.repeat = repeat
+        self.results: List[Dict[str, Any]] = []
+
+    def record(self, stage: str, variant: str, size: str, fmt: str, samples):
+        entry = {"stage": stage, "variant": variant, "size": size, "format": fmt}
+        entry.update(summarize(samples))
+        self.results.append(entry)
+        print(
+            f"{stage:<22} {variant:<5} {size:<7} {fmt:<5} "
+            f"median {entry['median_ms']:10.2f} ms"
+        )
+
+    def warm(self, stage, size, fmt, func, inputs):
+        """Time ``func`` on every input, ``repeat`` times, after one warm-up call."""
+        func(inputs[0])
+        samples = [time_call(func, item) for _ in range(self.repeat) for item in inputs]
+        self.record(stage, "warm", size, fmt, samples)
+
+    def cold(self, stage, size, fmt, factory, call, item):
+        """Time constructing a component from scratch plus its first call."""
+        start = time.perf_counter()
+        component = factory()
+        call(component, item)
+        self.record(stage, "cold", size, fmt, [time.perf_counter() - start])
+
+
+def run(corpus: List[Dict[str, str]], repeat: int, cold: bool) -> List[Dict]:
+    from process import ResumeProcessor
+    from resume_analyzer.document_parsing import DocumentParser
+    from resume_analyzer.extraction import InformationExtractor
+    from resume_analyzer.preprocessing import TextCleaner
+    from resume_analyzer.scoring import ResumeScorer
+    from resume_analyzer.vectorization import TextVectorizer
+
+    bench = Benchmark(repeat)
+
+    if cold:
+        first = next(doc for doc in corpus if doc["kind"] == "resume")
+        text = DocumentParser().parse(first["path"])
+        size, fmt = first["size"], first["format"]
+        bench.cold("clean_text", size, fmt, TextCleaner, TextCleaner.clean_text, text)
+        bench.cold(
+            "extract_skills",
+            size,
+            fmt,
+            InformationExtractor,
+            InformationExtractor.extract_skills,
+            text,
+        )
+        bench.cold(
+            "encode",
+            size,
+            fmt,
+            TextVectorizer,
+            TextVectorizer.get_document_embedding,
+            text,
+        )
+        jd = next(
+            doc["path"]
+            for doc in corpus
+            if doc["kind"] == "job_description"
+            and doc["size"] == size
+            and doc["format"] == fmt
+        )
+
+        # Extracted with models of their own, so the scorer still loads its own
+        preparer = ResumeProcessor()
+        resume = preparer.extractor.extract_resume(text)
+        preparer._clean(resume, text)
+        jd_text = preparer.parser.parse(jd)
+        job_description = preparer.extractor.extract_job_description(jd_text)
+        preparer._clean(job_description, jd_text)
+
+        def score_first(scorer, data):
+            scorer.nlp  # degree similarity model, otherwise loaded on demand
+            scorer.score_resume(data)
+
+        bench.cold(
+            "score_resume",
+            size,
+            fmt,
+            ResumeScorer,
+            score_first,
+            {"resume": resume, "job_description": job_description},
+        )
+        bench.cold(
+            "end_to_end",
+            size,
+            fmt,
+            ResumeProcessor,
+            lambda p, path: p.process_resume(path, jd),
+            first["path"],
+        )
+
+    processor = ResumeProcessor()
+    parser = processor.parser
+    extractor = processor.extractor
+    cleaner = processor.cleaner
+    scorer = processor.scorer
+
+    for size in sorted({doc["size"] for doc in corpus}, key=list(SIZES).index):
+        for fmt in sorted({doc["format"] for doc in corpus}):
+            docs = [d for d in corpus if d["size"] == size and d["format"] == fmt]
+            resume_paths = [d["path"] for d in docs if d["kind"] == "resume"]
+            jd_path = next(d["path"] for d in docs if d["kind"] == "job_description")
+            if not resume_paths:
+                continue
+
+            bench.warm("parse", size, fmt, parser.parse, resume_paths)
+
+            texts = [parser.parse(path) for path in resume_paths]
+            jd_text = parser.parse(jd_path)
+
+            bench.warm("clean_text", size, fmt, cleaner.clean_text, texts)
+            for stage in EXTRACT_STAGES:
+                bench.warm(stage, size, fmt, getattr(extractor, stage), texts)
+
+            cleaned = [" ".join(cleaner.clean_text(text)) for text in texts]
+            bench.warm(
+                "encode", size, fmt, scorer.vectorizer.get_document_embedding, cleaned
+            )
+
+            job_description = extractor.extract_job_description(jd_text)
+            processor._clean(job_description, jd_text)
+            resumes = []
+            for text in texts:
+                resume = extractor.extract_resume(text)
+                processor._clean(resume, text)
+                resumes.append(resume)
+            bench.warm(
+                "section_similarity",
+                size,
+                fmt,
+                lambda resume: scorer.section_similarities([resume], job_description),
+                resumes,
+            )
+            bench.warm(
+                "score_resume",
+                size,
+                fmt,
+                scorer.score_resume,
+                [{"resume": r, "job_description": job_description} for r in resumes],
+            )
+
+            bench.warm(
+                "end_to_end",
+                size,
+                fmt,
+                lambda path: processor.process_resume(path, jd_path),
+                resume_paths,
+            )
+
+    return bench.results
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--output", default="bench_output.json")
+    arg_parser.add_argument("--corpus", help="Existing corpus directory to reuse")
+    arg_parser.add_argument("--count", type=int, default=3)
+    arg_parser.add_argument("--sizes", nargs="+", default=list(SIZES), choices=SIZES)
+    arg_parser.add_argument("--formats", nargs="+", default=FORMATS, choices=FORMATS)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument(
+        "--no-cold", action="store_true", help="Skip the cold model variants"
+    )
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.corpus:
+            with open(f"{args.corpus}/manifest.json") as f:
+                corpus = [
+                    doc
+                    for doc in json.load(f)
+                    if doc["size"] in args.sizes and doc["format"] in args.formats
+                ]
+        else:
+            corpus = generate_corpus(
+                tmp, args.count, args.sizes, args.formats, args.seed
+            )
+
+        results = run(corpus, args.repeat, cold=not args.no_cold)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "revision": _git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "count": args.count,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
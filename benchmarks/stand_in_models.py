@@ -0,0 +1,80 @@
+"""Run a command with offline stand-ins for the spaCy and SBERT models.
+
+The stand-ins need no download: a blank English spaCy pipeline, in which the
+entity ruler still finds skills, titles and degrees, and ``HashingEncoder``
+for SBERT. They are patched into the pipeline's model loaders in this
+process, and then the given module runs as ``python -m`` would run it, so a
+server started this way and the workers it forks all use them. Scores are
+only meaningful relative to each other; this is for load tests, not for
+ranking candidates.
+
+Usage:
+    python -m benchmarks.stand_in_models flask --app app run --port 5000
+    python -m benchmarks.stand_in_models gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import re
+import runpy
+import sys
+import zlib
+from typing import Iterable, Union
+
+import numpy as np
+
+# Identifies stand-in embeddings, e.g. in the job description cache, so they
+# are never mixed with SBERT embeddings
+EMBEDDING_ID = "stand-in"
+
+
+class HashingEncoder:
+    """Stand-in for a sentence-transformer that runs offline with numpy only.
+
+    Texts are embedded as feature-hashed, signed bags of words and normalized,
+    so texts sharing words get similar vectors. It has the ``encode``
+    signature the pipeline uses, but none of SBERT's semantics or cost.
+    """
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+
+    def encode(self, sentences: Union[str, Iterable[str]], batch_size: int = 32, **_):
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        embeddings = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in zip(embeddings, texts):
+            for word in re.findall(r"\w+", text.lower()):
+                digest = zlib.crc32(word.encode("utf-8"))
+                row[digest % self.dim] += 1.0 if digest >> 31 else -1.0
+            norm = np.linalg.norm(row)
+            if norm:
+                row /= norm
+        return embeddings[0] if single else embeddings
+
+
+def load_blank_spacy(name: str = ""):
+    """A blank English spaCy pipeline, whatever model ``name`` asks for."""
+    import spacy
+
+    return spacy.blank("en")
+
+
+def load_hashing_encoder(*args, **kwargs) -> HashingEncoder:
+    return HashingEncoder()
+
+
+def install():
+    """Replace the model loaders of every pipeline module with the stand-ins."""
+    from resume_analyzer import extraction, preprocessing, scoring, vectorization
+
+    for module in (extraction, preprocessing, scoring):
+        module.load_spacy = load_blank_spacy
+    vectorization.load_sentence_transformer = load_hashing_encoder
+    vectorization.TextVectorizer.embedding_id = property(lambda self: EMBEDDING_ID)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    install()
+    sys.argv = sys.argv[1:]
+    runpy.run_module(sys.argv[0], run_name="__main__", alter_sys=True)
@@ -0,0 +1,46 @@
+"""Gunicorn settings for serving ``wsgi:app``.
+
+The application, and with it every model, is loaded once in the master
+(``preload_app``) and shared with the workers through fork. Worker memory
+stays shared only as long as its pages are not written to, so the garbage
+collector is kept away from the objects loaded before the fork.
+
+Every worker keeps its own metrics, so the workers share their counters and
+histograms through a directory, and /metrics reports the totals of the whole
+server whichever worker answers the scrape.
+"""
+
+import gc
+import os
+import tempfile
+
+from resume_analyzer import metrics
+
+bind = os.environ.get("RESUME_ANALYZER_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("RESUME_ANALYZER_WORKERS", "4"))
+preload_app = True
+# Scoring a batch of resumes can take a while
+timeout = int(os.environ.get("RESUME_ANALYZER_TIMEOUT", "300"))
+metrics_dir = os.environ.setdefault(
+    metrics.MULTIPROCESS_DIR_ENV,
+    os.path.join(tempfile.gettempdir(), "resume-analyzer-metrics"),
+)
+
+
+def on_starting(server):
+    os.makedirs(metrics_dir, exist_ok=True)
+    metrics.clear_multiprocess(metrics_dir)
+
+
+def pre_fork(server, worker):
+    # Move everything allocated so far into the permanent generation. The
+    # collector then never traverses (and so never writes the GC headers
+    # of) the model objects, which keeps their pages shared with the master.
+    gc.freeze()
+    # What the master recorded while warming up is counted once, from its own
+    # snapshot, rather than by every worker that inherits it
+    metrics.write_snapshot(metrics_dir)
+
+
+def post_fork(server, worker):
+    metrics.enable_multiprocess(metrics_dir)
@@ -1,47 +1,660 @@
+from resume_analyzer.dedup import DuplicateIndex
 from resume_analyzer.document_parsing import DocumentParser
+from resume_analyzer.isolation import Budget, run_isolated
+from resume_analyzer.jd_cache import JobDescriptionCache, content_hash
+from resume_analyzer.pipeline import Pipeline, Stage
 from resume_analyzer.extraction import (
     InformationExtractor,
     extract_resume_and_job_description,
 )
 from resume_analyzer.preprocessing import TextCleaner
+from resume_analyzer.results import Contact, HtmlStore, ScoreResult
+from resume_analyzer.sections import split_sections
 from resume_analyzer.vectorization import TextVectorizer
 from resume_analyzer.scoring import ResumeScorer
+from resume_analyzer.search import CandidateIndex
+from resume_analyzer import metrics
+from resume_analyzer.profiling import PipelineProfiler
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import replace
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+import argparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Short document that exercises every stage, used to warm up the models
+WARM_UP_TEXT = """Jane Doe
+jane.doe@example.com | 555-123-4567 | Denver, CO
+
+Summary
+Software engineer with 5 years of experience.
+
+Experience
+Senior Software Engineer, ACME Corp, 2019 - Present
+Built data pipelines in Python and SQL.
+
+Education
+Bachelor of Science in Computer Science
+
+Skills
+Python, SQL, Machine Learning
+"""
+
+# Bundled samples parsed during warm-up, one per supported format, so the
+# parsers are exercised too; WARM_UP_TEXT is used if none of them exist
+WARM_UP_DOCUMENTS = [
+    str(Path(__file__).parent / "data" / "Resumes" / name)
+    for name in ("web_developer_resume_sample.pdf", "web_developer_resume_sample.docx")
+]
 
 
 class ResumeProcessor:
-    def __init__(self):
+    def __init__(
+        self,
+        index: Optional[CandidateIndex] = None,
+        weights: Optional[Dict[str, float]] = None,
+        ner_store: Optional[HtmlStore] = None,
+        dedup_threshold: Optional[float] = None,
+        cascade_fraction: Optional[float] = None,
+        cascade_threshold: Optional[float] = None,
+        budget: Optional[Budget] = None,
+        fuzzy_cutoff: Optional[float] = None,
+        jd_cache: Optional[JobDescriptionCache] = None,
+    ):
         self.parser = DocumentParser()
         self.extractor = InformationExtractor()
         self.cleaner = TextCleaner()
-        self.scorer = ResumeScorer()
+        self._scorer: Optional[ResumeScorer] = None
+        # Optional candidate index that processed resumes are added to, keyed
+        # by ``document_id`` so that re-uploads and renamed files replace
+        # their earlier entry
+        self.index = index
+        self.weights = weights
+        # Optional store that the NER HTML of processed documents is put in,
+        # keyed by ``document_id`` so that a later upload with the same file
+        # name does not replace it; score results never carry it
+        self.ner_store = ner_store
+        # Resumes in a batch whose cleaned text is at least this similar to
+        # an earlier one reuse its scores, e.g. ``dedup.DEFAULT_THRESHOLD``;
+        # None scores every resume
+        self.dedup_threshold = dedup_threshold
+        # Cascade settings of the scorer; see ResumeScorer. The fraction
+        # applies to each chunk scored together
+        self.cascade_fraction = cascade_fraction
+        self.cascade_threshold = cascade_threshold
+        # Minimum rapidfuzz ratio of fuzzy skill and title matches; None
+        # matches exactly
+        self.fuzzy_cutoff = fuzzy_cutoff
+        # Resource budget of every document analyzed in a batch; each one is
+        # then analyzed in its own forked process, see isolation.run_isolated
+        self.budget = budget
+        # Optional cache of analyzed and embedded job descriptions, keyed by
+        # file contents, used by prepare_job_description
+        self.jd_cache = jd_cache
+
+    @property
+    def scorer(self) -> ResumeScorer:
+        # Loaded on first use, so processes that only analyze documents
+        # never load the sentence transformer
+        if self._scorer is None:
+            self._scorer = ResumeScorer(
+                weights=self.weights,
+                cascade_fraction=self.cascade_fraction,
+                cascade_threshold=self.cascade_threshold,
+                fuzzy_cutoff=self.fuzzy_cutoff,
+            )
+        return self._scorer
+
+    def warm_up(self, documents: Optional[Iterable[str]] = None):
+        """Load every model and run representative documents through all stages.
+
+        Documents are parsed, extracted, cleaned, deduplicated and scored
+        against the first one as a job description, which also embeds it and
+        runs SBERT's first forward pass. Run before forking worker processes
+        so the models are loaded once and shared copy-on-write, and so no
+        request pays for lazy loading.
+
+        Args:
+            documents (Iterable[str]): Resume files to warm up with; defaults
+                to ``WARM_UP_DOCUMENTS``
+        """
+        with self._stage("warm_up"):
+            self.load_models()
+            texts = [
+                self.parser.parse(path)
+                for path in (WARM_UP_DOCUMENTS if documents is None else documents)
+                if Path(path).exists()
+            ]
+            texts = [text for text in texts if text] or [WARM_UP_TEXT]
+
+            resumes = [self.analyze_resume_text(text) for text in texts]
+            job_description = self.extractor.extract_job_description(texts[0])
+            self._clean(job_description, texts[0])
+            job_description["text"] = texts[0]
+
+            self.scorer.embed_job_description(job_description)
+            if self.dedup_threshold:
+                duplicates = DuplicateIndex(self.dedup_threshold)
+                for i, resume in enumerate(resumes):
+                    duplicates.find_or_add(i, resume["full_text"])
+            self.scorer.score_batch(resumes, job_description)
+
+    def load_models(self):
+        """Load every model of the pipeline without processing a document.
+
+        ``warm_up`` starts with this; afterwards no stage loads a model, so
+        processes forked from this one never load their own copy.
+        """
+        self.load_analysis_models()
+        self.scorer.nlp  # degree similarity model, otherwise loaded on demand
+        self.scorer.vectorizer.model
+
+    def load_analysis_models(self):
+        """Load the spaCy pipelines that extraction and cleaning use.
+
+        With a budget every document is analyzed in a forked child, which
+        would otherwise load the pipelines itself and lose them on exit. Loaded
+        once here, they are inherited by every child instead.
+        """
+        self.extractor.nlp
+        self.cleaner.nlp
+        self.cleaner.tokenizer
+
+    @contextmanager
+    def _stage(self, name: str, profiler: Optional[PipelineProfiler] = None):
+        """Record a pipeline stage in the metrics and, if given, the profiler."""
+        with ExitStack() as stack:
+            stack.enter_context(metrics.stage(name))
+            if profiler is not None:
+                stack.enter_context(profiler.stage(name))
+            yield
+
+    def _clean(self, document: Dict, text: str):
+        """Attach the cleaned full text and cleaned sections to ``document``.
+
+        Sections are split from the raw text, since cleaning removes the line
+        breaks headings are recognized by. Each section is cleaned once and the
+        full text is the concatenation of the cleaned sections.
+        """
+        cleaned = {
+            name: self.cleaner.clean_text(section)
+            for name, section in split_sections(text).items()
+        }
+        document["full_text"] = [
+            token for tokens in cleaned.values() for token in tokens
+        ]
+        document["sections"] = {
+            name: " ".join(tokens) for name, tokens in cleaned.items() if tokens
+        }
+
+    def _store_ner(self, path: str, document: Dict, key: Optional[str] = None):
+        """Put a document's NER HTML in the store under its ``document_id``."""
+        if self.ner_store is not None and document.get("ner"):
+            self.ner_store.put(key or document_id(path), document["ner"][0])
 
-    def process_resume(self, resume_path, jd_path):
+    def process_resume(
+        self, resume_path, jd_path, profiler: Optional[PipelineProfiler] = None
+    ):
         # Step 1: Parse the resume and job description
-        resume_text = self.parser.parse(resume_path)
-        jd_text = self.parser.parse(jd_path)
+        with self._stage("parse", profiler):
+            resume_text = self.parser.parse(resume_path)
+            jd_text = self.parser.parse(jd_path)
 
-        extracted_data = extract_resume_and_job_description(
-            resume_text,
-            jd_text,
+        with self._stage("extract", profiler):
+            extracted_data = extract_resume_and_job_description(
+                resume_text,
+                jd_text,
+                extractor=self.extractor,
+            )
+
+        with self._stage("clean", profiler):
+            self._clean(extracted_data["resume"], resume_text)
+            self._clean(extracted_data["job_description"], jd_text)
+        self._store_ner(resume_path, extracted_data["resume"])
+        self._store_ner(jd_path, extracted_data["job_description"])
+
+        # Step 4: Score the resume against the job description
+        with self._stage("score", profiler):
+            scores = self.scorer.score_resume(extracted_data)
+
+        return scores
+
+    def analyze_job_description(
+        self, jd_path: str, profiler: Optional[PipelineProfiler] = None
+    ) -> Optional[Dict]:
+        """Parse, extract and clean a job description."""
+        with self._stage("parse", profiler):
+            jd_text = self.parser.parse(jd_path)
+        if not jd_text:
+            return None
+
+        with self._stage("extract", profiler):
+            job_description = self.extractor.extract_job_description(jd_text)
+        with self._stage("clean", profiler):
+            self._clean(job_description, jd_text)
+        job_description["text"] = jd_text
+        return job_description
+
+    def analyze_resume(
+        self, resume_path: str, profiler: Optional[PipelineProfiler] = None
+    ) -> Optional[Dict]:
+        """Parse, extract and clean a resume."""
+        with self._stage("parse", profiler):
+            resume_text = self.parser.parse(resume_path)
+        if not resume_text:
+            return None
+        return self.analyze_resume_text(resume_text, profiler)
+
+    def analyze_resume_text(
+        self, resume_text: str, profiler: Optional[PipelineProfiler] = None
+    ) -> Dict:
+        """Extract and clean the parsed text of a resume."""
+        with self._stage("extract", profiler):
+            resume = self.extractor.extract_resume(resume_text)
+        with self._stage("clean", profiler):
+            self._clean(resume, resume_text)
+        return resume
+
+    def prepare_job_description(self, jd_path: str) -> Optional[Dict]:
+        """Analyze a job description for ``iter_batch`` and store its NER HTML.
+
+        The job description is analyzed in isolation if the processor has a
+        budget, and embedded once, so that every chunk ``iter_batch`` scores
+        reuses its embeddings. With a ``jd_cache``, a job description with the
+        same file contents as a cached one is taken from the cache without
+        being parsed, extracted, cleaned or embedded again. Returns None if it
+        cannot be analyzed.
+        """
+        key = None
+        if self.jd_cache is not None:
+            try:
+                key = content_hash(jd_path)
+            except OSError as e:
+                logger.error(f"Error reading job description {jd_path}: {e}")
+                return None
+            job_description = self.jd_cache.get(key)
+            if job_description is not None:
+                self._store_ner(jd_path, job_description, key)
+                return job_description
+
+        job_description = _analyze_safely(self, self.analyze_job_description, jd_path)
+        if not job_description:
+            return None
+        self._store_ner(jd_path, job_description, key)
+
+        try:
+            with self._stage("embed_job_description"):
+                self.scorer.embed_job_description(job_description)
+        except Exception as e:
+            # Scoring embeds the sections itself if this failed
+            logger.warning(f"Could not embed job description {jd_path}: {e}")
+        if key is not None:
+            self.jd_cache.put(key, job_description)
+        return job_description
+
+    def process_batch(
+        self, resume_paths: List[str], jd_path: str
+    ) -> Dict[str, ScoreResult]:
+        """Score many resumes against one job description.
+
+        The job description is parsed, extracted and cleaned once, and
+        skill matching runs over the whole batch in a single vectorized pass.
+        Resumes that cannot be parsed, or that exceed the processor's budget,
+        are left out of the result.
+        """
+        job_description = self.prepare_job_description(jd_path)
+        if not job_description:
+            return {}
+
+        return {
+            resume_path: scores
+            for resume_path, scores in self.iter_batch(
+                resume_paths, job_description, batch_size=max(1, len(resume_paths))
+            )
+            if scores is not None
+        }
+
+    def iter_batch(
+        self,
+        resume_paths: Iterable[str],
+        job_description: Dict,
+        workers: int = 1,
+        batch_size: int = 64,
+    ) -> Iterator[Tuple[str, Optional[ScoreResult]]]:
+        """Score resumes against an analyzed job description as they are ready.
+
+        Resumes are analyzed in chunks of ``batch_size``, in ``workers``
+        processes when more than one is requested, and each chunk is scored
+        with a single ``score_batch`` call. While a chunk is being scored the
+        workers already analyze the next one. Resumes that cannot be analyzed,
+        or that exceed the processor's budget, are yielded with ``None``
+        instead of scores.
+
+        Near-duplicate resumes, anywhere in the batch, are scored once: the
+        first one is scored and the others get a copy of its scores with
+        their own contact details and ``duplicate_of`` set to its path.
+        """
+        duplicates = (
+            DuplicateIndex(self.dedup_threshold) if self.dedup_threshold else None
         )
+        # Scores of the resumes later duplicates may copy
+        scored: Dict[str, ScoreResult] = {}
+
+        with ExitStack() as stack:
+            pool = None
+            if workers > 1:
+                pool = stack.enter_context(
+                    ProcessPoolExecutor(
+                        workers,
+                        initializer=_init_analysis_worker,
+                        initargs=(self.budget,),
+                    )
+                )
 
-        extracted_data["resume"]["full_text"] = self.cleaner.clean_text(resume_text)
-        extracted_data["job_description"]["full_text"] = self.cleaner.clean_text(
-            jd_text
+            pending: Deque = deque()
+            for chunk in _chunked(resume_paths, batch_size):
+                metrics.QUEUE_DEPTH.inc(len(chunk))
+                futures = (
+                    [pool.submit(_analyze_in_worker, path) for path in chunk]
+                    if pool is not None
+                    else None
+                )
+                pending.append((chunk, futures))
+                # Keep one chunk in flight in the workers while scoring
+                if len(pending) > (1 if pool is not None else 0):
+                    yield from self._score_chunk(
+                        *pending.popleft(), job_description, duplicates, scored
+                    )
+
+            while pending:
+                yield from self._score_chunk(
+                    *pending.popleft(), job_description, duplicates, scored
+                )
+
+    def build_pipeline(
+        self,
+        job_description: Dict,
+        parse_workers: int = 2,
+        extract_workers: int = 2,
+        batch_size: int = 32,
+        queue_size: int = 64,
+    ) -> Pipeline:
+        """Pipeline that scores resumes with every stage in its own pool.
+
+        Parsing (pdfplumber) and extraction and cleaning (spaCy) run in
+        process pools of their own size, and scoring (SBERT) runs in a single
+        thread on batches of up to ``batch_size`` resumes, so the stages of
+        different resumes overlap. Stages are connected by queues of
+        ``queue_size`` resumes: when scoring falls behind, extraction and then
+        parsing wait instead of piling up analyzed resumes in memory. Compared
+        to ``iter_batch``, every stage can be sized to its own cost, which
+        ``Pipeline.report`` helps with after a run.
+
+        Resumes are deduplicated and added to the index and NER store as in
+        ``iter_batch``. Run it with ``(path, path)`` items; it yields
+        ``(path, scores)`` in completion order, with None for resumes that
+        could not be analyzed.
+        """
+        duplicates = (
+            DuplicateIndex(self.dedup_threshold) if self.dedup_threshold else None
         )
+        scored: Dict[str, ScoreResult] = {}
 
-        # Step 4: Score the resume against the job description
-        scores = self.scorer.score_resume(extracted_data)
+        def score(paths: List[str], resumes: List[Dict]) -> List:
+            scores = self._score_analyzed(
+                paths, resumes, job_description, duplicates, scored
+            )
+            return [scores.get(path) for path in paths]
+
+        return Pipeline(
+            [
+                Stage(
+                    "parse",
+                    _parse_in_worker,
+                    kind="process",
+                    workers=parse_workers,
+                    initializer=_init_analysis_worker,
+                    initargs=(self.budget, False),
+                ),
+                Stage(
+                    "extract",
+                    _extract_in_worker,
+                    kind="process",
+                    workers=extract_workers,
+                    initializer=_init_analysis_worker,
+                    initargs=(self.budget,),
+                ),
+                Stage("score", score, kind="batch", batch_size=batch_size),
+            ],
+            queue_size=queue_size,
+        )
+
+    def _score_chunk(
+        self,
+        chunk: List[str],
+        futures: Optional[List[Future]],
+        job_description: Dict,
+        duplicates: Optional[DuplicateIndex] = None,
+        scored: Optional[Dict[str, ScoreResult]] = None,
+    ) -> Iterator[Tuple[str, Optional[ScoreResult]]]:
+        if scored is None:
+            scored = {}
+        try:
+            if futures is None:
+                analyzed = [
+                    _analyze_safely(self, self.analyze_resume, path) for path in chunk
+                ]
+            else:
+                analyzed = [future.result() for future in futures]
+        finally:
+            metrics.QUEUE_DEPTH.dec(len(chunk))
+
+        paths = [path for path, resume in zip(chunk, analyzed) if resume is not None]
+        resumes = [resume for resume in analyzed if resume is not None]
+        scores = self._score_analyzed(
+            paths, resumes, job_description, duplicates, scored
+        )
+        for path in chunk:
+            yield path, scores.get(path)
 
+    def _score_analyzed(
+        self,
+        paths: List[str],
+        resumes: List[Dict],
+        job_description: Dict,
+        duplicates: Optional[DuplicateIndex],
+        scored: Dict[str, ScoreResult],
+    ) -> Dict[str, ScoreResult]:
+        """Index, deduplicate and score analyzed resumes, keyed by path."""
+        ids = [document_id(path) for path in paths]
+        if self.index is not None:
+            self.index.add_many(
+                (doc_id, {**resume, "file_name": Path(path).name})
+                for doc_id, path, resume in zip(ids, paths, resumes)
+            )
+        for doc_id, path, resume in zip(ids, paths, resumes):
+            self._store_ner(path, resume, doc_id)
+
+        duplicate_of: Dict[str, str] = {}
+        if duplicates is not None:
+            with self._stage("dedup"):
+                for path, resume in zip(paths, resumes):
+                    representative = duplicates.find_or_add(
+                        path, resume.get("full_text") or []
+                    )
+                    if representative is not None:
+                        duplicate_of[path] = representative
+            metrics.DUPLICATES.inc(len(duplicate_of))
+
+        to_score = [
+            (path, resume)
+            for path, resume in zip(paths, resumes)
+            if path not in duplicate_of
+        ]
+        with self._stage("score"):
+            scores = dict(
+                zip(
+                    [path for path, _ in to_score],
+                    self.scorer.score_batch(
+                        [resume for _, resume in to_score], job_description
+                    ),
+                )
+            )
+        if duplicates is not None:
+            scored.update(scores)
+
+        for path, resume in zip(paths, resumes):
+            if path in duplicate_of:
+                # The representative was scored in this or an earlier chunk
+                scores[path] = replace(
+                    scored[duplicate_of[path]],
+                    contact=Contact.from_dict(resume.get("contact")),
+                    duplicate_of=duplicate_of[path],
+                )
         return scores
 
+    def process_shortlist(
+        self, jd_path: str, min_skills: int = 1, limit: Optional[int] = None
+    ) -> Dict[str, ScoreResult]:
+        """Score indexed resumes that share at least ``min_skills`` JD skills.
+
+        Resumes come from the candidate index, so none of them is parsed or
+        extracted again; only the job description goes through the pipeline.
+        Scores are keyed by index ID; the stored resume has the file name it
+        was indexed under in ``file_name``.
+        """
+        if self.index is None:
+            raise ValueError("process_shortlist requires a candidate index")
+
+        job_description = self.prepare_job_description(jd_path)
+        if not job_description:
+            return {}
+
+        resumes = self.index.get_many(
+            self.index.shortlist(job_description, min_skills=min_skills, limit=limit)
+        )
+        with self._stage("score"):
+            scores = self.scorer.score_batch(list(resumes.values()), job_description)
+
+        return dict(zip(resumes, scores))
+
+
+def document_id(path: str) -> str:
+    """Stable ID of a document: the hash of its contents, or its path if unreadable."""
+    try:
+        return content_hash(path)
+    except OSError:
+        return path
+
+
+def _chunked(items: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _analyze_safely(
+    processor: ResumeProcessor,
+    analyze: Callable,
+    path: str,
+    *args,
+    needs_models: bool = True,
+) -> Optional[Dict]:
+    """Analyze a document, in isolation if the processor has a budget.
+
+    ``analyze`` is called with ``args``, or with the path if there are none.
+    Unless ``needs_models`` is False, e.g. for parsing only, the analysis
+    models are loaded before forking. Returns None if the document could not
+    be analyzed.
+    """
+    args = args or (path,)
+    try:
+        if processor.budget is not None:
+            if needs_models:
+                processor.load_analysis_models()
+            with metrics.stage("isolated_analysis"):
+                return run_isolated(analyze, *args, budget=processor.budget)
+        return analyze(*args)
+    except Exception as e:
+        logger.error(f"Error analyzing {path}: {e}")
+        return None
+
+
+# Processor of an analysis worker process, created once per worker
+_worker_processor: Optional[ResumeProcessor] = None
+
+
+def _init_analysis_worker(budget: Optional[Budget] = None, needs_models: bool = True):
+    global _worker_processor
+    _worker_processor = ResumeProcessor(budget=budget)
+    # Isolated documents fork from this worker, so it loads the models up front
+    if budget is not None and needs_models:
+        try:
+            _worker_processor.load_analysis_models()
+        except Exception as e:
+            logger.error(f"Error loading analysis models: {e}")
+
+
+def _analyze_in_worker(resume_path: str) -> Optional[Dict]:
+    return _analyze_safely(
+        _worker_processor, _worker_processor.analyze_resume, resume_path
+    )
+
+
+def _parse_in_worker(resume_path: str, _: str) -> Optional[str]:
+    # Empty documents fail here rather than in extraction
+    return (
+        _analyze_safely(
+            _worker_processor,
+            _worker_processor.parser.parse,
+            resume_path,
+            needs_models=False,
+        )
+        or None
+    )
+
+
+def _extract_in_worker(resume_path: str, resume_text: str) -> Optional[Dict]:
+    return _analyze_safely(
+        _worker_processor,
+        _worker_processor.analyze_resume_text,
+        resume_path,
+        resume_text,
+    )
+
 
 if __name__ == "__main__":
-    processor = ResumeProcessor()
+    arg_parser = argparse.ArgumentParser(
+        description="Score a resume against a job description."
+    )
+    arg_parser.add_argument(
+        "resume", nargs="?", default="data/Resumes/web_developer_resume_sample.pdf"
+    )
+    arg_parser.add_argument(
+        "job_description",
+        nargs="?",
+        default="data/JDs/web_developer_job_description_sample.docx",
+    )
+    arg_parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        nargs="?",
+        const="profiles",
+        help="Write a CPU and memory profile report for the resume to DIR",
+    )
+    args = arg_parser.parse_args()
 
-    resume_path = "data/Resumes/web_developer_resume_sample.pdf"
-    jd_path = "data/JDs/web_developer_job_description_sample.docx"
+    processor = ResumeProcessor()
 
-    result = processor.process_resume(resume_path, jd_path)
+    profiler = PipelineProfiler() if args.profile else None
+    result = processor.process_resume(args.resume, args.job_description, profiler)
 
     print("RESULT", result)
+
+    if profiler is not None:
+        print("PROFILE", profiler.write_report(args.profile, args.resume))
@@ -0,0 +1,187 @@
+import zlib
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Jaccard similarity of the token shingles above which resumes are
+# near-duplicates; re-submissions with a changed line or two stay above it
+DEFAULT_THRESHOLD = 0.9
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def shingles(tokens: Sequence[str], size: int = 3) -> np.ndarray:
+    """
+    Hash the distinct ``size``-token shingles of a document.
+
+    Args:
+        tokens (Sequence[str]): Cleaned tokens, as returned by ``TextCleaner``
+        size (int): Tokens per shingle
+
+    Returns:
+        np.ndarray: uint64 shingle hashes; documents shorter than ``size``
+            tokens form a single shingle
+    """
+    if len(tokens) < size:
+        grams = {" ".join(tokens)} if tokens else set()
+    else:
+        grams = {" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)}
+    # crc32 rather than hash(), which differs between processes
+    return np.fromiter(
+        (zlib.crc32(gram.encode("utf-8")) for gram in grams),
+        dtype=np.uint64,
+        count=len(grams),
+    )
+
+
+class MinHasher:
+    """MinHash signatures whose agreement estimates the Jaccard similarity."""
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, hashes: np.ndarray) -> np.ndarray:
+        """Signature of a set of shingle hashes, one minimum per permutation."""
+        if not len(hashes):
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        permuted = (hashes[:, None] * self._a + self._b) % _MERSENNE_PRIME
+        return np.bitwise_and(permuted, _MAX_HASH).min(axis=0)
+
+
+def lsh_parameters(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Choose the LSH bands and rows per band for a similarity threshold.
+
+    Two documents become candidates when all rows of at least one band
+    agree, which happens with probability ``1 - (1 - s**rows)**bands`` for
+    Jaccard similarity ``s``. The steepest part of that curve lies near
+    ``(1 / bands) ** (1 / rows)``, which is matched to the threshold.
+
+    Returns:
+        Tuple of (bands, rows)
+    """
+    candidates = [(bands, num_perm // bands) for bands in range(1, num_perm + 1)]
+    return min(
+        candidates,
+        key=lambda params: abs((1 / params[0]) ** (1 / params[1]) - threshold),
+    )
+
+
+class DuplicateIndex:
+    """Incremental near-duplicate detection with MinHash and LSH.
+
+    Documents are added one at a time. A document whose estimated Jaccard
+    similarity to an earlier representative reaches the threshold is
+    reported as its duplicate; otherwise it becomes a representative itself.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = 128,
+        shingle_size: int = 3,
+        seed: int = 1,
+    ):
+        """
+        Args:
+            threshold (float): Jaccard similarity of the token shingles above
+                which two documents are near-duplicates, in (0, 1]
+            num_perm (int): MinHash permutations; more is more accurate
+            shingle_size (int): Tokens per shingle
+            seed (int): Seed of the MinHash permutations
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.hasher = MinHasher(num_perm, seed)
+        self.bands, self.rows = lsh_parameters(threshold, num_perm)
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [
+            {} for _ in range(self.bands)
+        ]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def find_or_add(self, key: Hashable, tokens: Sequence[str]) -> Optional[Hashable]:
+        """
+        Look up the representative of a document, adding it if there is none.
+
+        Args:
+            key (Hashable): Identifier of the document, e.g. its path
+            tokens (Sequence[str]): Cleaned tokens of the document
+
+        Returns:
+            The key of the most similar representative at or above the
+            threshold, or None if the document is now a representative itself.
+            Empty documents are never considered duplicates.
+        """
+        if not tokens:
+            return None
+
+        signature = self.hasher.signature(shingles(tokens, self.shingle_size))
+        band_keys = self._band_keys(signature)
+
+        best, best_similarity = None, self.threshold
+        checked = set()
+        for bucket, band_key in zip(self._buckets, band_keys):
+            for candidate in bucket.get(band_key, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                similarity = float(np.mean(self._signatures[candidate] == signature))
+                if similarity >= best_similarity:
+                    best, best_similarity = candidate, similarity
+        if best is not None:
+            return best
+
+        self._signatures[key] = signature
+        for bucket, band_key in zip(self._buckets, band_keys):
+            bucket.setdefault(band_key, []).append(key)
+        return None
+
+
+def group_duplicates(
+    documents: Iterable[Tuple[Hashable, Sequence[str]]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Dict[Hashable, Hashable]:
+    """
+    Find the near-duplicates among documents.
+
+    Args:
+        documents (Iterable): (key, cleaned tokens) pairs; earlier documents
+            become the representatives of later ones
+        threshold (float): Jaccard similarity threshold
+
+    Returns:
+        Dict[Hashable, Hashable]: Key of every duplicate to the key of its
+            representative; representatives are not included
+    """
+    index = DuplicateIndex(threshold)
+    duplicates = {}
+    for key, tokens in documents:
+        representative = index.find_or_add(key, tokens)
+        if representative is not None:
+            duplicates[key] = representative
+    return duplicates
+
+
+if __name__ == "__main__":
+    base = "senior python developer with experience building data pipelines".split()
+    documents = [
+        ("a.pdf", base * 5),
+        ("b.pdf", base * 5 + ["kubernetes"]),
+        ("c.pdf", "hotel manager with guest relations background".split() * 5),
+    ]
+    print(group_duplicates(documents, threshold=0.8))
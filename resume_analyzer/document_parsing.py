@@ -1,12 +1,19 @@
 from typing import Dict, Optional
-import pdfplumber
-from docx import Document
 from pathlib import Path
 import logging
+import os
+
+from resume_analyzer import metrics
+from resume_analyzer.docx_text import docx_text
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# DOCX backend: "xml" streams the document XML out of the archive, including
+# tables, headers, footers and text boxes; "python-docx" reads body
+# paragraphs only, as earlier versions did
+DOCX_BACKEND = os.environ.get("RESUME_ANALYZER_DOCX_BACKEND", "xml")
+
 
 class DocumentParser:
     """Handles parsing of different document formats (PDF, DOCX)."""
@@ -28,8 +35,11 @@ class DocumentParser:
     @staticmethod
     def parse_pdf(file_path: str) -> Optional[str]:
         """Extract text from PDF files using pdfplumber."""
+        import pdfplumber
+
         try:
             with pdfplumber.open(file_path) as pdf:
+                metrics.DOCUMENT_PAGES.observe(len(pdf.pages))
                 text = ""
                 for page in pdf.pages:
                     text += page.extract_text() or ""
@@ -39,9 +49,22 @@ class DocumentParser:
             return None
 
     @staticmethod
-    def parse_docx(file_path: str) -> Optional[str]:
-        """Extract text from DOCX files using python-docx."""
+    def parse_docx(file_path: str, backend: Optional[str] = None) -> Optional[str]:
+        """Extract text from DOCX files.
+
+        Args:
+            file_path (str): DOCX file
+            backend (str): "xml" or "python-docx"; defaults to ``DOCX_BACKEND``
+        """
+        backend = backend or DOCX_BACKEND
         try:
+            if backend == "xml":
+                return docx_text(file_path).strip()
+            if backend != "python-docx":
+                raise ValueError(f"Unknown DOCX backend {backend!r}")
+
+            from docx import Document
+
             doc = Document(file_path)
             text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
             return text.strip()
@@ -54,14 +77,19 @@ class DocumentParser:
         if not self.validate_file(file_path):
             return None
 
-        file_extension = Path(file_path).suffix.lower()
+        path = Path(file_path)
+        file_extension = path.suffix.lower()
 
+        text = None
         if file_extension == ".pdf":
-            return self.parse_pdf(file_path)
+            text = self.parse_pdf(file_path)
         elif file_extension == ".docx":
-            return self.parse_docx(file_path)
+            text = self.parse_docx(file_path)
 
-        return None
+        metrics.observe_document(
+            file_path, "parsed" if text else "failed", path.stat().st_size
+        )
+        return text
 
     def parse_multiple(self, file_paths: list) -> Dict[str, str]:
         """Parse multiple documents and return a dictionary of results."""
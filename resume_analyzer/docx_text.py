@@ -0,0 +1,115 @@
+import re
+import zipfile
+from typing import IO, Iterator, List, Union
+from xml.etree.ElementTree import iterparse
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
+_PARAGRAPH = _W + "p"
+_TEXT = _W + "t"
+_TAB = _W + "tab"
+# Tab stop definitions, whose w:tab children are not text
+_TAB_STOPS = _W + "tabs"
+_BREAKS = {_W + "br", _W + "cr"}
+# Legacy copies of content that the preceding mc:Choice already contains,
+# e.g. text boxes in VML for older versions of Word
+_FALLBACK = _MC + "Fallback"
+
+_BODY_PART = "word/document.xml"
+_HEADER_PART = re.compile(r"word/header\d*\.xml")
+_FOOTER_PART = re.compile(r"word/footer\d*\.xml")
+
+
+def iter_paragraphs(xml: IO[bytes]) -> Iterator[str]:
+    """
+    Stream the text of every paragraph in a WordprocessingML part.
+
+    The part is parsed incrementally and each paragraph is discarded once its
+    text is read, so memory stays flat however large the document is.
+    Paragraphs in tables and text boxes are included; a text box anchored in
+    a paragraph is yielded before the paragraph that contains it.
+
+    Args:
+        xml (IO[bytes]): The part, e.g. ``word/document.xml`` opened from the zip
+
+    Returns:
+        Iterator[str]: Paragraph texts in document order
+    """
+    # Text of the paragraphs being read; nested for text boxes
+    paragraphs: List[List[str]] = []
+    skip_depth = 0
+    for event, element in iterparse(xml, events=("start", "end")):
+        tag = element.tag
+        if tag == _FALLBACK or tag == _TAB_STOPS:
+            skip_depth += 1 if event == "start" else -1
+            continue
+        if skip_depth:
+            if event == "end":
+                element.clear()
+            continue
+
+        if event == "start":
+            if tag == _PARAGRAPH:
+                paragraphs.append([])
+            continue
+
+        if tag == _PARAGRAPH:
+            yield "".join(paragraphs.pop())
+            element.clear()
+        elif paragraphs:
+            if tag == _TEXT:
+                paragraphs[-1].append(element.text or "")
+            elif tag == _TAB:
+                paragraphs[-1].append("\t")
+            elif tag in _BREAKS:
+                paragraphs[-1].append("\n")
+
+
+def docx_text(source: Union[str, IO[bytes]]) -> str:
+    """
+    Extract the text of a DOCX file without building an object model.
+
+    Reads ``word/document.xml`` and the header and footer parts straight from
+    the zip archive. Header text comes first and footer text last; repeated
+    header and footer paragraphs, e.g. of first-page and default headers, are
+    kept once.
+
+    Args:
+        source: Path or binary file object of the DOCX file
+
+    Returns:
+        str: One line per paragraph
+
+    Raises:
+        zipfile.BadZipFile: If the file is not a zip archive
+        KeyError: If the archive has no ``word/document.xml``
+        xml.etree.ElementTree.ParseError: If a part is malformed XML
+    """
+    with zipfile.ZipFile(source) as archive:
+        names = sorted(archive.namelist())
+        headers = [name for name in names if _HEADER_PART.fullmatch(name)]
+        footers = [name for name in names if _FOOTER_PART.fullmatch(name)]
+
+        def read(parts: List[str], unique: bool) -> List[str]:
+            lines, seen = [], set()
+            for part in parts:
+                with archive.open(part) as xml:
+                    for line in iter_paragraphs(xml):
+                        if unique:
+                            if not line.strip() or line in seen:
+                                continue
+                            seen.add(line)
+                        lines.append(line)
+            return lines
+
+        lines = (
+            read(headers, unique=True)
+            + read([_BODY_PART], unique=False)
+            + read(footers, unique=True)
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(docx_text("data/Resumes/web_developer_resume_sample.docx"))
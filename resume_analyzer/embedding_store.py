@@ -0,0 +1,290 @@
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Bump when the file layout changes
+STORE_VERSION = 1
+# Rows scanned at a time; small enough for the converted block to stay in cache
+BLOCK_ROWS = 8192
+
+_FILES = {
+    "vectors": ("vectors.f32", np.float32),
+    "codes": ("codes.i8", np.int8),
+    "scales": ("scales.f32", np.float32),
+    "bits": ("bits.u16", np.uint16),
+}
+# Set bits of every 16-bit value, for Hamming distances of packed sign bits
+_POPCOUNT = (
+    np.unpackbits(np.arange(1 << 16, dtype=np.uint16).view(np.uint8))
+    .reshape(-1, 16)
+    .sum(axis=1, dtype=np.uint8)
+)
+
+
+def quantize(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize vectors to int8 with one symmetric scale per vector.
+
+    Args:
+        vectors (np.ndarray): (n, dim) float vectors
+
+    Returns:
+        Tuple of (int8 codes, float32 scales); ``codes * scales[:, None]``
+        approximates the vectors
+    """
+    scales = np.abs(vectors).max(axis=1) / 127
+    scales[scales == 0] = 1
+    codes = np.rint(vectors / scales[:, None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def sign_bits(vectors: np.ndarray) -> np.ndarray:
+    """Pack the sign of every component into bits, padded to 16-bit words."""
+    bits = np.packbits(vectors > 0, axis=-1)
+    if bits.shape[-1] % 2:
+        padding = np.zeros(bits.shape[:-1] + (1,), dtype=np.uint8)
+        bits = np.concatenate([bits, padding], axis=-1)
+    return bits.view(np.uint16)
+
+
+class EmbeddingStore:
+    """Append-only store of normalized embeddings in memory-mapped files.
+
+    Every vector is kept three ways: int8 codes with a per-vector scale (a
+    quarter of float32), optionally packed sign bits (1/32), and the exact
+    float32 vector. Searches scan only the compressed codes, which is all
+    that has to stay in the page cache, and then re-score a shortlist with
+    the float32 vectors, which are read from disk for those rows only.
+
+    Only the ids are loaded into memory. A directory holds one embedding
+    space; opening it with a different ``embedding_id`` (see
+    ``TextVectorizer.embedding_id``) or dimension raises ``ValueError``.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        embedding_id: Optional[str] = None,
+        binary: bool = True,
+    ):
+        """
+        Args:
+            directory (str): Directory of the store; created if missing
+            embedding_id (str): Model the embeddings come from
+            binary (bool): Also keep sign-bit codes for the fastest scan;
+                ignored when opening an existing store
+        """
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._maps: Dict[str, np.ndarray] = {}
+        os.makedirs(directory, exist_ok=True)
+
+        meta_path = os.path.join(directory, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                self.meta = json.load(f)
+            if self.meta["version"] != STORE_VERSION:
+                raise ValueError(
+                    f"{directory} has store version {self.meta['version']}, "
+                    f"expected {STORE_VERSION}"
+                )
+            if embedding_id and self.meta["embedding_id"] not in (None, embedding_id):
+                raise ValueError(
+                    f"{directory} holds {self.meta['embedding_id']} embeddings, "
+                    f"not {embedding_id}"
+                )
+        else:
+            self.meta = {
+                "version": STORE_VERSION,
+                "embedding_id": embedding_id,
+                "dim": None,
+                "count": 0,
+                "binary": binary,
+            }
+
+        self.ids: List[str] = []
+        if os.path.exists(self._path("ids.txt")):
+            with open(self._path("ids.txt")) as f:
+                self.ids = f.read().splitlines()
+        self._truncate()
+
+    def __len__(self) -> int:
+        return self.meta["count"]
+
+    @property
+    def dim(self) -> Optional[int]:
+        return self.meta["dim"]
+
+    @property
+    def binary(self) -> bool:
+        return self.meta["binary"]
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _row_bytes(self, kind: str) -> int:
+        dtype = _FILES[kind][1]
+        width = {
+            "vectors": self.dim,
+            "codes": self.dim,
+            "scales": 1,
+            "bits": (self.dim + 15) // 16 if self.dim else 0,
+        }[kind]
+        return (width or 0) * np.dtype(dtype).itemsize
+
+    def _truncate(self):
+        """Drop rows written after the last committed count, e.g. by a crash."""
+        for kind, (name, _) in _FILES.items():
+            path = self._path(name)
+            size = self.meta["count"] * self._row_bytes(kind)
+            if os.path.exists(path) and os.path.getsize(path) > size:
+                logger.warning(f"Truncating uncommitted rows of {path}")
+                os.truncate(path, size)
+        if len(self.ids) > len(self):
+            self.ids = self.ids[: len(self)]
+            with open(self._path("ids.txt"), "w") as f:
+                f.writelines(f"{key}\n" for key in self.ids)
+
+    def _map(self, kind: str) -> np.ndarray:
+        """Read-only memory map of one file, as (count, width)."""
+        if kind not in self._maps:
+            name, dtype = _FILES[kind]
+            width = self._row_bytes(kind) // np.dtype(dtype).itemsize
+            self._maps[kind] = np.memmap(
+                self._path(name), dtype=dtype, mode="r", shape=(len(self), width)
+            )
+        return self._maps[kind]
+
+    def add(self, ids: Sequence[str], vectors: np.ndarray):
+        """
+        Append embeddings; they are normalized to unit length first.
+
+        Args:
+            ids (Sequence[str]): Identifier of every vector, e.g. a resume path;
+                may not contain line breaks
+            vectors (np.ndarray): (len(ids), dim) embeddings
+        """
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        if len(ids) != len(vectors):
+            raise ValueError("ids and vectors differ in length")
+        if not len(ids):
+            return
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1, norms)
+
+        with self._lock:
+            if self.dim is None:
+                self.meta["dim"] = vectors.shape[1]
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(
+                    f"Expected {self.dim}-dimensional vectors, got {vectors.shape[1]}"
+                )
+            codes, scales = quantize(vectors)
+            arrays = {"vectors": vectors, "codes": codes, "scales": scales}
+            if self.binary:
+                arrays["bits"] = sign_bits(vectors)
+            for kind, array in arrays.items():
+                with open(self._path(_FILES[kind][0]), "ab") as f:
+                    f.write(np.ascontiguousarray(array).tobytes())
+            with open(self._path("ids.txt"), "a") as f:
+                f.writelines(f"{key}\n" for key in ids)
+
+            # The count in the metadata commits the new rows
+            self.ids.extend(ids)
+            self.meta["count"] += len(ids)
+            temporary = self._path("meta.json.tmp")
+            with open(temporary, "w") as f:
+                json.dump(self.meta, f)
+            os.replace(temporary, self._path("meta.json"))
+            self._maps = {}
+
+    def _approximate_scores(
+        self, query: np.ndarray, coarse: str, start: int, stop: int
+    ):
+        if coarse == "binary":
+            distances = _POPCOUNT[
+                np.bitwise_xor(self._map("bits")[start:stop], sign_bits(query))
+            ].sum(axis=1, dtype=np.int32)
+            return -distances.astype(np.float32)
+        codes = self._map("codes")[start:stop]
+        return (codes.astype(np.float32) @ query) * self._map("scales")[start:stop, 0]
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        shortlist: Optional[int] = None,
+        coarse: Optional[str] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the stored embeddings most similar to a query.
+
+        Args:
+            query (np.ndarray): Query embedding
+            k (int): Results to return
+            shortlist (int): Candidates the approximate scan passes on to exact
+                re-scoring; defaults to ``10 * k``, at least 100. Larger is
+                slower and more accurate
+            coarse (str): Codes to scan, "binary" (Hamming distance of the sign
+                bits) or "int8"; "binary" if the store has sign bits
+
+        Returns:
+            List of (id, cosine similarity), most similar first
+        """
+        if not len(self):
+            return []
+        coarse = coarse or ("binary" if self.binary else "int8")
+        if coarse == "binary" and not self.binary:
+            raise ValueError("This store has no binary codes")
+        if coarse not in ("binary", "int8"):
+            raise ValueError(f"Unknown scan {coarse!r}")
+        query = np.asarray(query, dtype=np.float32).ravel()
+        query = query / (np.linalg.norm(query) or 1)
+        shortlist = min(len(self), max(k, shortlist or max(10 * k, 100)))
+
+        # Phase 1: approximate scores, keeping the best rows block by block
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float32)
+        for start in range(0, len(self), BLOCK_ROWS):
+            stop = min(len(self), start + BLOCK_ROWS)
+            scores = np.concatenate(
+                [best_scores, self._approximate_scores(query, coarse, start, stop)]
+            )
+            rows = np.concatenate([best_rows, np.arange(start, stop)])
+            if len(scores) > shortlist:
+                keep = np.argpartition(-scores, shortlist - 1)[:shortlist]
+                scores, rows = scores[keep], rows[keep]
+            best_scores, best_rows = scores, rows
+
+        # Phase 2: exact scores of the shortlist, reading rows in file order
+        rows = np.sort(best_rows)
+        exact = self._map("vectors")[rows] @ query
+        order = np.argsort(-exact)[:k]
+        return [(self.ids[rows[i]], float(exact[i])) for i in order]
+
+    def disk_bytes(self) -> Dict[str, int]:
+        """Size of every file of the store, in bytes."""
+        return {
+            kind: os.path.getsize(self._path(name))
+            for kind, (name, _) in _FILES.items()
+            if os.path.exists(self._path(name))
+        }
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(1000, 64)).astype(np.float32)
+    with tempfile.TemporaryDirectory() as directory:
+        store = EmbeddingStore(directory, embedding_id="demo")
+        store.add([f"resume-{i}" for i in range(len(vectors))], vectors)
+        query = vectors[42] + rng.normal(scale=0.1, size=64)
+        print(store.search(query, k=3))
+        print(EmbeddingStore(directory, embedding_id="demo").disk_bytes())
@@ -1,41 +1,69 @@
-import re
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
-import spacy
-from spacy import displacy
+from resume_analyzer import metrics
+from resume_analyzer.models import load_spacy
+from resume_analyzer.rules import DateRange, Span, default_rules
+
+NER_OPTIONS = {
+    "ents": [
+        "SKILL",
+        "JOB",
+        "DEGREE",
+        "GPE",
+        "DATE",
+        "ORDINAL",
+    ]
+}
 
 
 class InformationExtractor:
     def __init__(self):
-        try:
-            # Load spaCy model for NLP tasks
-            self.nlp = spacy.load("en_core_web_sm")
-            self.combined_patterns_path = "data/combined_patterns.jsonl"
-            self.ruler = self.nlp.add_pipe("entity_ruler")
-            self.ruler.from_disk(self.combined_patterns_path)
-
-        except Exception as e:
-            logging.error(f"Error loading spaCy model: {str(e)}")
-            raise
-
-        # Regex patterns
-        self.email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        self.phone_pattern = r"\b(?:\+\d{1,2}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b"
-        self.experience_pattern = r"(\d+)\s*\+?\s*(?:year|yr)s?\s*of\s*experience"
-
-    def extract_contact_info(self, text: str) -> Dict[str, str]:
-        """Extract contact information from text."""
+        self.combined_patterns_path = "data/combined_patterns.jsonl"
+        self._nlp = None
+        self.ruler = None
+
+        # Email, phone, stated experience and date range rules, compiled
+        # once per process from data/extraction_rules.json
+        self.rules = default_rules()
+
+    @property
+    def nlp(self):
+        """spaCy pipeline with the skill, job and degree entity ruler.
+
+        Loaded on first use, so importing and constructing the extractor stays
+        cheap for code paths that never run NER.
+        """
+        if self._nlp is None:
+            try:
+                # Load spaCy model for NLP tasks
+                with metrics.track_model_memory("spacy_extractor"):
+                    nlp = load_spacy()
+                    self.ruler = nlp.add_pipe("entity_ruler")
+                    self.ruler.from_disk(self.combined_patterns_path)
+            except Exception as e:
+                logging.error(f"Error loading spaCy model: {str(e)}")
+                raise
+            self._nlp = nlp
+        return self._nlp
+
+    def extract_contact_info(
+        self, text: str, spans: Optional[Dict[str, List[Span]]] = None
+    ) -> Dict[str, str]:
+        """Extract contact information from text.
+
+        Args:
+            text (str): Document text
+            spans (Dict[str, List[Span]]): Output of ``rules.scan_by_rule`` for
+                the text, if already computed
+        """
         if not text:
             return {"email": None, "phone": None, "location": None}
 
-        # Email extraction
-        email_match = re.search(self.email_pattern, text)
-        email = email_match.group() if email_match else None
-
-        # Phone extraction
-        phone_match = re.search(self.phone_pattern, text)
-        phone = phone_match.group() if phone_match else None
+        if spans is None:
+            spans = self.rules.scan_by_rule(text)
+        email = spans["email"][0].value if spans["email"] else None
+        phone = spans["phone"][0].value if spans["phone"] else None
 
         # Location extraction
         doc = self.nlp(text)
@@ -67,15 +95,41 @@ class InformationExtractor:
         myset.append(subset)
         return list(set(subset))
 
-    def extract_experience(self, text: str) -> List[Dict[str, Any]]:
-        """Extract years of experience from text."""
-        experience_matches = re.findall(self.experience_pattern, text, re.IGNORECASE)
+    def extract_experience(
+        self, text: str, spans: Optional[Dict[str, List[Span]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Extract stated years of experience and employment date ranges.
 
-        return (
-            [{"years": int(years)} for years in experience_matches]
-            if experience_matches
-            else []
-        )
+        Args:
+            text (str): Document text
+            spans (Dict[str, List[Span]]): Output of ``rules.scan_by_rule`` for
+                the text, if already computed
+
+        Returns:
+            List of ``{"kind": "stated", "years": int}`` entries, for phrases
+            like "5+ years of experience", and ``{"kind": "date_range",
+            "years": float, "start": "YYYY-MM", "end": "YYYY-MM", "current":
+            bool}`` entries, for periods like "June 2019 - Present"
+        """
+        if spans is None:
+            spans = self.rules.scan_by_rule(text)
+
+        experience: List[Dict[str, Any]] = [
+            {"kind": "stated", "years": span.value}
+            for span in spans["experience_years"]
+        ]
+        for span in spans["date_range"]:
+            period: DateRange = span.value
+            experience.append(
+                {
+                    "kind": "date_range",
+                    "years": round(period.years, 2),
+                    "start": DateRange.format_month(period.start),
+                    "end": DateRange.format_month(period.end),
+                    "current": period.current,
+                }
+            )
+        return experience
 
     def extract_job_titles(self, text: str) -> List[str]:
         doc = self.nlp(text)
@@ -87,54 +141,52 @@ class InformationExtractor:
         myset.append(subset)
         return list(set(subset))
 
+    def render_entities(self, text: str) -> str:
+        """Render the recognized entities of a text as displaCy HTML."""
+        from spacy import displacy
+
+        return displacy.render(
+            self.nlp(text), style="ent", options=NER_OPTIONS, page=True
+        ).replace("\n", "")
+
+    def extract_resume(self, text: str) -> Dict[str, Any]:
+        """Extract all structured information from a resume."""
+        spans = self.rules.scan_by_rule(text)
+        return {
+            "job_titles": self.extract_job_titles(text),
+            "contact": self.extract_contact_info(text, spans),
+            "education": self.extract_education(text),
+            "experience": self.extract_experience(text, spans),
+            "skills": self.extract_skills(text),
+            "ner": [self.render_entities(text)],
+        }
+
+    def extract_job_description(self, text: str) -> Dict[str, Any]:
+        """Extract all structured information from a job description."""
+        return {
+            "job_titles": self.extract_job_titles(text),
+            "education": self.extract_education(text),
+            "experience": self.extract_experience(text),
+            "skills": self.extract_skills(text),
+            "ner": [self.render_entities(text)],
+        }
+
 
 def extract_resume_and_job_description(
-    resume_text: str, job_description_text: str
+    resume_text: str,
+    job_description_text: str,
+    extractor: Optional[InformationExtractor] = None,
 ) -> Dict[str, Any]:
     """Comprehensive extraction of resume and job description."""
     if not resume_text or not job_description_text:
         return {"resume": {}, "job_description": {}}
 
-    extractor = InformationExtractor()
-
-    options = {
-        "ents": [
-            "SKILL",
-            "JOB",
-            "DEGREE",
-            "GPE",
-            "DATE",
-            "ORDINAL",
-        ]
-    }
+    if extractor is None:
+        extractor = InformationExtractor()
 
     return {
-        "resume": {
-            "job_titles": extractor.extract_job_titles(resume_text),
-            "contact": extractor.extract_contact_info(resume_text),
-            "education": extractor.extract_education(resume_text),
-            "experience": extractor.extract_experience(resume_text),
-            "skills": extractor.extract_skills(resume_text),
-            "ner": [
-                displacy.render(
-                    extractor.nlp(resume_text), style="ent", options=options, page=True
-                ).replace("\n", "")
-            ],
-        },
-        "job_description": {
-            "job_titles": extractor.extract_job_titles(job_description_text),
-            "education": extractor.extract_education(job_description_text),
-            "experience": extractor.extract_experience(job_description_text),
-            "skills": extractor.extract_skills(job_description_text),
-            "ner": [
-                displacy.render(
-                    extractor.nlp(job_description_text),
-                    style="ent",
-                    options=options,
-                    page=True,
-                ).replace("\n", "")
-            ],
-        },
+        "resume": extractor.extract_resume(resume_text),
+        "job_description": extractor.extract_job_description(job_description_text),
     }
 
 
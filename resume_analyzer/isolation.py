@@ -0,0 +1,210 @@
+import logging
+import os
+import pickle
+import select
+import signal
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from resume_analyzer import metrics
+
+logger = logging.getLogger(__name__)
+
+MIB = 2**20
+
+
+class DocumentFailedError(RuntimeError):
+    """Raised when processing a document in isolation fails or exceeds its budget."""
+
+    def __init__(self, reason: str, detail: str = ""):
+        super().__init__(f"{reason}: {detail}" if detail else reason)
+        # One of "cpu_time", "wall_clock", "memory", "crashed" or "error"
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Resources one document may use before its worker is killed.
+
+    ``memory_bytes`` is the address space the worker may add on top of what
+    it inherits from the parent, so loaded models do not count against it.
+    """
+
+    cpu_seconds: int = 30
+    wall_seconds: float = 60.0
+    memory_bytes: int = 1024 * MIB
+
+    @classmethod
+    def from_env(cls, prefix: str = "RESUME_ANALYZER_") -> "Budget":
+        """Read ``<prefix>CPU_SECONDS``, ``WALL_SECONDS`` and ``MEMORY_MB``."""
+        default = cls()
+        return cls(
+            cpu_seconds=int(
+                os.environ.get(f"{prefix}CPU_SECONDS", default.cpu_seconds)
+            ),
+            wall_seconds=float(
+                os.environ.get(f"{prefix}WALL_SECONDS", default.wall_seconds)
+            ),
+            memory_bytes=int(
+                os.environ.get(f"{prefix}MEMORY_MB", default.memory_bytes // MIB)
+            )
+            * MIB,
+        )
+
+
+def _address_space_bytes() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _apply_limits(budget: Budget):
+    import resource
+
+    # SIGXCPU at the soft limit, SIGKILL one second later
+    resource.setrlimit(
+        resource.RLIMIT_CPU, (budget.cpu_seconds, budget.cpu_seconds + 1)
+    )
+    try:
+        ceiling = _address_space_bytes() + budget.memory_bytes
+    except (OSError, ValueError, IndexError):
+        ceiling = budget.memory_bytes
+    resource.setrlimit(resource.RLIMIT_AS, (ceiling, ceiling))
+
+
+def _run_child(function: Callable, args: tuple, budget: Budget, write_fd: int):
+    # Sent back with the result for the parent to merge
+    before = metrics.REGISTRY.snapshot()
+    try:
+        _apply_limits(budget)
+        outcome = (True, function(*args))
+    except MemoryError:
+        outcome = (False, ("memory", ""))
+    except BaseException as e:
+        outcome = (False, ("error", repr(e)))
+    try:
+        recorded = metrics.REGISTRY.delta(before)
+    except Exception:
+        recorded = {}
+    try:
+        payload = pickle.dumps(outcome + (recorded,))
+    except Exception as e:
+        payload = pickle.dumps(
+            (False, ("error", f"Unpicklable result: {e!r}"), recorded)
+        )
+    with os.fdopen(write_fd, "wb") as pipe:
+        pipe.write(payload)
+
+
+def _read_until(read_fd: int, deadline: float) -> Optional[bytes]:
+    """Read the pipe to EOF, or return None once the deadline has passed."""
+    chunks = []
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        ready, _, _ = select.select([read_fd], [], [], remaining)
+        if not ready:
+            continue
+        chunk = os.read(read_fd, 1 << 16)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def run_isolated(function: Callable, *args, budget: Optional[Budget] = None) -> Any:
+    """
+    Call ``function(*args)`` in a forked process with a resource budget.
+
+    The child inherits everything the parent has loaded, so models are not
+    loaded again. It runs with CPU-time and address-space limits, and is
+    killed once the wall-clock budget is spent. Counters and histograms
+    recorded in the child are merged into the parent's metrics if it returns
+    a result or error; a child that is killed or crashes loses them.
+
+    Args:
+        function (Callable): Function to call; its result must be picklable
+        *args: Arguments of the function
+        budget (Budget): Resource budget; ``Budget()`` defaults if None
+
+    Returns:
+        The result of the function
+
+    Raises:
+        DocumentFailedError: If the function raised, or the child exceeded
+            its budget or died
+    """
+    budget = budget or Budget()
+    if not hasattr(os, "fork"):
+        logger.warning("Process isolation needs fork(); running in-process")
+        return function(*args)
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            _run_child(function, args, budget, write_fd)
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    try:
+        payload = _read_until(read_fd, time.monotonic() + budget.wall_seconds)
+    finally:
+        os.close(read_fd)
+    if payload is None:
+        os.kill(pid, signal.SIGKILL)
+    _, status, usage = os.wait4(pid, 0)
+
+    if payload is None:
+        failure = DocumentFailedError(
+            "wall_clock", f"still running after {budget.wall_seconds:g}s"
+        )
+    elif payload:
+        try:
+            succeeded, value, recorded = pickle.loads(payload)
+        except Exception as e:
+            # Killed while writing its result
+            succeeded, value = False, ("crashed", f"truncated result: {e!r}")
+        else:
+            metrics.REGISTRY.merge(recorded)
+        if succeeded:
+            return value
+        failure = DocumentFailedError(*value)
+    elif (
+        os.WIFSIGNALED(status) and os.WTERMSIG(status) == signal.SIGXCPU
+    ) or usage.ru_utime + usage.ru_stime >= budget.cpu_seconds:
+        failure = DocumentFailedError(
+            "cpu_time", f"used more than {budget.cpu_seconds}s of CPU time"
+        )
+    elif os.WIFSIGNALED(status):
+        failure = DocumentFailedError(
+            "crashed", f"killed by {signal.Signals(os.WTERMSIG(status)).name}"
+        )
+    else:
+        failure = DocumentFailedError("crashed", "exited without a result")
+
+    metrics.ISOLATION_FAILURES.inc(reason=failure.reason)
+    raise failure
+
+
+if __name__ == "__main__":
+    budget = Budget(cpu_seconds=1, wall_seconds=3, memory_bytes=64 * MIB)
+
+    def spin():
+        while True:
+            pass
+
+    def allocate():
+        return len(bytearray(512 * MIB))
+
+    def sleep():
+        time.sleep(10)
+
+    print(run_isolated(sum, [1, 2, 3], budget=budget))
+    for function, args in ((spin, ()), (allocate, ()), (sleep, ()), (int, ("x",))):
+        try:
+            run_isolated(function, *args, budget=budget)
+        except DocumentFailedError as e:
+            print(function.__name__, "->", e)
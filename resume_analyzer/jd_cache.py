@@ -0,0 +1,123 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from resume_analyzer import metrics
+
+logger = logging.getLogger(__name__)
+
+# Bump when the analyzed job description format changes, so profiles
+# persisted by an older version are analyzed again instead of reused
+CACHE_VERSION = 1
+
+
+def content_hash(path: str) -> str:
+    """SHA-256 of a file's contents, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class JobDescriptionCache:
+    """Analyzed job descriptions keyed by the hash of their file contents.
+
+    A profile is everything ``ResumeProcessor`` derives from a job
+    description: its parsed text, the extracted skills, degrees, titles and
+    experience, the cleaned tokens and sections, and its section embeddings.
+    The same job description uploaded again, under any file name, is then not
+    parsed, extracted, cleaned or embedded again.
+
+    Profiles are kept in memory with least recently used eviction and, if a
+    directory is given, pickled to it so they survive restarts and are shared
+    by every process using the directory. Only point it at a directory this
+    application controls, since loading a pickle can run arbitrary code.
+    """
+
+    def __init__(self, max_entries: int = 128, directory: Optional[str] = None):
+        """
+        Args:
+            max_entries (int): Profiles kept in memory
+            directory (str): Directory to persist profiles to; memory only if None
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.v{CACHE_VERSION}.pkl")
+
+    def _remember(self, key: str, profile: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = profile
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a profile, in memory first and then on disk.
+
+        Args:
+            key (str): Content hash of the job description file
+
+        Returns:
+            The analyzed job description, or None on a miss
+        """
+        with self._lock:
+            profile = self._entries.get(key)
+            if profile is not None:
+                self._entries.move_to_end(key)
+        if profile is None and self.directory:
+            try:
+                with open(self._path(key), "rb") as f:
+                    profile = pickle.load(f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable job description profile: {e}")
+            if profile is not None:
+                self._remember(key, profile)
+
+        metrics.record_cache("job_description", hit=profile is not None)
+        return profile
+
+    def put(self, key: str, profile: Dict[str, Any]):
+        """Store a profile in memory and, if configured, on disk."""
+        self._remember(key, profile)
+        if not self.directory:
+            return
+        # Write to a temporary file first so readers never see a partial one
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(profile, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self._path(key))
+        except Exception as e:
+            logger.warning(f"Could not persist job description profile: {e}")
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        cache = JobDescriptionCache(max_entries=1, directory=directory)
+        cache.put("a", {"skills": ["Python"]})
+        cache.put("b", {"skills": ["SQL"]})
+        # "a" was evicted from memory but is read back from disk
+        print("a" in cache, cache.get("a"), cache.get("c"))
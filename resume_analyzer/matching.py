@@ -0,0 +1,487 @@
+import importlib.util
+import json
+import logging
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SKILLS_PATH = "data/skills.jsonl"
+
+# Default minimum rapidfuzz ratio (0-100) for two skills or titles to match
+FUZZY_CUTOFF = 90
+
+# Characters ignored by fuzzy matching, so "React.js" and "ReactJS" compare
+# equal; "+" and "#" are kept to tell C, C++ and C# apart
+_FUZZY_IGNORED_RE = re.compile(r"[^0-9a-z+#]+")
+_TITLE_WORD_RE = re.compile(r"[0-9a-z+#]+")
+
+# Number of set bits for every possible byte value
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def normalize_skill(skill: str) -> str:
+    """Normalize a skill name for case and whitespace insensitive matching."""
+    return " ".join(str(skill).lower().split())
+
+
+def fuzzy_key(text: str) -> str:
+    """Lowercase a skill or title and drop punctuation and whitespace."""
+    return _FUZZY_IGNORED_RE.sub("", str(text).lower())
+
+
+def fuzzy_matrix(
+    queries: Sequence[str], choices: Sequence[str], cutoff: float = FUZZY_CUTOFF
+) -> np.ndarray:
+    """
+    Fuzzy match every query against every choice in one vectorized call.
+
+    Requires the optional ``rapidfuzz`` package.
+
+    Args:
+        queries (Sequence[str]): Strings to match, e.g. resume skills
+        choices (Sequence[str]): Strings to match against, e.g. JD skills
+        cutoff (float): Minimum ``fuzz.ratio`` (0-100) of the ``fuzzy_key``
+            forms for a pair to match
+
+    Returns:
+        np.ndarray: Boolean matrix of shape (len(queries), len(choices))
+    """
+    from rapidfuzz import fuzz, process
+
+    query_keys = [fuzzy_key(query) for query in queries]
+    choice_keys = [fuzzy_key(choice) for choice in choices]
+    if not query_keys or not choice_keys:
+        return np.zeros((len(query_keys), len(choice_keys)), dtype=bool)
+
+    scores = process.cdist(
+        query_keys,
+        choice_keys,
+        scorer=fuzz.ratio,
+        score_cutoff=cutoff,
+        dtype=np.uint8,
+    )
+    matches = scores >= cutoff
+    # Strings that are all punctuation would match each other
+    matches[[not key for key in query_keys], :] = False
+    matches[:, [not key for key in choice_keys]] = False
+    return matches
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """
+    Count the set bits in each row of a packed uint64 bitset matrix.
+
+    Args:
+        words (np.ndarray): Array of shape (n, n_words) with dtype uint64
+
+    Returns:
+        np.ndarray: Number of set bits per row
+    """
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    as_bytes = words.view(np.uint8).reshape(words.shape[0], -1)
+    return _POPCOUNT_TABLE[as_bytes].sum(axis=1, dtype=np.int64)
+
+
+class SkillVocabulary:
+    """Maps normalized skill names to dense integer IDs.
+
+    A frozen vocabulary never changes, so it can be shared between threads.
+    Skills missing from it go into an ``overlay``, which continues its IDs
+    and is thrown away with the batch it was made for.
+    """
+
+    def __init__(
+        self,
+        skills: Optional[Iterable[str]] = None,
+        base: Optional["SkillVocabulary"] = None,
+    ):
+        """
+        Args:
+            skills (Iterable[str]): Skills to assign IDs to, in order
+            base (SkillVocabulary): Frozen vocabulary this one is an overlay of
+        """
+        self._base = base
+        # IDs of this vocabulary start after those of the base
+        self._offset = len(base) if base is not None else 0
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self.frozen = False
+        for skill in skills or ():
+            self.add(skill)
+
+    @classmethod
+    def from_patterns(
+        cls, path: str = SKILLS_PATH, label: str = "SKILL"
+    ) -> "SkillVocabulary":
+        """
+        Build the vocabulary from an entity ruler patterns file.
+
+        Args:
+            path (str): Path to a JSONL file of spaCy entity ruler patterns
+            label (str): Only patterns with this label are added
+
+        Returns:
+            SkillVocabulary: Vocabulary with one ID per distinct skill
+        """
+        skills = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if entry.get("label") != label:
+                    continue
+                pattern = entry["pattern"]
+                if isinstance(pattern, str):
+                    skills.append(pattern)
+                else:
+                    skills.append(
+                        " ".join(str(next(iter(token.values()))) for token in pattern)
+                    )
+        return cls(skills)
+
+    def __len__(self) -> int:
+        return self._offset + len(self._names)
+
+    def __contains__(self, skill: str) -> bool:
+        return self._lookup(normalize_skill(skill)) is not None
+
+    def _lookup(self, key: str) -> Optional[int]:
+        if self._base is not None:
+            skill_id = self._base._lookup(key)
+            if skill_id is not None:
+                return skill_id
+        return self._ids.get(key)
+
+    def freeze(self) -> "SkillVocabulary":
+        """Stop assigning IDs to unknown skills, and return the vocabulary."""
+        self.frozen = True
+        return self
+
+    def overlay(self) -> "SkillVocabulary":
+        """Empty vocabulary that extends this frozen one, e.g. for one batch."""
+        if not self.frozen:
+            raise ValueError("Only a frozen vocabulary can have overlays")
+        return SkillVocabulary(base=self)
+
+    def add(self, skill: str) -> int:
+        """Return the ID of a skill, assigning a new one if it is unknown.
+
+        Raises:
+            ValueError: If the skill is unknown and the vocabulary is frozen
+        """
+        key = normalize_skill(skill)
+        skill_id = self._lookup(key)
+        if skill_id is None:
+            if self.frozen:
+                raise ValueError(f"{skill!r} is not in the frozen vocabulary")
+            skill_id = len(self)
+            self._ids[key] = skill_id
+            self._names.append(key)
+        return skill_id
+
+    def name(self, skill_id: int) -> str:
+        """Return the normalized skill name for an ID."""
+        if skill_id < self._offset:
+            return self._base.name(skill_id)
+        return self._names[skill_id - self._offset]
+
+    def encode(self, skills: Iterable[str]) -> np.ndarray:
+        """
+        Encode skills as a sorted array of unique IDs.
+
+        Skills missing from the vocabulary are added on the fly so that
+        extracted skills outside the patterns file can still be matched; use
+        an ``overlay`` of a frozen vocabulary for this.
+
+        Args:
+            skills (Iterable[str]): Raw skill names
+
+        Returns:
+            np.ndarray: Sorted unique int32 skill IDs
+        """
+        ids = [self.add(skill) for skill in skills]
+        return np.unique(np.asarray(ids, dtype=np.int32))
+
+
+@lru_cache(maxsize=None)
+def default_vocabulary() -> SkillVocabulary:
+    """Load the shared skills vocabulary once per process, frozen."""
+    return SkillVocabulary.from_patterns().freeze()
+
+
+class SkillMatrix:
+    """Packed skill bitsets for a batch of documents, one row per document."""
+
+    def __init__(self, rows: Sequence[np.ndarray], n_bits: int):
+        """
+        Args:
+            rows (Sequence[np.ndarray]): Sorted skill ID arrays, one per document
+            n_bits (int): Number of bits per row (at least the vocabulary size)
+        """
+        self.n_words = max(1, (n_bits + 63) // 64)
+        self.bits = np.zeros((len(rows), self.n_words), dtype=np.uint64)
+
+        if rows:
+            lengths = [len(ids) for ids in rows]
+            row_index = np.repeat(np.arange(len(rows)), lengths)
+            ids = (
+                np.concatenate(rows).astype(np.int64)
+                if sum(lengths)
+                else np.zeros(0, dtype=np.int64)
+            )
+            np.bitwise_or.at(
+                self.bits,
+                (row_index, ids >> 6),
+                np.left_shift(np.uint64(1), (ids & 63).astype(np.uint64)),
+            )
+
+    def __len__(self) -> int:
+        return self.bits.shape[0]
+
+    def to_bitset(self, ids: np.ndarray) -> np.ndarray:
+        """Pack a single skill ID array into a row compatible with this matrix."""
+        ids = np.asarray(ids, dtype=np.int64)
+        ids = ids[ids < self.n_words * 64]
+        row = np.zeros(self.n_words, dtype=np.uint64)
+        np.bitwise_or.at(
+            row, ids >> 6, np.left_shift(np.uint64(1), (ids & 63).astype(np.uint64))
+        )
+        return row
+
+    def intersection_counts(self, ids: np.ndarray) -> np.ndarray:
+        """Number of skills each document shares with the given skill IDs."""
+        return popcount(self.bits & self.to_bitset(ids))
+
+    def contains(self, ids: np.ndarray) -> np.ndarray:
+        """
+        Test every document for every given skill.
+
+        Args:
+            ids (np.ndarray): Skill IDs to test
+
+        Returns:
+            np.ndarray: Boolean matrix of shape (n_documents, len(ids))
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        in_range = ids < self.n_words * 64
+        hits = np.zeros((len(self), len(ids)), dtype=bool)
+        if in_range.any():
+            valid = ids[in_range]
+            columns = self.bits[:, valid >> 6]
+            hits[:, in_range] = (
+                (columns >> (valid & 63).astype(np.uint64)) & np.uint64(1)
+            ).astype(bool)
+        return hits
+
+
+class BulkSkillMatcher:
+    """Scores one job description's skills against many resumes at once."""
+
+    def __init__(
+        self,
+        vocabulary: Optional[SkillVocabulary] = None,
+        fuzzy_cutoff: Optional[float] = None,
+    ):
+        """
+        Args:
+            vocabulary (SkillVocabulary): Skill IDs; the shared default if None.
+                Each batch adds unknown skills to an overlay of a frozen
+                vocabulary, or else to the vocabulary itself, which must then
+                not be shared between threads
+            fuzzy_cutoff (float): If set, skills also match when the ratio of
+                their ``fuzzy_key`` forms reaches this value (0-100); see
+                ``fuzzy_matrix``; needs the optional ``rapidfuzz`` package
+
+        Raises:
+            ImportError: If ``fuzzy_cutoff`` is set and rapidfuzz is not
+                installed, rather than failing on the first batch
+        """
+        if fuzzy_cutoff is not None and importlib.util.find_spec("rapidfuzz") is None:
+            raise ImportError(
+                "Fuzzy matching needs the optional rapidfuzz package "
+                "(pip install rapidfuzz)"
+            )
+        self.vocabulary = vocabulary if vocabulary is not None else default_vocabulary()
+        self.fuzzy_cutoff = fuzzy_cutoff
+
+    def batch_vocabulary(self) -> SkillVocabulary:
+        """Vocabulary that one batch may add unknown skills to."""
+        if self.vocabulary.frozen:
+            return self.vocabulary.overlay()
+        return self.vocabulary
+
+    def build_matrix(
+        self,
+        skill_lists: Sequence[Iterable[str]],
+        vocabulary: Optional[SkillVocabulary] = None,
+    ) -> SkillMatrix:
+        """Encode the skills of every document and pack them into a matrix.
+
+        Args:
+            skill_lists (Sequence[Iterable[str]]): Skills of every document
+            vocabulary (SkillVocabulary): Vocabulary to encode with; a new
+                ``batch_vocabulary`` if None
+        """
+        if vocabulary is None:
+            vocabulary = self.batch_vocabulary()
+        rows = [vocabulary.encode(skills) for skills in skill_lists]
+        return SkillMatrix(rows, len(vocabulary))
+
+    def match(
+        self, resume_skills: Sequence[Iterable[str]], jd_skills: List[str]
+    ) -> List[Tuple[float, List[str], List[str]]]:
+        """
+        Compute skill match results for a batch of resumes.
+
+        Results follow the same rules as ``ResumeScorer.match_skills``.
+
+        Args:
+            resume_skills (Sequence[Iterable[str]]): Skills of each resume
+            jd_skills (List[str]): Skills from the job description
+
+        Returns:
+            List of (match score, matching skills, missing skills) tuples,
+            one per resume, with skills in the job description's casing
+        """
+        if not jd_skills:
+            return [(0.0, [], []) for _ in resume_skills]
+
+        vocabulary = self.batch_vocabulary()
+        # First original spelling of every distinct JD skill, in JD order
+        originals: Dict[int, str] = {}
+        for skill in jd_skills:
+            originals.setdefault(vocabulary.add(skill), skill)
+        jd_ids = np.fromiter(originals, dtype=np.int64, count=len(originals))
+        jd_names = list(originals.values())
+
+        matrix = self.build_matrix(resume_skills, vocabulary)
+        hits = matrix.contains(jd_ids)
+        if self.fuzzy_cutoff is not None:
+            hits |= self._fuzzy_hits(matrix, jd_ids, vocabulary)
+            counts = hits.sum(axis=1)
+        else:
+            counts = matrix.intersection_counts(jd_ids)
+
+        match_percentage = counts / len(jd_skills)
+        match_scores = np.minimum(
+            match_percentage + np.where(match_percentage == 1.0, 0.2, 0.0), 1.0
+        )
+
+        results = []
+        for row, score in zip(hits, match_scores):
+            matching = [name for name, hit in zip(jd_names, row) if hit]
+            missing = [name for name, hit in zip(jd_names, row) if not hit]
+            results.append((float(score), matching, missing))
+        return results
+
+    def _fuzzy_hits(
+        self, matrix: SkillMatrix, jd_ids: np.ndarray, vocabulary: SkillVocabulary
+    ) -> np.ndarray:
+        """
+        Fuzzy-match the skills of every document against the JD skills.
+
+        The distinct skills of the whole batch are compared with the JD
+        skills in a single ``fuzzy_matrix`` call.
+
+        Returns:
+            np.ndarray: Boolean matrix of shape (n_documents, len(jd_ids))
+        """
+        # Skills of any document in the batch, from the union of the bitsets
+        union = np.bitwise_or.reduce(matrix.bits, axis=0)
+        batch_ids = np.flatnonzero(
+            np.unpackbits(union.view(np.uint8), bitorder="little")
+        )
+        similar = fuzzy_matrix(
+            [vocabulary.name(skill_id) for skill_id in batch_ids],
+            [vocabulary.name(skill_id) for skill_id in jd_ids],
+            self.fuzzy_cutoff,
+        )
+        # Only skills similar to some JD skill matter for the per-document
+        # lookup; a document has a JD skill if any of its skills is similar
+        relevant = similar.any(axis=1)
+        present = matrix.contains(batch_ids[relevant])
+        return (present.astype(np.int32) @ similar[relevant].astype(np.int32)) > 0
+
+
+def _singular(word: str) -> str:
+    # Plural title words, as in "Web Developers" or "Data Technologies";
+    # words such as "analysis", "business" and "ops" stay as they are
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def title_words(title: str) -> FrozenSet[str]:
+    """Lowercased, singular words of a job title, without punctuation."""
+    return frozenset(
+        _singular(word) for word in _TITLE_WORD_RE.findall(str(title).lower())
+    )
+
+
+class TitleIndex:
+    """Job description titles compiled once for scoring many resumes.
+
+    Every JD title is stored as a word set, and an inverted index maps each
+    word to the JD titles containing it. Scoring a resume only looks at the
+    JD titles sharing a word with one of its titles, using set operations.
+    """
+
+    def __init__(self, jd_titles: Sequence[str]):
+        self.word_sets = [title_words(title) for title in jd_titles]
+        self._postings: Dict[str, List[int]] = {}
+        for position, words in enumerate(self.word_sets):
+            for word in words:
+                self._postings.setdefault(word, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.word_sets)
+
+    def best_matches(self, resume_titles: Iterable[str]) -> List[float]:
+        """
+        Best match of the resume's titles for every JD title.
+
+        Args:
+            resume_titles (Iterable[str]): Job titles from a resume
+
+        Returns:
+            List[float]: Per JD title, 1.0 if a resume title contains all of
+                its words, 0.5 if one shares some of them, else 0.0; words
+                are compared whole and in singular form (see ``title_words``)
+        """
+        best = [0.0] * len(self.word_sets)
+        for title in resume_titles:
+            words = title_words(title)
+            candidates = {
+                position for word in words for position in self._postings.get(word, ())
+            }
+            for position in candidates:
+                if self.word_sets[position] <= words:
+                    best[position] = 1.0
+                elif best[position] < 0.5:
+                    best[position] = 0.5
+        return best
+
+
+if __name__ == "__main__":
+    matcher = BulkSkillMatcher()
+    jd_skills = ["Python", "AWS", "Docker", "SQL"]
+    resumes = [
+        ["python", "Java", "Docker"],
+        ["Python", "AWS", "Docker", "SQL", "Kubernetes"],
+        [],
+    ]
+    for result in matcher.match(resumes, jd_skills):
+        print(result)
+
+    fuzzy_matcher = BulkSkillMatcher(fuzzy_cutoff=FUZZY_CUTOFF)
+    print(fuzzy_matcher.match([["ReactJS", "Node JS"]], ["React.js", "Node.js"]))
+
+    titles = TitleIndex(["Data Engineer", "Senior Software Engineer"])
+    print(titles.best_matches(["Sr. Data-Engineer", "Software Developer"]))
@@ -0,0 +1,549 @@
+import atexit
+import glob
+import logging
+import os
+import pickle
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import Tuple
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from fast regex stages to slow model loads
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = (1e4, 5e4, 1e5, 2.5e5, 5e5, 1e6, 2.5e6, 5e6, 1e7, 5e7)
+PAGES_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+# Directory through which the processes of a multi-worker server share their
+# counters and histograms; see enable_multiprocess
+MULTIPROCESS_DIR_ENV = "RESUME_ANALYZER_METRICS_DIR"
+# How often every process writes its counters and histograms to the directory
+SNAPSHOT_SECONDS = 5.0
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra=()) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs += [f'{name}="{_escape(value)}"' for name, value in extra]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base class for metrics rendered in the Prometheus text format."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        """Yield (suffix, formatted labels, value) for every sample."""
+        raise NotImplementedError
+
+    def expose(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines += [
+            f"{self.name}{suffix}{labels} {_format_value(value)}"
+            for suffix, labels, value in self.samples()
+        ]
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        if not self.labelnames:
+            self._values[()] = 0
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def snapshot(self) -> Dict[Tuple[str, ...], float]:
+        """Copy of the counts, to compute a ``delta`` from."""
+        with self._lock:
+            return dict(self._values)
+
+    def delta(self, since: Dict[Tuple[str, ...], float]) -> Dict:
+        """Counts added since ``snapshot`` returned ``since``."""
+        return {
+            key: value - since.get(key, 0)
+            for key, value in self.snapshot().items()
+            if value != since.get(key, 0)
+        }
+
+    def merge(self, delta: Dict[Tuple[str, ...], float]):
+        """Add counts recorded elsewhere, e.g. in a forked process."""
+        with self._lock:
+            for key, amount in delta.items():
+                self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield "", _format_labels(self.labelnames, key), value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be computed when scraped."""
+
+    type_name = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        if not self.labelnames:
+            self._values[()] = 0
+        self._functions: Dict[Tuple[str, ...], Callable[[], float]] = {}
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float], **labels):
+        """Compute the gauge value by calling ``function`` at scrape time."""
+        self._functions[self._key(labels)] = function
+
+    def value(self, **labels) -> float:
+        key = self._key(labels)
+        if key in self._functions:
+            return self._functions[key]()
+        return self._values.get(key, 0)
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            if key not in self._functions:
+                yield "", _format_labels(self.labelnames, key), value
+        for key, function in list(self._functions.items()):
+            try:
+                value = function()
+            except Exception as e:
+                logger.warning(f"Could not compute gauge {self.name}: {e}")
+                continue
+            yield "", _format_labels(self.labelnames, key), value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the ``with`` block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def snapshot(self) -> Dict[Tuple[str, ...], Tuple[List[int], float]]:
+        """Copy of the bucket counts and sums, to compute a ``delta`` from."""
+        with self._lock:
+            return {
+                key: (list(counts), self._sums[key])
+                for key, counts in self._counts.items()
+            }
+
+    def delta(self, since: Dict[Tuple[str, ...], Tuple[List[int], float]]) -> Dict:
+        """Observations added since ``snapshot`` returned ``since``."""
+        empty = ([0] * len(self.buckets), 0.0)
+        delta = {}
+        for key, (counts, total) in self.snapshot().items():
+            before, before_total = since.get(key, empty)
+            added = [count - old for count, old in zip(counts, before)]
+            if any(added):
+                delta[key] = (added, total - before_total)
+        return delta
+
+    def merge(self, delta: Dict[Tuple[str, ...], Tuple[List[int], float]]):
+        """Add observations recorded elsewhere, e.g. in a forked process."""
+        with self._lock:
+            for key, (added, total) in delta.items():
+                counts = self._counts.setdefault(key, [0] * len(self.buckets))
+                for i, count in enumerate(added):
+                    counts[i] += count
+                self._sums[key] = self._sums.get(key, 0.0) + total
+
+    def samples(self):
+        with self._lock:
+            items = [(key, list(counts)) for key, counts in self._counts.items()]
+            sums = dict(self._sums)
+        for key, counts in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = _format_labels(
+                    self.labelnames, key, extra=[("le", _format_value(bound))]
+                )
+                yield "_bucket", labels, cumulative
+            labels = _format_labels(self.labelnames, key)
+            yield "_sum", labels, sums[key]
+            yield "_count", labels, cumulative
+
+
+MetricType = TypeVar("MetricType", bound=_Metric)
+
+
+class Registry:
+    """Collection of metrics exposed together on one endpoint."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: MetricType) -> MetricType:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def expose(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        return "\n".join(metric.expose() for metric in self._metrics.values()) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy of every counter and histogram, to compute a ``delta`` from.
+
+        Gauges describe the state of one process, e.g. its memory or queue,
+        so they are neither snapshotted nor merged.
+        """
+        return {
+            name: metric.snapshot()
+            for name, metric in self._metrics.items()
+            if isinstance(metric, (Counter, Histogram))
+        }
+
+    def delta(self, since: Dict[str, Any]) -> Dict[str, Any]:
+        """What the counters and histograms recorded since ``snapshot``.
+
+        An empty ``since`` gives everything they recorded.
+        """
+        delta = {}
+        for name, metric in self._metrics.items():
+            if not isinstance(metric, (Counter, Histogram)):
+                continue
+            changes = metric.delta(since.get(name, {}))
+            if changes:
+                delta[name] = changes
+        return delta
+
+    def merge(self, delta: Dict[str, Any]):
+        """Add a ``delta`` recorded in another process to these metrics."""
+        for name, changes in delta.items():
+            if name in self._metrics:
+                self._metrics[name].merge(changes)
+
+    def expose_merged(self, deltas: Iterable[Dict[str, Any]]) -> str:
+        """Render the sum of ``deltas`` as the counters and histograms.
+
+        Gauges are rendered with the values of this process.
+        """
+        merged = Registry()
+        for name, metric in self._metrics.items():
+            if isinstance(metric, Counter):
+                metric = Counter(metric.name, metric.documentation, metric.labelnames)
+            elif isinstance(metric, Histogram):
+                metric = Histogram(
+                    metric.name,
+                    metric.documentation,
+                    metric.labelnames,
+                    buckets=metric.buckets[:-1],
+                )
+            merged._metrics[name] = metric
+        for delta in deltas:
+            merged.merge(delta)
+        return merged.expose()
+
+
+REGISTRY = Registry()
+
+STAGE_SECONDS = REGISTRY.register(
+    Histogram(
+        "resume_analyzer_stage_seconds",
+        "Time spent in each pipeline stage.",
+        ["stage"],
+    )
+)
+STAGE_ERRORS = REGISTRY.register(
+    Counter(
+        "resume_analyzer_stage_errors_total",
+        "Pipeline stages that raised an exception.",
+        ["stage"],
+    )
+)
+DOCUMENTS = REGISTRY.register(
+    Counter(
+        "resume_analyzer_documents_total",
+        "Documents parsed, by format and outcome.",
+        ["format", "status"],
+    )
+)
+DOCUMENT_BYTES = REGISTRY.register(
+    Histogram(
+        "resume_analyzer_document_bytes",
+        "Size of parsed documents in bytes.",
+        ["format"],
+        buckets=BYTES_BUCKETS,
+    )
+)
+DOCUMENT_PAGES = REGISTRY.register(
+    Histogram(
+        "resume_analyzer_document_pages",
+        "Number of pages of parsed PDF documents.",
+        buckets=PAGES_BUCKETS,
+    )
+)
+CACHE_REQUESTS = REGISTRY.register(
+    Counter(
+        "resume_analyzer_cache_requests_total",
+        "Cache lookups, by cache and result (hit or miss).",
+        ["cache", "result"],
+    )
+)
+DUPLICATES = REGISTRY.register(
+    Counter(
+        "resume_analyzer_duplicates_total",
+        "Resumes that reused the scores of a near-duplicate instead of being scored.",
+    )
+)
+CASCADE = REGISTRY.register(
+    Counter(
+        "resume_analyzer_cascade_resumes_total",
+        "Resumes scored in cascade mode, by the stage they reached (full or partial).",
+        ["stage"],
+    )
+)
+ISOLATION_FAILURES = REGISTRY.register(
+    Counter(
+        "resume_analyzer_isolation_failures_total",
+        "Documents whose isolated worker failed, by reason (e.g. cpu_time, memory).",
+        ["reason"],
+    )
+)
+MODEL_MEMORY = REGISTRY.register(
+    Gauge(
+        "resume_analyzer_model_memory_bytes",
+        "Resident memory added by loading each model.",
+        ["model"],
+    )
+)
+QUEUE_DEPTH = REGISTRY.register(
+    Gauge(
+        "resume_analyzer_queue_depth",
+        "Documents accepted for processing that have not been parsed yet.",
+    )
+)
+IN_PROGRESS = REGISTRY.register(
+    Gauge(
+        "resume_analyzer_requests_in_progress",
+        "Upload requests currently being processed.",
+    )
+)
+PIPELINE_UTILIZATION = REGISTRY.register(
+    Gauge(
+        "resume_analyzer_pipeline_stage_utilization",
+        "Fraction of its workers' time each pipeline stage spent working, last run.",
+        ["stage"],
+    )
+)
+RESIDENT_MEMORY = REGISTRY.register(
+    Gauge(
+        "resume_analyzer_process_resident_memory_bytes",
+        "Resident memory of this process.",
+    )
+)
+
+
+# Set by enable_multiprocess: the shared directory, and the snapshot of what
+# this process inherited, which is not counted again
+_multiprocess_dir: Optional[str] = None
+_inherited: Dict[str, Any] = {}
+
+
+def _snapshot_path(directory: str, pid: int) -> str:
+    return os.path.join(directory, f"{pid}.pickle")
+
+
+def write_snapshot(directory: str, since: Optional[Dict[str, Any]] = None):
+    """Write what this process recorded since ``since`` to ``directory``."""
+    path = _snapshot_path(directory, os.getpid())
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        pickle.dump(REGISTRY.delta(since or {}), f)
+    os.replace(temporary, path)
+
+
+def _write_periodically():
+    while True:
+        time.sleep(SNAPSHOT_SECONDS)
+        try:
+            write_snapshot(_multiprocess_dir, _inherited)
+        except OSError as e:
+            logger.warning(f"Could not write metrics snapshot: {e}")
+
+
+def enable_multiprocess(directory: str):
+    """Share this process's counters and histograms with the other workers.
+
+    Call in every worker right after it is forked. The worker writes what
+    it records to ``directory`` every ``SNAPSHOT_SECONDS`` and on exit, and
+    ``expose`` then adds up the files of all processes, so every worker
+    answers a scrape with the totals of the whole server. Snapshots of exited
+    workers are kept, so the totals never go down. Values inherited from the
+    master are left out; the master writes those itself with
+    ``write_snapshot`` before forking.
+    """
+    global _multiprocess_dir, _inherited
+    os.makedirs(directory, exist_ok=True)
+    _multiprocess_dir = directory
+    _inherited = REGISTRY.snapshot()
+    threading.Thread(
+        target=_write_periodically, name="metrics-snapshot", daemon=True
+    ).start()
+    atexit.register(write_snapshot, directory, _inherited)
+
+
+def clear_multiprocess(directory: str):
+    """Remove the snapshots of an earlier run of the server."""
+    for path in glob.glob(os.path.join(directory, "*.pickle")):
+        os.remove(path)
+
+
+def expose() -> str:
+    """Metrics in the Prometheus text format, of all workers if shared."""
+    if _multiprocess_dir is None:
+        return REGISTRY.expose()
+    own = _snapshot_path(_multiprocess_dir, os.getpid())
+    deltas = [REGISTRY.delta(_inherited)]
+    for path in glob.glob(os.path.join(_multiprocess_dir, "*.pickle")):
+        if path == own:
+            continue
+        try:
+            with open(path, "rb") as f:
+                deltas.append(pickle.load(f))
+        except (OSError, EOFError, pickle.UnpicklingError) as e:
+            logger.warning(f"Could not read metrics snapshot {path}: {e}")
+    return REGISTRY.expose_merged(deltas)
+
+
+def resident_memory_bytes() -> int:
+    """Current resident set size of this process, or 0 if unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+RESIDENT_MEMORY.set_function(resident_memory_bytes)
+
+
+@contextmanager
+def stage(name: str):
+    """Time a pipeline stage and count it as failed if it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        STAGE_ERRORS.inc(stage=name)
+        raise
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage=name)
+
+
+@contextmanager
+def track_model_memory(model: str):
+    """Record the resident memory added while loading a model."""
+    before = resident_memory_bytes()
+    yield
+    MODEL_MEMORY.set(max(0, resident_memory_bytes() - before), model=model)
+
+
+def record_cache(cache: str, hit: bool):
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def observe_document(path: str, status: str, size: Optional[int] = None):
+    """Count a parsed document and record its size."""
+    fmt = os.path.splitext(path)[1].lstrip(".").lower() or "unknown"
+    DOCUMENTS.inc(format=fmt, status=status)
+    if size is not None:
+        DOCUMENT_BYTES.observe(size, format=fmt)
+
+
+if __name__ == "__main__":
+    with stage("parse"):
+        time.sleep(0.01)
+    record_cache("job_description", hit=False)
+    print(REGISTRY.expose())
@@ -0,0 +1,94 @@
+"""Loading and one-time setup of the NLP models used by the pipeline.
+
+Models are never downloaded implicitly. Run the setup step once per
+environment (e.g. in the Docker build or after ``poetry install``):
+
+    python -m resume_analyzer.models
+"""
+
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+SPACY_MODEL = "en_core_web_sm"
+SBERT_MODEL = "all-MiniLM-L6-v2"
+
+
+class ModelNotInstalledError(RuntimeError):
+    """Raised when a required model has not been installed by the setup step."""
+
+
+def load_spacy(name: str = SPACY_MODEL):
+    """
+    Load a spaCy pipeline, importing spaCy on first use.
+
+    Args:
+        name (str): Name of an installed spaCy pipeline package
+
+    Returns:
+        spacy.language.Language: The loaded pipeline
+    """
+    import spacy
+
+    try:
+        return spacy.load(name)
+    except OSError as e:
+        raise ModelNotInstalledError(
+            f"spaCy model '{name}' is not installed. "
+            "Run `python -m resume_analyzer.models` to download it."
+        ) from e
+
+
+def load_sentence_transformer(
+    name: str = SBERT_MODEL,
+    quantize: bool = False,
+    num_threads: Optional[int] = None,
+):
+    """
+    Load a sentence-transformer model, importing torch on first use.
+
+    Args:
+        name (str): sentence-transformers model name
+        quantize (bool): Replace the Linear layers with int8 dynamically
+            quantized ones; the quantized model runs on CPU only
+        num_threads (int): torch intra-op thread count for this process
+
+    Returns:
+        SentenceTransformer: The loaded model
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    if num_threads:
+        torch.set_num_threads(num_threads)
+    if not quantize:
+        return SentenceTransformer(name)
+
+    model = SentenceTransformer(name, device="cpu")
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
+
+
+def download_models(spacy_model: str = SPACY_MODEL, sbert_model: str = SBERT_MODEL):
+    """Download the spaCy pipeline and cache the sentence-transformer weights."""
+    import spacy
+    from spacy.cli import download
+
+    try:
+        spacy.load(spacy_model)
+        logger.info(f"spaCy model {spacy_model} is already installed")
+    except OSError:
+        logger.info(f"Downloading spaCy model {spacy_model}")
+        download(spacy_model)
+
+    from sentence_transformers import SentenceTransformer
+
+    logger.info(f"Caching sentence-transformer model {sbert_model}")
+    SentenceTransformer(sbert_model)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    download_models()
@@ -0,0 +1,326 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional
+from typing import Tuple
+
+from resume_analyzer import metrics
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the items on a queue
+_DONE = object()
+# How often blocked stages check whether the pipeline was stopped, in seconds
+_POLL_SECONDS = 0.05
+
+Item = Tuple[Hashable, Any]
+
+
+@dataclass
+class Stage:
+    """One step of a ``Pipeline`` and how it is executed.
+
+    ``kind`` is one of:
+
+    - ``"process"``: ``function(key, payload)`` runs in a pool of ``workers``
+      processes, for CPU-bound work such as PDF parsing or spaCy
+    - ``"thread"``: the same in a pool of ``workers`` threads, for I/O
+    - ``"batch"``: ``function(keys, payloads)`` runs in one thread on up to
+      ``batch_size`` items at a time and returns one result per item, for
+      models that are faster on batches, such as SBERT
+
+    Functions of process stages must be picklable (module level). A result
+    of None, or an exception, marks the item as failed; failed items skip
+    the remaining stages.
+    """
+
+    name: str
+    function: Callable
+    kind: str = "thread"
+    workers: int = 1
+    batch_size: int = 32
+    # Longest a batch waits for more items before it runs anyway
+    max_wait: float = 0.05
+    initializer: Optional[Callable] = None
+    initargs: tuple = ()
+
+
+@dataclass
+class StageStats:
+    """Where the time of one stage went, to size its pool."""
+
+    workers: int
+    items: int = 0
+    failed: int = 0
+    # Time spent running the stage function, summed over workers
+    busy_seconds: float = 0.0
+    # Time spent waiting for room in the downstream queue (backpressure)
+    blocked_seconds: float = 0.0
+    # Time spent waiting for input from the upstream queue
+    starved_seconds: float = 0.0
+    started: float = field(default_factory=time.perf_counter)
+    finished: Optional[float] = None
+
+    def utilization(self) -> float:
+        """Fraction of the stage's worker time spent running its function."""
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        if elapsed <= 0:
+            return 0.0
+        return min(1.0, self.busy_seconds / (elapsed * self.workers))
+
+
+def _timed(function: Callable, *args) -> Tuple[Any, float, Optional[str]]:
+    """Run a stage function, returning (result, seconds, error)."""
+    start = time.perf_counter()
+    try:
+        result, error = function(*args), None
+    except Exception as e:
+        result, error = None, repr(e)
+    return result, time.perf_counter() - start, error
+
+
+class Pipeline:
+    """Runs items through stages concurrently, connected by bounded queues.
+
+    Every stage has its own pool, so e.g. parsing, extraction and embedding
+    of different documents overlap. A stage whose downstream queue is full
+    blocks, which in turn fills its own input queue, so a slow stage throttles
+    the ones before it instead of letting work pile up in memory.
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 64):
+        """
+        Args:
+            stages (List[Stage]): Stages in order
+            queue_size (int): Capacity of the queue in front of every stage
+        """
+        for stage in stages:
+            if stage.kind not in ("process", "thread", "batch"):
+                raise ValueError(f"Unknown stage kind {stage.kind!r} in {stage.name}")
+        self.stages = stages
+        self.queue_size = queue_size
+        self.stats: Dict[str, StageStats] = {}
+        self._stop = threading.Event()
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """Items, failures, utilization and wait times of every stage."""
+        return {
+            name: {
+                "workers": stats.workers,
+                "items": stats.items,
+                "failed": stats.failed,
+                "utilization": round(stats.utilization(), 3),
+                "busy_seconds": round(stats.busy_seconds, 3),
+                "blocked_seconds": round(stats.blocked_seconds, 3),
+                "starved_seconds": round(stats.starved_seconds, 3),
+            }
+            for name, stats in self.stats.items()
+        }
+
+    def run(self, items: Iterable[Item]) -> Iterator[Tuple[Hashable, Any]]:
+        """
+        Run (key, payload) items through all stages.
+
+        Args:
+            items (Iterable): (key, payload) pairs; read only as fast as the
+                first stage accepts them
+
+        Returns:
+            Iterator of (key, result) in completion order; result is None for
+            items that failed in any stage
+        """
+        self._stop.clear()
+        self.stats = {
+            stage.name: StageStats(1 if stage.kind == "batch" else stage.workers)
+            for stage in self.stages
+        }
+        queues = [queue.Queue(self.queue_size) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(target=self._feed, args=(items, queues[0]))]
+        executors: List[Executor] = []
+        for stage, inbox, outbox in zip(self.stages, queues, queues[1:]):
+            stats = self.stats[stage.name]
+            if stage.kind == "batch":
+                target, args = self._run_batches, (stage, stats, inbox, outbox)
+            else:
+                pool = (
+                    ProcessPoolExecutor
+                    if stage.kind == "process"
+                    else ThreadPoolExecutor
+                )
+                executor = pool(
+                    stage.workers,
+                    initializer=stage.initializer,
+                    initargs=stage.initargs,
+                )
+                executors.append(executor)
+                target, args = self._run_pool, (stage, stats, executor, inbox, outbox)
+            threads.append(
+                threading.Thread(target=target, args=args, name=stage.name, daemon=True)
+            )
+
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                item = self._get(queues[-1])
+                if item is _DONE or item is None:
+                    break
+                yield item
+        finally:
+            # Also reached when the consumer stops early
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+            for executor in executors:
+                executor.shutdown(cancel_futures=True)
+            for name, stats in self.stats.items():
+                metrics.PIPELINE_UTILIZATION.set(stats.utilization(), stage=name)
+
+    def _get(self, inbox: queue.Queue, stats: Optional[StageStats] = None):
+        """Next item, _DONE at the end, or None once the pipeline is stopped."""
+        start = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                try:
+                    return inbox.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    continue
+            return None
+        finally:
+            if stats is not None:
+                stats.starved_seconds += time.perf_counter() - start
+
+    def _put(self, outbox: queue.Queue, item, stats: Optional[StageStats] = None):
+        start = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                try:
+                    outbox.put(item, timeout=_POLL_SECONDS)
+                    return
+                except queue.Full:
+                    continue
+        finally:
+            if stats is not None:
+                stats.blocked_seconds += time.perf_counter() - start
+
+    def _feed(self, items: Iterable[Item], outbox: queue.Queue):
+        for item in items:
+            if self._stop.is_set():
+                return
+            self._put(outbox, item)
+        self._put(outbox, _DONE)
+
+    def _finish(self, stage, stats, key, result, seconds, error, outbox):
+        stats.items += 1
+        stats.busy_seconds += seconds
+        if error is not None:
+            logger.error(f"Stage {stage.name} failed for {key}: {error}")
+        if result is None:
+            stats.failed += 1
+        self._put(outbox, (key, result), stats)
+
+    def _run_pool(self, stage, stats, executor, inbox, outbox):
+        in_flight: Dict[Future, Hashable] = {}
+
+        def forward(timeout: Optional[float]):
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = in_flight.pop(future)
+                try:
+                    result, seconds, error = future.result()
+                except Exception as e:  # e.g. a worker process died
+                    result, seconds, error = None, 0.0, repr(e)
+                self._finish(stage, stats, key, result, seconds, error, outbox)
+
+        while not self._stop.is_set():
+            try:
+                item = inbox.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                # Pass on finished results while waiting for input
+                if in_flight:
+                    forward(timeout=0)
+                stats.starved_seconds += _POLL_SECONDS
+                continue
+            if item is _DONE:
+                break
+            key, payload = item
+            if payload is None:
+                self._put(outbox, item, stats)
+                continue
+            # Never submit more than the pool can run, so that waiting work
+            # stays in the bounded queue
+            while len(in_flight) >= stage.workers and not self._stop.is_set():
+                forward(timeout=_POLL_SECONDS)
+            in_flight[executor.submit(_timed, stage.function, key, payload)] = key
+
+        while in_flight and not self._stop.is_set():
+            forward(timeout=_POLL_SECONDS)
+        stats.finished = time.perf_counter()
+        self._put(outbox, _DONE)
+
+    def _run_batches(self, stage, stats, inbox, outbox):
+        done = False
+        while not done:
+            item = self._get(inbox, stats)
+            if item is None:
+                return
+            if item is _DONE:
+                break
+            batch = [item]
+            deadline = time.perf_counter() + stage.max_wait
+            while len(batch) < stage.batch_size:
+                try:
+                    item = inbox.get(timeout=max(0.0, deadline - time.perf_counter()))
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(item)
+
+            for key, payload in batch:
+                if payload is None:
+                    self._put(outbox, (key, None), stats)
+            batch = [(key, payload) for key, payload in batch if payload is not None]
+            if not batch:
+                continue
+            keys = [key for key, _ in batch]
+            results, seconds, error = _timed(
+                stage.function, keys, [payload for _, payload in batch]
+            )
+            if results is None:
+                results = [None] * len(batch)
+            for key, result in zip(keys, results):
+                self._finish(
+                    stage, stats, key, result, seconds / len(keys), error, outbox
+                )
+
+        stats.finished = time.perf_counter()
+        self._put(outbox, _DONE)
+
+
+def _square(key, value):
+    time.sleep(0.01)
+    return value * value
+
+
+if __name__ == "__main__":
+    pipeline = Pipeline(
+        [
+            Stage("square", _square, kind="process", workers=4),
+            Stage("sum", lambda keys, values: [v + 1 for v in values], kind="batch"),
+        ],
+        queue_size=8,
+    )
+    print(sorted(pipeline.run((i, i) for i in range(20))))
+    print(pipeline.report())
@@ -1,26 +1,37 @@
 import re
 import unicodedata
 
-from bs4 import BeautifulSoup
-import spacy
-from spacy.lang.en import English
-import contractions
-from datetime import datetime
-from spacy.cli import download
-
-
-try:
-    spacy.load("en_core_web_sm")
-except OSError:
-    download("en_core_web_sm")
+from resume_analyzer import metrics
+from resume_analyzer.models import load_spacy
 
 
 class TextCleaner:
-    """A class for cleaning and processing text data."""
+    """A class for cleaning and processing text data.
+
+    spaCy, BeautifulSoup and contractions are imported, and the spaCy model
+    loaded, the first time they are needed rather than at import time.
+    """
 
     def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
-        self.tokenizer = English().tokenizer
+        self._nlp = None
+        self._tokenizer = None
+
+    @property
+    def nlp(self):
+        """spaCy pipeline used for stop word removal, loaded on first use."""
+        if self._nlp is None:
+            with metrics.track_model_memory("spacy_cleaner"):
+                self._nlp = load_spacy()
+        return self._nlp
+
+    @property
+    def tokenizer(self):
+        """Blank English spaCy tokenizer, created on first use."""
+        if self._tokenizer is None:
+            from spacy.lang.en import English
+
+            self._tokenizer = English().tokenizer
+        return self._tokenizer
 
     def lowercase_text(self, text):
         """Converts the given text to lowercase.
@@ -38,6 +49,8 @@ class TextCleaner:
         :returns: str: The cleaned string without HTML tags.
 
         """
+        from bs4 import BeautifulSoup
+
         return BeautifulSoup(text, "html.parser").get_text()
 
     def remove_accented_chars_func(self, text):
@@ -100,6 +113,8 @@ class TextCleaner:
         :returns: str: The string with expanded contractions.
 
         """
+        import contractions
+
         return contractions.fix(text)
 
     def tokenize(self, text):
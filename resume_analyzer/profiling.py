@@ -0,0 +1,182 @@
+import cProfile
+import io
+import logging
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Allocations made by the profiler itself are left out of the report
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+# Stages being profiled in any thread; tracemalloc is process-wide, so it is
+# only stopped when the last of them ends, and only if a profiler started it
+_tracing_lock = threading.Lock()
+_tracing_stages = 0
+_started_tracing = False
+
+
+def _start_tracing(frames: int):
+    global _tracing_stages, _started_tracing
+    with _tracing_lock:
+        if _tracing_stages == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            _started_tracing = True
+        _tracing_stages += 1
+
+
+def _stop_tracing():
+    global _tracing_stages, _started_tracing
+    with _tracing_lock:
+        _tracing_stages -= 1
+        if _tracing_stages == 0 and _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
+
+
+class StageProfile:
+    """CPU profile and memory statistics collected for one pipeline stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.profile = cProfile.Profile()
+        self.wall_seconds = 0.0
+        self.peak_bytes = 0
+        # Growth in bytes and blocks of every allocation site, summed over runs
+        self.allocations: Dict[tracemalloc.Traceback, List[int]] = {}
+
+    def add_allocations(self, diffs: List[tracemalloc.StatisticDiff]):
+        """Add the allocation growth of one run of the stage."""
+        for diff in diffs:
+            if diff.size_diff or diff.count_diff:
+                growth = self.allocations.setdefault(diff.traceback, [0, 0])
+                growth[0] += diff.size_diff
+                growth[1] += diff.count_diff
+
+    def top_allocations(self, top: int) -> List[Tuple[tracemalloc.Traceback, int, int]]:
+        """(site, bytes, blocks) of the sites that grew or shrank the most."""
+        sites = sorted(
+            self.allocations.items(), key=lambda item: abs(item[1][0]), reverse=True
+        )
+        return [(site, size, count) for site, (size, count) in sites[:top]]
+
+
+class PipelineProfiler:
+    """Profiles the pipeline stages of a single document.
+
+    Each stage gets its own cProfile profile and a tracemalloc peak memory
+    measurement, with the allocation sites that grew the most while the stage
+    ran. Stages that run more than once (e.g. parsing the resume and the job
+    description) are accumulated.
+
+    tracemalloc traces the whole process, so the peaks of stages profiled at
+    the same time in other threads include each other's allocations.
+    """
+
+    def __init__(self, top: int = 25, frames: int = 10):
+        """
+        Args:
+            top (int): Number of functions and allocation sites to report
+            frames (int): Traceback depth recorded by tracemalloc
+        """
+        self.top = top
+        self.frames = frames
+        self.stages: Dict[str, StageProfile] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """Profile the ``with`` block as part of the named stage."""
+        stage = self.stages.setdefault(name, StageProfile(name))
+
+        _start_tracing(self.frames)
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        before = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+        start = time.perf_counter()
+        stage.profile.enable()
+        try:
+            yield
+        finally:
+            stage.profile.disable()
+            stage.wall_seconds += time.perf_counter() - start
+
+            _, peak = tracemalloc.get_traced_memory()
+            stage.peak_bytes = max(stage.peak_bytes, peak - baseline)
+            after = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+            stage.add_allocations(after.compare_to(before, "lineno"))
+            _stop_tracing()
+
+    def report(self, document: str = "") -> str:
+        """
+        Render a plain text report of all stages.
+
+        Args:
+            document (str): Name of the profiled document, used in the title
+
+        Returns:
+            str: Report with the top functions and allocation sites per stage
+        """
+        out = io.StringIO()
+        out.write(f"Profile report for {document}\n\n" if document else "")
+        out.write(f"{'stage':<12} {'wall (s)':>10} {'peak (MiB)':>12}\n")
+        for stage in self.stages.values():
+            out.write(
+                f"{stage.name:<12} {stage.wall_seconds:>10.3f} "
+                f"{stage.peak_bytes / 2**20:>12.2f}\n"
+            )
+
+        for stage in self.stages.values():
+            out.write(f"\n=== {stage.name} ===\n")
+            out.write(f"\nTop {self.top} functions by cumulative time:\n")
+            stats = pstats.Stats(stage.profile, stream=out)
+            stats.strip_dirs().sort_stats("cumulative").print_stats(self.top)
+
+            out.write(f"Top {self.top} allocation sites by growth:\n")
+            for site, size, count in stage.top_allocations(self.top):
+                frame = site[0]
+                out.write(
+                    f"  {frame.filename}:{frame.lineno}: "
+                    f"{size / 1024:+.1f} KiB, {count:+d} blocks\n"
+                )
+        return out.getvalue()
+
+    def write_report(self, directory: str, document: str) -> Path:
+        """
+        Write the text report and one pstats file per stage.
+
+        Args:
+            directory (str): Output directory, created if missing
+            document (str): Path or name of the profiled document
+
+        Returns:
+            Path: Path of the text report
+        """
+        output = Path(directory)
+        output.mkdir(parents=True, exist_ok=True)
+        name = Path(document).name
+
+        for stage in self.stages.values():
+            stage.profile.dump_stats(str(output / f"{name}.{stage.name}.prof"))
+
+        report_path = output / f"{name}.profile.txt"
+        report_path.write_text(self.report(document))
+        logger.info(f"Wrote profile report to {report_path}")
+        return report_path
+
+
+if __name__ == "__main__":
+    profiler = PipelineProfiler(top=5)
+    with profiler.stage("build"):
+        data = [str(i) * 10 for i in range(100000)]
+    with profiler.stage("sort"):
+        data = sorted(data)
+    print(profiler.report("example"))
@@ -0,0 +1,157 @@
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+# Component scores combined into the total score, in matrix column order
+COMPONENTS = (
+    "skills_match",
+    "experience_match",
+    "education_match",
+    "job_title_relevance",
+    "overall_similarity",
+)
+
+DEFAULT_WEIGHTS = {
+    "skills_match": 0.6,
+    "experience_match": 0.0,
+    "education_match": 0.15,
+    "job_title_relevance": 0.15,
+    "overall_similarity": 0.1,
+}
+
+
+def weight_vector(weights: Mapping[str, float]) -> np.ndarray:
+    """
+    Convert a weights dict into a vector in ``COMPONENTS`` order.
+
+    Components missing from ``weights`` get a weight of 0.
+
+    Args:
+        weights (Mapping[str, float]): Weight per component
+
+    Returns:
+        np.ndarray: float32 vector of length ``len(COMPONENTS)``
+    """
+    unknown = set(weights) - set(COMPONENTS)
+    if unknown:
+        raise ValueError(f"Unknown score components: {', '.join(sorted(unknown))}")
+    return np.array(
+        [float(weights.get(component, 0.0)) for component in COMPONENTS],
+        dtype=np.float32,
+    )
+
+
+def component_vector(scores: Mapping[str, float]) -> np.ndarray:
+    """Extract the component scores of one resume as a float32 vector."""
+    return np.array(
+        [float(scores.get(component) or 0.0) for component in COMPONENTS],
+        dtype=np.float32,
+    )
+
+
+def total_score(scores: Mapping[str, float], weights: Mapping[str, float]) -> float:
+    """Weighted sum of the component scores of one resume."""
+    weight_vector(weights)  # validates the component names
+    return sum(
+        float(scores.get(component) or 0.0) * weight
+        for component, weight in weights.items()
+    )
+
+
+class ScoreMatrix:
+    """Component scores of many resumes, one compact float32 row per resume.
+
+    Re-ranking with new weights is a single matrix-vector product, so no
+    document has to be parsed or scored again. Adding and ranking are safe
+    from concurrent request threads.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self._lock = threading.Lock()
+        self.ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._rows = np.zeros((capacity, len(COMPONENTS)), dtype=np.float32)
+
+    @classmethod
+    def from_results(cls, results: Mapping[str, Mapping[str, float]]) -> "ScoreMatrix":
+        """Build a matrix from a mapping of resume ID to score dict."""
+        matrix = cls(capacity=max(1, len(results)))
+        matrix.add_many(results.items())
+        return matrix
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, resume_id: str) -> bool:
+        return resume_id in self._positions
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """View of the filled rows, shape (n_resumes, len(COMPONENTS))."""
+        return self._rows[: len(self.ids)]
+
+    def add(self, resume_id: str, scores: Mapping[str, float]):
+        """Store or replace the component scores of a resume."""
+        self.add_many([(resume_id, scores)])
+
+    def add_many(self, items: Iterable[Tuple[str, Mapping[str, float]]]):
+        rows = [(resume_id, component_vector(scores)) for resume_id, scores in items]
+        with self._lock:
+            for resume_id, row in rows:
+                position = self._positions.get(resume_id)
+                if position is None:
+                    position = len(self.ids)
+                    if position == len(self._rows):
+                        self._rows = np.concatenate(
+                            [self._rows, np.zeros_like(self._rows)]
+                        )
+                    self.ids.append(resume_id)
+                    self._positions[resume_id] = position
+                self._rows[position] = row
+
+    def totals(self, weights: Mapping[str, float]) -> np.ndarray:
+        """Total score of every resume under the given weights."""
+        with self._lock:
+            return self.matrix @ weight_vector(weights)
+
+    def rerank(
+        self, weights: Mapping[str, float], top: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Order all resumes by their total score under new weights.
+
+        Args:
+            weights (Mapping[str, float]): Weight per component
+            top (int): Only return the best ``top`` resumes
+
+        Returns:
+            List of (resume ID, total score), best first; ties keep insertion order
+        """
+        vector = weight_vector(weights)
+        with self._lock:
+            totals = self.matrix @ vector
+            ids = list(self.ids)
+        if top is not None and top < len(totals):
+            # Everything better than the top-th total, then the earliest ties
+            # with it, so ties at the cut-off also keep insertion order
+            cutoff = np.partition(totals, len(totals) - top)[len(totals) - top]
+            better = np.flatnonzero(totals > cutoff)
+            tied = np.flatnonzero(totals == cutoff)[: top - len(better)]
+            candidates = np.concatenate([better, tied])
+        else:
+            candidates = np.arange(len(totals))
+        order = candidates[np.lexsort((candidates, -totals[candidates]))]
+        return [(ids[i], float(totals[i])) for i in order]
+
+
+if __name__ == "__main__":
+    matrix = ScoreMatrix.from_results(
+        {
+            "alice.pdf": {"skills_match": 0.9, "overall_similarity": 0.4},
+            "bob.pdf": {"skills_match": 0.5, "education_match": 1.0},
+            "carol.pdf": {"skills_match": 0.7, "job_title_relevance": 1.0},
+        }
+    )
+    print(matrix.rerank(DEFAULT_WEIGHTS))
+    print(matrix.rerank({"education_match": 1.0, "skills_match": 0.2}, top=2))
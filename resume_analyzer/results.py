@@ -0,0 +1,148 @@
+import json
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+
+def _intern_all(values: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    # Skill names repeat across every resume scored against the same job
+    # description; interning keeps a single copy of each
+    return tuple(sys.intern(str(value)) for value in values or ())
+
+
+@dataclass(slots=True)
+class Contact:
+    """Contact details extracted from a resume."""
+
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    location: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Optional[Mapping[str, Any]]) -> "Contact":
+        data = data or {}
+        return cls(data.get("email"), data.get("phone"), data.get("location"))
+
+
+@dataclass(slots=True)
+class ScoreResult:
+    """Scores of one resume against one job description.
+
+    Holds only what is needed to rank and display a result. The rendered
+    NER HTML is kept out of the record; see ``HtmlStore``. Read access by
+    key (``result["total_score"]``) is supported for code written against
+    the score dicts this record replaces.
+    """
+
+    skills_match: float = 0.0
+    experience_match: float = 0.0
+    education_match: float = 0.0
+    job_title_relevance: float = 0.0
+    overall_similarity: float = 0.0
+    total_score: float = 0.0
+    matching_skills: Tuple[str, ...] = ()
+    missing_skills: Tuple[str, ...] = ()
+    contact: Contact = field(default_factory=Contact)
+    # Set when only the cascade screening components were computed
+    partial: bool = False
+    # Path of the near-duplicate resume whose scores were reused, if any
+    duplicate_of: Optional[str] = None
+
+    def __post_init__(self):
+        self.matching_skills = _intern_all(self.matching_skills)
+        self.missing_skills = _intern_all(self.missing_skills)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _FIELD_NAMES:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in _FIELD_NAMES else default
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ScoreResult":
+        """
+        Build a record from a score dict; unknown keys such as NER HTML are dropped.
+
+        Args:
+            data (Mapping): Scores as produced by ``to_dict`` or by older
+                versions of ``ResumeScorer``
+
+        Returns:
+            ScoreResult: The compact record
+        """
+        values = {
+            name: data[name]
+            for name in _FIELD_NAMES
+            if name != "contact" and data.get(name) is not None
+        }
+        return cls(**values, contact=Contact.from_dict(data.get("contact")))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of JSON-serializable values."""
+        data = asdict(self)
+        data["matching_skills"] = list(self.matching_skills)
+        data["missing_skills"] = list(self.missing_skills)
+        return data
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, text: str) -> "ScoreResult":
+        return cls.from_dict(json.loads(text))
+
+
+_FIELD_NAMES = frozenset(f.name for f in fields(ScoreResult))
+
+
+class HtmlStore:
+    """Bounded store of rendered HTML, such as displaCy NER visualizations.
+
+    Documents are kept zlib-compressed, and the least recently used ones
+    are dropped once ``max_entries`` is reached.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def put(self, key: str, html: str):
+        compressed = zlib.compress(html.encode("utf-8"))
+        with self._lock:
+            self._entries[key] = compressed
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            compressed = self._entries.get(key)
+            if compressed is None:
+                return None
+            self._entries.move_to_end(key)
+        return zlib.decompress(compressed).decode("utf-8")
+
+
+if __name__ == "__main__":
+    result = ScoreResult(
+        skills_match=0.75,
+        total_score=0.62,
+        matching_skills=["Python", "SQL"],
+        missing_skills=["Kubernetes"],
+        contact=Contact(email="jane@example.com"),
+    )
+    text = result.to_json()
+    print(text)
+    print(ScoreResult.from_json(text) == result)
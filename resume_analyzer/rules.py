@@ -0,0 +1,212 @@
+import json
+import re
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+RULES_PATH = "data/extraction_rules.json"
+
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        "jan feb mar apr may jun jul aug sep oct nov dec".split(), start=1
+    )
+}
+_OPEN_ENDED = {"present", "current", "now", "today"}
+_YEAR_RE = re.compile(r"(?:19|20)\d{2}")
+_MONTH_RE = re.compile(r"^\s*(?:([a-z]{3})|(\d{1,2})\s*/)", re.IGNORECASE)
+_GROUP_RE = re.compile(r"\(\?P([<=])(\w+)")
+
+
+@dataclass(slots=True, frozen=True)
+class DateRange:
+    """A period such as "June 2019 - Present", in months since year 0."""
+
+    start: int
+    end: int
+    current: bool = False
+
+    @property
+    def years(self) -> float:
+        return max(0, self.end - self.start) / 12
+
+    @staticmethod
+    def format_month(months: int) -> str:
+        """Months since year 0 as "YYYY-MM"."""
+        return f"{months // 12:04d}-{months % 12 + 1:02d}"
+
+    @staticmethod
+    def parse_month(text: str) -> int:
+        """Inverse of ``format_month``."""
+        return int(text[:4]) * 12 + int(text[5:7]) - 1
+
+
+@dataclass(slots=True, frozen=True)
+class Span:
+    """A rule match: where it is in the text and its typed value."""
+
+    rule: str
+    start: int
+    end: int
+    text: str
+    value: Any
+
+
+def _month_index(text: str) -> Optional[int]:
+    """Months since year 0 of a date like "Jun 2019", "06/2019" or "2019"."""
+    year = _YEAR_RE.search(text)
+    if not year:
+        return None
+    month = 1
+    match = _MONTH_RE.match(text)
+    if match and match.group(1):
+        month = _MONTHS.get(match.group(1).lower(), 1)
+    elif match and match.group(2):
+        month = min(max(int(match.group(2)), 1), 12)
+    return int(year.group()) * 12 + month - 1
+
+
+def _parse_text(groups: Dict[str, str], text: str) -> str:
+    return text
+
+
+def _parse_years(groups: Dict[str, str], text: str) -> int:
+    return int(groups["years"])
+
+
+def _parse_date_range(groups: Dict[str, str], text: str) -> Optional[DateRange]:
+    start = _month_index(groups["start"])
+    if start is None:
+        return None
+    if groups["end"].strip().lower() in _OPEN_ENDED:
+        today = date.today()
+        return DateRange(start, today.year * 12 + today.month - 1, current=True)
+    end = _month_index(groups["end"])
+    if end is None:
+        return None
+    return DateRange(start, end)
+
+
+# Rule types and the function turning a match into the span value
+RULE_TYPES: Dict[str, Callable[[Dict[str, str], str], Any]] = {
+    "text": _parse_text,
+    "years": _parse_years,
+    "date_range": _parse_date_range,
+}
+
+
+class RuleEngine:
+    """Extracts contact details, stated experience and date ranges in one scan.
+
+    Rules are regular expressions loaded from configuration. They are
+    combined into a single compiled alternation, so the text is scanned once
+    no matter how many rules there are. Where rules overlap, the one listed
+    first in the configuration wins.
+    """
+
+    def __init__(
+        self,
+        rules: List[Dict[str, Any]],
+        definitions: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Args:
+            rules (List[Dict]): Rules with ``name``, ``type`` (one of
+                ``RULE_TYPES``), ``pattern`` and optionally ``ignore_case``
+            definitions (Dict[str, str]): Reusable sub-patterns, referenced in
+                patterns as ``{{NAME}}``
+        """
+        self.rule_names = [rule["name"] for rule in rules]
+        self._parsers = {}
+        alternatives = []
+        for i, rule in enumerate(rules):
+            if rule["type"] not in RULE_TYPES:
+                raise ValueError(
+                    f"Unknown rule type {rule['type']!r} in {rule['name']}"
+                )
+            self._parsers[f"r{i}"] = (rule["name"], RULE_TYPES[rule["type"]])
+
+            pattern = self._expand(rule["pattern"], definitions or {})
+            # Group names must be unique across the alternation, so named
+            # groups get the rule number as prefix
+            pattern = _GROUP_RE.sub(
+                lambda m: f"(?P{m.group(1)}r{i}_{m.group(2)}", pattern
+            )
+            if rule.get("ignore_case"):
+                pattern = f"(?i:{pattern})"
+            alternatives.append(f"(?P<r{i}>{pattern})")
+        self.pattern = re.compile("|".join(alternatives))
+
+    @staticmethod
+    def _expand(pattern: str, definitions: Dict[str, str]) -> str:
+        # Definitions may reference each other
+        for _ in range(len(definitions) + 1):
+            expanded = pattern
+            for name, value in definitions.items():
+                expanded = expanded.replace("{{" + name + "}}", value)
+            if expanded == pattern:
+                # A cycle can also come back to the same text within a pass
+                if any("{{" + name + "}}" in expanded for name in definitions):
+                    break
+                return expanded
+            pattern = expanded
+        raise ValueError("Circular rule definitions")
+
+    @classmethod
+    def from_config(cls, path: str = RULES_PATH) -> "RuleEngine":
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+        return cls(config["rules"], config.get("definitions"))
+
+    def scan(self, text: str) -> List[Span]:
+        """
+        Find all rule matches in a single pass over the text.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            List[Span]: Matches in text order; matches whose value cannot be
+                parsed (e.g. a date range without a start year) are skipped
+        """
+        spans = []
+        for match in self.pattern.finditer(text or ""):
+            key = match.lastgroup
+            name, parse = self._parsers[key]
+            prefix = f"{key}_"
+            groups = {
+                group[len(prefix) :]: value or ""
+                for group, value in match.groupdict().items()
+                if group.startswith(prefix)
+            }
+            value = parse(groups, match.group())
+            if value is not None:
+                spans.append(
+                    Span(name, match.start(), match.end(), match.group(), value)
+                )
+        return spans
+
+    def scan_by_rule(self, text: str) -> Dict[str, List[Span]]:
+        """Scan the text once and group the matches by rule name."""
+        grouped: Dict[str, List[Span]] = {name: [] for name in self.rule_names}
+        for span in self.scan(text):
+            grouped[span.rule].append(span)
+        return grouped
+
+
+@lru_cache(maxsize=None)
+def default_rules() -> RuleEngine:
+    """The rule engine for the project's rule file, compiled once per process."""
+    return RuleEngine.from_config()
+
+
+if __name__ == "__main__":
+    sample = (
+        "Jane Doe | jane.doe@example.com | (555) 123-4567\n"
+        "Senior Engineer, June 2019 - Present\n"
+        "Engineer, 03/2016 - May 2019\n"
+        "Looking for 5+ years of experience in Python."
+    )
+    for span in default_rules().scan(sample):
+        print(span)
@@ -1,22 +1,76 @@
 import logging
-from typing import Dict, List, Any, Tuple
+import math
+from typing import Dict, List, Any, Optional, Tuple
 
 from resume_analyzer.vectorization import TextVectorizer
+from resume_analyzer.matching import (
+    BulkSkillMatcher,
+    TitleIndex,
+    fuzzy_matrix,
+    normalize_skill,
+)
+from resume_analyzer.ranking import DEFAULT_WEIGHTS, total_score, weight_vector
+from resume_analyzer import metrics
 from resume_analyzer.extraction import (
     InformationExtractor,
     extract_resume_and_job_description,
 )
+from resume_analyzer.models import ModelNotInstalledError, load_spacy
+from resume_analyzer.results import Contact, ScoreResult
+from resume_analyzer.rules import DateRange
+from resume_analyzer.sections import SECTION_WEIGHTS
+
+# Pseudo-section holding a whole document, used when a resume and the job
+# description share no weighted section
+WHOLE_DOCUMENT = "document"
 
-from fuzzywuzzy import fuzz
-import spacy
+# Components computed for every resume in cascade mode, before any resume is
+# embedded; they only need the extracted skills and job titles
+SCREENING_COMPONENTS = ("skills_match", "job_title_relevance")
 
 
 class ResumeScorer:
-    def __init__(self):
+    def __init__(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        section_weights: Optional[Dict[str, float]] = None,
+        cascade_fraction: Optional[float] = None,
+        cascade_threshold: Optional[float] = None,
+        fuzzy_cutoff: Optional[float] = None,
+    ):
         """
         Initialize the ResumeScorer with a text vectorizer.
         Supports advanced scoring across multiple dimensions.
+
+        Setting ``cascade_fraction`` or ``cascade_threshold`` turns on cascade
+        mode for ``score_batch``: every resume is first screened on skills and
+        job title, and only the resumes that pass are fully scored.
+
+        Args:
+            weights (Dict[str, float]): Weights of the component scores in the
+                total score; defaults to ``ranking.DEFAULT_WEIGHTS``
+            section_weights (Dict[str, float]): Weights of the document sections
+                in the semantic similarity; defaults to
+                ``sections.SECTION_WEIGHTS``
+            cascade_fraction (float): Fraction of each batch, by screening
+                score, that is fully scored, in (0, 1]
+            cascade_threshold (float): Screening score (0-1) at or above which
+                a resume is fully scored; combined with ``cascade_fraction``,
+                resumes passing either are fully scored
+            fuzzy_cutoff (float): If set, skills and job titles also match
+                fuzzily, at this minimum rapidfuzz ratio (0-100, see
+                ``matching.FUZZY_CUTOFF``); needs the ``rapidfuzz`` package
         """
+        if cascade_fraction is not None and not 0 < cascade_fraction <= 1:
+            raise ValueError("cascade_fraction must be in (0, 1]")
+        self.cascade_fraction = cascade_fraction
+        self.cascade_threshold = cascade_threshold
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.weights = dict(DEFAULT_WEIGHTS if weights is None else weights)
+        weight_vector(self.weights)  # fail early on unknown components
+        self.section_weights = dict(
+            SECTION_WEIGHTS if section_weights is None else section_weights
+        )
         self.degree_hierarchy = {
             "doctoral": {
                 "variants": [
@@ -73,15 +127,31 @@ class ResumeScorer:
             },
         }
 
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            self.nlp = None
+        self._nlp = None
+        self._nlp_loaded = False
 
         self.vectorizer = TextVectorizer()
+        self.skill_matcher = BulkSkillMatcher(fuzzy_cutoff=fuzzy_cutoff)
         self.logger = logging.getLogger(__name__)
         logging.basicConfig(level=logging.INFO)
 
+    @property
+    def nlp(self):
+        """spaCy pipeline for degree similarity, or None if it is not installed.
+
+        Loaded on first use; a missing model is only looked up once.
+        """
+        if not self._nlp_loaded:
+            self._nlp_loaded = True
+            try:
+                with metrics.track_model_memory("spacy_scorer"):
+                    self._nlp = load_spacy()
+            except ModelNotInstalledError as e:
+                self.logger.warning(
+                    f"{e} Degree similarity falls back to fuzzy matching."
+                )
+        return self._nlp
+
     def compute_similarity(self, resume_text: str, jd_text: str) -> float:
         """
         Compute semantic similarity between resume and job description.
@@ -103,7 +173,7 @@ class ResumeScorer:
             self.logger.error(f"Similarity computation error: {e}")
             return 0.0
 
-    def score_resume(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+    def score_resume(self, extracted_data: Dict[str, Any]) -> ScoreResult:
         """
         Comprehensive resume scoring based on multiple factors.
 
@@ -111,52 +181,308 @@ class ResumeScorer:
             extracted_data (Dict): Structured data from resume and job description extraction
 
         Returns:
-            Dict containing various scoring metrics
+            ScoreResult with the component and total scores
         """
         resume = extracted_data["resume"]
         job_description = extracted_data["job_description"]
 
         # Call match_skills with additional return for matching and missing skills
-        skills_match, matching_skills, missing_skills = self.match_skills(
+        skills_result = self.match_skills(
             resume.get("skills", []), job_description.get("skills", [])
         )
 
+        similarity = self.section_similarities([resume], job_description)[0]
+        return self._score_with_skills(
+            resume, job_description, skills_result, similarity
+        )
+
+    def score_batch(
+        self, resumes: List[Dict[str, Any]], job_description: Dict[str, Any]
+    ) -> List[ScoreResult]:
+        """
+        Score many resumes against a single job description.
+
+        Skill matching for the whole batch is done in one vectorized pass, and
+        all section chunks of the batch are embedded in one model call.
+
+        In cascade mode, resumes that do not pass the screening on skills and
+        job title are neither embedded nor matched on education; they get a
+        partial result (``partial=True``) with only the screening components.
+
+        Args:
+            resumes (List[Dict]): Extracted data of each resume
+            job_description (Dict): Extracted data of the job description
+
+        Returns:
+            List of ScoreResult in the same order as ``resumes``
+        """
+        if not resumes:
+            return []
+
+        skills_results = self.match_skills_bulk(
+            [resume.get("skills", []) for resume in resumes],
+            job_description.get("skills", []),
+        )
+
+        # JD titles are compiled once and reused for every resume
+        jd_titles = job_description.get("job_titles", [])
+        title_index = TitleIndex(jd_titles)
+        title_scores = [
+            self.match_job_title(resume.get("job_titles", []), jd_titles, title_index)
+            for resume in resumes
+        ]
+
+        if not self.cascade:
+            similarities = self.section_similarities(resumes, job_description)
+            return [
+                self._score_with_skills(
+                    resume, job_description, skills_result, similarity, title_score
+                )
+                for resume, skills_result, similarity, title_score in zip(
+                    resumes, skills_results, similarities, title_scores
+                )
+            ]
+
+        passed = self._cascade_survivors(
+            [
+                self.screening_score(skills_result[0], title_score)
+                for skills_result, title_score in zip(skills_results, title_scores)
+            ]
+        )
+        metrics.CASCADE.inc(len(passed), stage="full")
+        metrics.CASCADE.inc(len(resumes) - len(passed), stage="partial")
+
+        similarities = dict(
+            zip(
+                passed,
+                self.section_similarities(
+                    [resumes[i] for i in passed], job_description
+                ),
+            )
+        )
+        return [
+            (
+                self._score_with_skills(
+                    resume, job_description, skills_result, similarities[i], title_score
+                )
+                if i in similarities
+                else self._partial_result(resume, skills_result, title_score)
+            )
+            for i, (resume, skills_result, title_score) in enumerate(
+                zip(resumes, skills_results, title_scores)
+            )
+        ]
+
+    @property
+    def cascade(self) -> bool:
+        return self.cascade_fraction is not None or self.cascade_threshold is not None
+
+    def screening_score(self, skills_match: float, job_title_relevance: float) -> float:
+        """
+        Combine the screening components into a score between 0 and 1.
+
+        The components are weighted as in the total score, with the weights
+        renormalized over the screening components; equally if both are 0.
+        """
+        scores = {
+            "skills_match": skills_match,
+            "job_title_relevance": job_title_relevance,
+        }
+        weights = {name: self.weights.get(name, 0.0) for name in SCREENING_COMPONENTS}
+        total = sum(weights.values())
+        if not total:
+            return sum(scores.values()) / len(scores)
+        return sum(scores[name] * weight for name, weight in weights.items()) / total
+
+    def _cascade_survivors(self, screening: List[float]) -> List[int]:
+        """Positions of the screened resumes that go on to full scoring."""
+        passed = set()
+        if self.cascade_threshold is not None:
+            passed.update(
+                i
+                for i, score in enumerate(screening)
+                if score >= self.cascade_threshold
+            )
+        if self.cascade_fraction is not None:
+            top = math.ceil(self.cascade_fraction * len(screening))
+            ranked = sorted(range(len(screening)), key=lambda i: -screening[i])
+            passed.update(ranked[:top])
+        return sorted(passed)
+
+    def _partial_result(
+        self,
+        resume: Dict[str, Any],
+        skills_result: Tuple[float, List[str], List[str]],
+        job_title_relevance: float,
+    ) -> ScoreResult:
+        """Result of a resume that did not pass the cascade screening."""
+        skills_match, matching_skills, missing_skills = skills_result
+        scores = {
+            "skills_match": float(skills_match),
+            "job_title_relevance": float(job_title_relevance),
+        }
+        # The other components count as 0, so the total is a lower bound
+        scores["total_score"] = total_score(scores, self.weights)
+        return ScoreResult(
+            **scores,
+            matching_skills=matching_skills,
+            missing_skills=missing_skills,
+            contact=Contact.from_dict(resume.get("contact")),
+            partial=True,
+        )
+
+    def section_similarities(
+        self, resumes: List[Dict[str, Any]], job_description: Dict[str, Any]
+    ) -> List[Optional[float]]:
+        """
+        Semantic similarity of many resumes to one job description, by section.
+
+        Only the weighted sections present in the job description are encoded.
+        Each resume is compared on the sections it shares with the job
+        description, with the section weights renormalized over them, or as a
+        whole document if it shares none.
+
+        Args:
+            resumes (List[Dict]): Extracted data of each resume
+            job_description (Dict): Extracted data of the job description
+
+        Returns:
+            List of similarities in the same order as ``resumes``; None for
+            documents analyzed without sections
+        """
+        jd_sections = job_description.get("sections")
+        if jd_sections is None:
+            return [None] * len(resumes)
+
+        relevant = [
+            name for name in jd_sections if self.section_weights.get(name, 0) > 0
+        ]
+        # Sections embedded earlier, e.g. by embed_job_description for a
+        # cached job description, are not encoded again
+        cached = self._cached_embeddings(job_description)
+        jd_document = {
+            name: jd_sections[name] for name in relevant if name not in cached
+        }
+
+        positions = []
+        documents = []
+        for position, resume in enumerate(resumes):
+            resume_sections = resume.get("sections")
+            if resume_sections is None:
+                continue
+            shared = {
+                name: resume_sections[name]
+                for name in relevant
+                if resume_sections.get(name)
+            }
+            if not shared:
+                shared = {WHOLE_DOCUMENT: " ".join(resume_sections.values())}
+                if WHOLE_DOCUMENT not in cached:
+                    jd_document.setdefault(
+                        WHOLE_DOCUMENT, " ".join(jd_sections.values())
+                    )
+            positions.append(position)
+            documents.append(shared)
+
+        similarities: List[Optional[float]] = [None] * len(resumes)
+        if not documents:
+            return similarities
+
+        try:
+            jd_vec, *resume_vecs = self.vectorizer.encode_sections(
+                [jd_document] + documents
+            )
+            jd_vec = {**cached, **jd_vec}
+        except Exception as e:
+            self.logger.error(f"Similarity computation error: {e}")
+            return [0.0 if i in positions else None for i in range(len(resumes))]
+
+        for position, resume_vec in zip(positions, resume_vecs):
+            resume_vec = {
+                name: vector for name, vector in resume_vec.items() if name in jd_vec
+            }
+            weights = {name: self.section_weights.get(name, 1.0) for name in resume_vec}
+            total = sum(weights.values())
+            if not total:
+                similarities[position] = 0.0
+                continue
+            weights = {name: weight / total for name, weight in weights.items()}
+            similarities[position] = self.vectorizer.weighted_section_similarity(
+                resume_vec, jd_vec, weights
+            )
+        return similarities
+
+    def embed_job_description(self, job_description: Dict[str, Any]):
+        """
+        Embed the weighted sections and the whole text of a job description.
+
+        The embeddings are stored in the job description under
+        ``section_embeddings``, tagged with the embedding model, so they can be
+        cached with it and reused by ``section_similarities``.
+
+        Args:
+            job_description (Dict): Extracted data of the job description
+        """
+        jd_sections = job_description.get("sections")
+        if not jd_sections:
+            return
+        document = {
+            name: text
+            for name, text in jd_sections.items()
+            if self.section_weights.get(name, 0) > 0
+        }
+        document[WHOLE_DOCUMENT] = " ".join(jd_sections.values())
+        (embeddings,) = self.vectorizer.encode_sections([document])
+        job_description["section_embeddings"] = embeddings
+        job_description["embedding_model"] = self.vectorizer.embedding_id
+
+    def _cached_embeddings(self, job_description: Dict[str, Any]) -> Dict:
+        if job_description.get("embedding_model") != self.vectorizer.embedding_id:
+            return {}
+        return job_description.get("section_embeddings") or {}
+
+    def _score_with_skills(
+        self,
+        resume: Dict[str, Any],
+        job_description: Dict[str, Any],
+        skills_result: Tuple[float, List[str], List[str]],
+        similarity: Optional[float] = None,
+        job_title_relevance: Optional[float] = None,
+    ) -> ScoreResult:
+        """Compute the remaining scores given a precomputed skill match."""
+        if job_title_relevance is None:
+            job_title_relevance = self.match_job_title(
+                resume.get("job_titles", []), job_description.get("job_titles", [])
+            )
+        skills_match, matching_skills, missing_skills = skills_result
+
         scores = {
             "skills_match": skills_match,
-            "matching_skills": matching_skills,
-            "missing_skills": missing_skills,
             "experience_match": self.match_experience(
                 resume.get("experience", []), job_description.get("experience", [])
             ),
             "education_match": self.match_education(
                 resume.get("education", []), job_description.get("education", [])
             ),
-            "job_title_relevance": self.match_job_title(
-                resume.get("job_titles", []), job_description.get("job_titles", [])
-            ),
+            "job_title_relevance": job_title_relevance,
             "overall_similarity": self.match_full_text(
-                resume.get("full_text", []), job_description.get("full_text", [])
+                resume.get("full_text", []),
+                job_description.get("full_text", []),
+                similarity,
             ),
-            "resume_ner": resume.get("ner", ""),
-            "job_ner": job_description.get("ner", ""),
-            "contact": resume.get("contact", ""),
         }
+        scores = {name: float(score) for name, score in scores.items()}
 
         # Weighted average score
-        weights = {
-            "skills_match": 0.6,
-            "experience_match": 0.0,
-            "education_match": 0.15,
-            "job_title_relevance": 0.15,
-            "overall_similarity": 0.1,
-        }
+        scores["total_score"] = total_score(scores, self.weights)
 
-        scores["total_score"] = sum(
-            scores.get(metric, 0) * weight for metric, weight in weights.items()
+        return ScoreResult(
+            **scores,
+            matching_skills=matching_skills,
+            missing_skills=missing_skills,
+            contact=Contact.from_dict(resume.get("contact")),
         )
 
-        return scores
-
     def match_skills(
         self, resume_skills: List[str], jd_skills: List[str]
     ) -> Tuple[float, List[str], List[str]]:
@@ -175,14 +501,27 @@ class ResumeScorer:
         """
         if not jd_skills:
             return 0.0, [], []
+        if self.fuzzy_cutoff is not None:
+            return self.skill_matcher.match([resume_skills], jd_skills)[0]
 
-        # Normalize skills to lowercase for case-insensitive matching
-        resume_skills_lower = [skill.lower() for skill in resume_skills]
-        jd_skills_lower = [skill.lower() for skill in jd_skills]
+        # Normalize skills for case-insensitive matching, keeping the first
+        # original spelling of every JD skill
+        resume_skills_normalized = {normalize_skill(skill) for skill in resume_skills}
+        jd_skills_original = {}
+        for skill in jd_skills:
+            jd_skills_original.setdefault(normalize_skill(skill), skill)
 
         # Find matching and missing skills
-        matching_skills = list(set(resume_skills_lower) & set(jd_skills_lower))
-        missing_skills = list(set(jd_skills_lower) - set(resume_skills_lower))
+        matching_skills = [
+            original
+            for skill, original in jd_skills_original.items()
+            if skill in resume_skills_normalized
+        ]
+        missing_skills = [
+            original
+            for skill, original in jd_skills_original.items()
+            if skill not in resume_skills_normalized
+        ]
 
         # Compute match percentage
         match_percentage = len(matching_skills) / len(jd_skills)
@@ -191,25 +530,32 @@ class ResumeScorer:
         bonus = 0.2 if match_percentage == 1.0 else 0
         match_score = min(match_percentage + bonus, 1.0)
 
-        # Restore original case for matching and missing skills
-        matching_skills = [
-            jd_skills[jd_skills_lower.index(skill)] for skill in matching_skills
-        ]
-        missing_skills = [
-            jd_skills[jd_skills_lower.index(skill)] for skill in missing_skills
-        ]
-
         return match_score, matching_skills, missing_skills
 
+    def match_skills_bulk(
+        self, resume_skills: List[List[str]], jd_skills: List[str]
+    ) -> List[Tuple[float, List[str], List[str]]]:
+        """
+        Calculate skill matches for many resumes against one job description.
+
+        Args:
+            resume_skills (List[List[str]]): Skills of each resume
+            jd_skills (List[str]): Skills from job description
+
+        Returns:
+            List of ``match_skills`` style tuples, one per resume
+        """
+        return self.skill_matcher.match(resume_skills, jd_skills)
+
     def match_experience(
-        self, resume_experience: List[Dict], jd_exp_requirements: List[str]
+        self, resume_experience: List[Dict], jd_exp_requirements: List[Dict]
     ) -> float:
         """
         Advanced experience matching considering various factors.
 
         Args:
             resume_experience (List[Dict]): Work experience from resume
-            jd_exp_requirements (List[str]): Experience requirements from job description
+            jd_exp_requirements (List[Dict]): Experience requirements from job description
 
         Returns:
             float: Experience match score (0-1)
@@ -217,25 +563,14 @@ class ResumeScorer:
         if not jd_exp_requirements:
             return 0.0
 
-        def extract_years(requirements):
-            """Extract years of experience from requirements."""
-            import re
-
-            for req in requirements:
-                match = re.search(
-                    r"(\d+)\+?\s*(?:years?|yrs?)", str(req), re.IGNORECASE
-                )
-                if match:
-                    return int(match.group(1))
-            return 0
-
-        required_years = extract_years(jd_exp_requirements)
+        # Only stated years are requirements; date ranges in a job description
+        # describe e.g. the contract period, not experience asked for
+        required_years = self._stated_years(jd_exp_requirements)
+        if required_years <= 0:
+            return 1.0
 
         # Calculate actual total experience
-        total_experience_years = sum(
-            self._compute_experience_duration(exp.get("dates", []))
-            for exp in resume_experience
-        )
+        total_experience_years = self._total_experience_years(resume_experience)
 
         # Exponential scoring to favor meeting/exceeding requirements
         if total_experience_years >= required_years:
@@ -243,35 +578,49 @@ class ResumeScorer:
 
         return total_experience_years / required_years
 
-    def _compute_experience_duration(self, dates: List[str]) -> float:
+    @staticmethod
+    def _stated_years(experience: List[Dict]) -> float:
+        """Largest number of years stated as in "5+ years of experience"."""
+        return max(
+            (
+                entry.get("years", 0)
+                for entry in experience
+                if entry.get("kind", "stated") == "stated"
+            ),
+            default=0,
+        )
+
+    def _total_experience_years(self, experience: List[Dict]) -> float:
         """
-        Compute duration of work experience.
-        Simple estimation based on string dates.
+        Compute the total duration of work experience.
 
         Args:
-            dates (List[str]): Date strings from experience
+            experience (List[Dict]): Experience entries from the extractor
 
         Returns:
-            float: Estimated years of experience
+            float: Years covered by the employment date ranges, counting
+                overlapping periods once; the stated years if there are none
         """
-        import re
-        from datetime import datetime
-
-        def parse_year(date_str):
-            try:
-                year_match = re.search(r"\d{4}", str(date_str))
-                return int(year_match.group()) if year_match else None
-            except Exception:
-                return None
-
-        if len(dates) >= 2:
-            start_year = parse_year(dates[0])
-            end_year = parse_year(dates[1]) or datetime.now().year
-
-            if start_year and end_year:
-                return max(0, end_year - start_year)
-
-        return 0
+        periods = []
+        for entry in experience:
+            if entry.get("kind") == "date_range":
+                start = DateRange.parse_month(entry["start"])
+                # A reversed range counts as zero months, not negative ones
+                periods.append((start, max(DateRange.parse_month(entry["end"]), start)))
+        periods.sort()
+        if not periods:
+            return self._stated_years(experience)
+
+        months = 0
+        current_start, current_end = periods[0]
+        for start, end in periods[1:]:
+            if start > current_end:
+                months += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        months += current_end - current_start
+        return months / 12
 
     # * EDUCATION SECTION STARTS*#
 
@@ -362,6 +711,8 @@ class ResumeScorer:
 
         # Fuzzy string matching as a fallback
         if self.nlp:
+            from fuzzywuzzy import fuzz
+
             fuzzy_score = fuzz.ratio(resume_degree, jd_degree) / 100.0
             semantic_score = self._semantic_similarity(resume_degree, jd_degree)
 
@@ -434,13 +785,20 @@ class ResumeScorer:
 
     # *   EDUCATION SECTION ENDS  *#
 
-    def match_job_title(self, resume_titles: List[str], jd_titles: List[str]) -> float:
+    def match_job_title(
+        self,
+        resume_titles: List[str],
+        jd_titles: List[str],
+        title_index: Optional[TitleIndex] = None,
+    ) -> float:
         """
         Match job title relevance between resume and job description titles.
 
         Args:
             resume_titles (List[str]): Job titles from resume
             jd_titles (List[str]): Job titles from job description
+            title_index (TitleIndex): ``jd_titles`` compiled once, when
+                scoring many resumes against them
 
         Returns:
             float: Job title relevance score (0-1)
@@ -448,37 +806,37 @@ class ResumeScorer:
         if not jd_titles or not resume_titles:
             return 0.0
 
-        # Convert all titles to lowercase for matching
-        resume_titles_lower = [title.lower() for title in resume_titles]
-        jd_titles_lower = [title.lower() for title in jd_titles]
-
         # For each JD title, find best match from resume titles
-        title_matches = []
-        for jd_title in jd_titles_lower:
-            matches = [
-                (
-                    1.0
-                    if jd_title in resume_title
-                    else (
-                        0.5
-                        if any(word in resume_title for word in jd_title.split())
-                        else 0.0
-                    )
-                )
-                for resume_title in resume_titles_lower
+        if title_index is None:
+            title_index = TitleIndex(jd_titles)
+        title_matches = title_index.best_matches(resume_titles)
+
+        if self.fuzzy_cutoff is not None:
+            # Titles such as "Front-end Developer" and "Frontend Developer"
+            # only match fuzzily; all pairs are compared in one call
+            similar = fuzzy_matrix(resume_titles, jd_titles, self.fuzzy_cutoff)
+            title_matches = [
+                1.0 if similar[:, i].any() else match
+                for i, match in enumerate(title_matches)
             ]
-            title_matches.append(max(matches) if matches else 0.0)
 
         # Return average of best matches for each JD title
-        return sum(title_matches) / len(jd_titles) if title_matches else 0.0
+        return sum(title_matches) / len(jd_titles)
 
-    def match_full_text(self, resume_text: List[str], jd_text: List[str]) -> float:
+    def match_full_text(
+        self,
+        resume_text: List[str],
+        jd_text: List[str],
+        similarity: Optional[float] = None,
+    ) -> float:
         """
         Match full text content between resume and job description.
 
         Args:
             resume_text (str): Full text content of resume
             jd_text (str): Full text content of job description
+            similarity (float): Precomputed semantic similarity, e.g. from
+                ``section_similarities``; the whole texts are embedded if None
 
         Returns:
             float: Full text match score between 0 and 1
@@ -486,9 +844,11 @@ class ResumeScorer:
         if not resume_text or not jd_text:
             return 0.0
 
-        similarity_score = self.compute_similarity(
-            " ".join(resume_text), " ".join(jd_text)
-        )
+        if similarity is None:
+            similarity = self.compute_similarity(
+                " ".join(resume_text), " ".join(jd_text)
+            )
+        similarity_score = similarity
 
         # Add bonus for keyword overlap
         resume_words = set(resume_text)
@@ -557,7 +917,7 @@ def main():
 
     # Score resume
     scores = scorer.score_resume(extracted_data)
-    for metric, score in scores.items():
+    for metric, score in scores.to_dict().items():
         print(f"{metric}: {score}")
 
 
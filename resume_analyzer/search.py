@@ -0,0 +1,263 @@
+import json
+import logging
+import sqlite3
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from resume_analyzer.matching import normalize_skill
+
+logger = logging.getLogger(__name__)
+
+# Extracted fields that are indexed for candidate search
+INDEXED_FIELDS = ("skills", "job_titles", "education")
+
+# Extracted fields that are too large or only needed for display
+_UNSTORED_FIELDS = {"ner"}
+
+
+class CandidateIndex:
+    """Persistent inverted index from skills, job titles and degrees to resumes.
+
+    Postings live in memory for millisecond queries and are mirrored to a
+    SQLite database so the index survives restarts. Resumes are added one at
+    a time as they are ingested; re-adding a resume replaces its postings.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Args:
+            path (str): SQLite database file, or ":memory:" for a throwaway index
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                resume_id TEXT PRIMARY KEY,
+                data TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                field TEXT NOT NULL,
+                term TEXT NOT NULL,
+                resume_id TEXT NOT NULL,
+                PRIMARY KEY (field, term, resume_id)
+            );
+            CREATE INDEX IF NOT EXISTS postings_resume_id ON postings (resume_id);
+            """)
+
+        self._postings: Dict[str, Dict[str, Set[str]]] = {
+            field: defaultdict(set) for field in INDEXED_FIELDS
+        }
+        self._terms: Dict[str, Dict[str, Set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        self._load()
+
+    def _load(self):
+        """Rebuild the in-memory postings from the database."""
+        rows = self._connection.execute("SELECT field, term, resume_id FROM postings")
+        for field, term, resume_id in rows:
+            if field in self._postings:
+                self._postings[field][term].add(resume_id)
+                self._terms[resume_id][field].add(term)
+        logger.info(f"Loaded candidate index with {len(self)} resumes")
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def __contains__(self, resume_id: str) -> bool:
+        return (
+            self._connection.execute(
+                "SELECT 1 FROM documents WHERE resume_id = ?", (resume_id,)
+            ).fetchone()
+            is not None
+        )
+
+    def add(self, resume_id: str, resume: Dict[str, Any]):
+        """
+        Index the extracted data of a resume.
+
+        Args:
+            resume_id (str): Unique identifier of the resume
+            resume (Dict): Output of ``InformationExtractor.extract_resume``,
+                optionally with the cleaned ``full_text`` and ``sections``
+        """
+        self.add_many([(resume_id, resume)])
+
+    def add_many(self, resumes: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Index several resumes in a single transaction."""
+        with self._lock, self._connection:
+            for resume_id, resume in resumes:
+                self._add(resume_id, resume)
+
+    def _add(self, resume_id: str, resume: Dict[str, Any]):
+        terms = {
+            field: {normalize_skill(value) for value in resume.get(field, []) or []}
+            for field in INDEXED_FIELDS
+        }
+        stored = {
+            key: value for key, value in resume.items() if key not in _UNSTORED_FIELDS
+        }
+
+        self._remove(resume_id)
+        self._connection.execute(
+            "INSERT INTO documents (resume_id, data) VALUES (?, ?)",
+            (resume_id, json.dumps(stored)),
+        )
+        self._connection.executemany(
+            "INSERT INTO postings (field, term, resume_id) VALUES (?, ?, ?)",
+            [
+                (field, term, resume_id)
+                for field, field_terms in terms.items()
+                for term in field_terms
+            ],
+        )
+        for field, field_terms in terms.items():
+            for term in field_terms:
+                self._postings[field][term].add(resume_id)
+            self._terms[resume_id][field] = field_terms
+
+    def remove(self, resume_id: str):
+        """Drop a resume and all of its postings from the index."""
+        with self._lock, self._connection:
+            self._remove(resume_id)
+
+    def _remove(self, resume_id: str):
+        self._connection.execute(
+            "DELETE FROM documents WHERE resume_id = ?", (resume_id,)
+        )
+        self._connection.execute(
+            "DELETE FROM postings WHERE resume_id = ?", (resume_id,)
+        )
+        for field, field_terms in self._terms.pop(resume_id, {}).items():
+            for term in field_terms:
+                postings = self._postings[field].get(term)
+                if postings is not None:
+                    postings.discard(resume_id)
+                    if not postings:
+                        del self._postings[field][term]
+
+    def get(self, resume_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored extracted data of a resume, if indexed."""
+        row = self._connection.execute(
+            "SELECT data FROM documents WHERE resume_id = ?", (resume_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_many(self, resume_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Return the stored extracted data of several resumes."""
+        return {
+            resume_id: data
+            for resume_id in resume_ids
+            if (data := self.get(resume_id)) is not None
+        }
+
+    def postings(self, term: str, field: str = "skills") -> Set[str]:
+        """Return the IDs of resumes containing a term."""
+        return set(self._postings[field].get(normalize_skill(term), ()))
+
+    def search(
+        self,
+        all_of: Optional[Iterable[str]] = None,
+        any_of: Optional[Iterable[str]] = None,
+        none_of: Optional[Iterable[str]] = None,
+        field: str = "skills",
+    ) -> Set[str]:
+        """
+        Boolean search over one indexed field.
+
+        Args:
+            all_of (Iterable[str]): Terms that must all be present
+            any_of (Iterable[str]): Terms of which at least one must be present
+            none_of (Iterable[str]): Terms that must not be present
+            field (str): One of ``INDEXED_FIELDS``
+
+        Returns:
+            Set[str]: IDs of matching resumes
+        """
+        postings = self._postings[field]
+
+        def lookup(term):
+            return postings.get(normalize_skill(term), set())
+
+        result: Optional[Set[str]] = None
+
+        # Intersect the rarest terms first to keep intermediate sets small
+        for term_postings in sorted((lookup(term) for term in all_of or ()), key=len):
+            result = set(term_postings) if result is None else result & term_postings
+            if not result:
+                return set()
+
+        if any_of is not None:
+            union = set().union(*(lookup(term) for term in any_of))
+            result = union if result is None else result & union
+
+        if result is None:
+            result = {
+                row[0]
+                for row in self._connection.execute("SELECT resume_id FROM documents")
+            }
+
+        for term in none_of or ():
+            result -= lookup(term)
+
+        return result
+
+    def at_least(
+        self, terms: Iterable[str], k: int, field: str = "skills"
+    ) -> List[Tuple[str, int]]:
+        """
+        Find resumes containing at least ``k`` of the given terms.
+
+        Args:
+            terms (Iterable[str]): Candidate terms, e.g. the skills of a job description
+            k (int): Minimum number of terms a resume must contain
+            field (str): One of ``INDEXED_FIELDS``
+
+        Returns:
+            List of (resume ID, number of matched terms), best matches first
+        """
+        postings = self._postings[field]
+        counts: Counter = Counter()
+        for term in {normalize_skill(term) for term in terms}:
+            counts.update(postings.get(term, ()))
+
+        return sorted(
+            ((resume_id, count) for resume_id, count in counts.items() if count >= k),
+            key=lambda item: (-item[1], item[0]),
+        )
+
+    def shortlist(
+        self,
+        job_description: Dict[str, Any],
+        min_skills: int = 1,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Shortlist resumes for a job description by shared skills.
+
+        Args:
+            job_description (Dict): Extracted job description data
+            min_skills (int): Minimum number of shared skills
+            limit (int): Maximum number of resumes to return
+
+        Returns:
+            List[str]: Resume IDs, most shared skills first
+        """
+        matches = self.at_least(job_description.get("skills", []), min_skills)
+        return [resume_id for resume_id, _ in matches[:limit]]
+
+    def close(self):
+        self._connection.close()
+
+
+if __name__ == "__main__":
+    index = CandidateIndex()
+    index.add("alice.pdf", {"skills": ["Kubernetes", "Terraform", "Python"]})
+    index.add("bob.pdf", {"skills": ["Kubernetes", "Java"]})
+    index.add("carol.pdf", {"skills": ["Terraform", "AWS"], "job_titles": ["DevOps"]})
+
+    print(index.search(all_of=["kubernetes", "terraform"]))
+    print(index.search(any_of=["Java", "AWS"], none_of=["Python"]))
+    print(index.at_least(["Kubernetes", "Terraform", "AWS"], k=2))
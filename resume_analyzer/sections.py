@@ -0,0 +1,208 @@
+import re
+from typing import Dict, Iterator, List
+
+# Canonical section names and the headings that introduce them, in resumes
+# and in job descriptions. Job description headings map to the resume
+# section they should be compared with (e.g. responsibilities -> experience).
+SECTION_HEADINGS = {
+    "summary": [
+        "summary",
+        "professional summary",
+        "career summary",
+        "profile",
+        "professional profile",
+        "objective",
+        "career objective",
+        "about me",
+        "overview",
+        "job summary",
+        "position summary",
+        "primary function",
+        "general statement of job function",
+        "about the role",
+        "the role",
+    ],
+    "experience": [
+        "experience",
+        "work experience",
+        "professional experience",
+        "relevant experience",
+        "employment",
+        "employment history",
+        "work history",
+        "career history",
+        "responsibilities",
+        "key responsibilities",
+        "areas of responsibility",
+        "duties",
+        "essential duties",
+        "duties and responsibilities",
+        "essential duties and responsibilities",
+        "essential functions",
+        "what you will do",
+        "what you'll do",
+    ],
+    "skills": [
+        "skills",
+        "key skills",
+        "technical skills",
+        "core skills",
+        "skills and abilities",
+        "core competencies",
+        "competencies",
+        "qualifications",
+        "required qualifications",
+        "preferred qualifications",
+        "minimum qualifications",
+        "requirements",
+        "skills and qualifications",
+        "knowledge skills and abilities",
+        "knowledge skills abilities",
+        "skills abilities and knowledge",
+        "what we are looking for",
+        "what you will bring",
+    ],
+    "education": [
+        "education",
+        "education and training",
+        "academic background",
+        "academic qualifications",
+        "education requirements",
+    ],
+    "projects": ["projects", "personal projects", "key projects"],
+    "certifications": [
+        "certifications",
+        "certificates",
+        "licenses and certifications",
+    ],
+    "other": [
+        "activities and interests",
+        "interests",
+        "hobbies",
+        "references",
+        "languages",
+        "volunteer experience",
+        "volunteering",
+        "awards",
+        "publications",
+        "benefits",
+        "what we offer",
+        "about us",
+        "compensation",
+        "work schedule",
+    ],
+}
+
+# Weight of each section in the semantic similarity. Sections without a
+# weight are never encoded.
+SECTION_WEIGHTS = {
+    "experience": 0.4,
+    "skills": 0.3,
+    "education": 0.15,
+    "summary": 0.1,
+    "projects": 0.05,
+}
+
+# Text before the first recognized heading (name, contact details, ...)
+HEADER = "header"
+
+# Longest section chunk, in words, sent to the encoder. all-MiniLM-L6-v2
+# truncates at 256 word pieces; 128 cleaned words stay well below that.
+CHUNK_WORDS = 128
+
+
+def _normalize_heading(heading: str) -> str:
+    return " ".join(heading.lower().replace("&", "and").replace(",", " ").split())
+
+
+def _heading_pattern(heading: str) -> str:
+    words = [
+        "(?:and|&)" if word == "and" else re.escape(word) for word in heading.split()
+    ]
+    return r"[\s,]+".join(words)
+
+
+_HEADINGS = {
+    heading: section
+    for section, headings in SECTION_HEADINGS.items()
+    for heading in headings
+}
+
+# A heading alone on its line, optionally followed by a colon and content,
+# or directly followed by capitalized content as in two-column layouts
+# ("Education GLENNWOOD UNIVERSITY"). Longer headings are tried first. See
+# split_sections for where the forms with content count as headings.
+_HEADING_RE = re.compile(
+    r"^[\s•●▪*-]*(?P<heading>(?i:"
+    + "|".join(
+        _heading_pattern(heading)
+        for heading in sorted(_HEADINGS, key=len, reverse=True)
+    )
+    + r"))\s*(?::\s*(?P<rest>.*)|\s+(?P<inline>[A-Z0-9].*)|)$"
+)
+
+
+def split_sections(text: str) -> Dict[str, str]:
+    """
+    Split the raw text of a resume or job description into sections.
+
+    Must run before cleaning, which removes the line breaks headings are
+    recognized by. Repeated sections are concatenated.
+
+    A heading alone on its line always starts a section. A heading followed
+    by content on the same line ("Skills: Python, SQL") only does at the
+    start of a block, i.e. at the start of the document or after a blank
+    line; elsewhere it is ordinary content, such as a bullet reading
+    "Summary: led the migration".
+
+    Args:
+        text (str): Parsed document text
+
+    Returns:
+        Dict[str, str]: Section name to section text, in document order;
+            text before the first heading is stored under ``HEADER``
+    """
+    sections: Dict[str, List[str]] = {}
+    current = HEADER
+    block_start = True
+    for line in (text or "").splitlines():
+        if not line.strip():
+            block_start = True
+            continue
+        match = _HEADING_RE.match(line)
+        if match:
+            content = match.group("rest") or match.group("inline") or ""
+            if block_start or not content.strip():
+                current = _HEADINGS[_normalize_heading(match.group("heading"))]
+                line = content
+        block_start = False
+        if line.strip():
+            sections.setdefault(current, []).append(line)
+    return {name: "\n".join(lines) for name, lines in sections.items()}
+
+
+def chunk_text(text: str, size: int = CHUNK_WORDS) -> Iterator[str]:
+    """Split text into chunks of at most ``size`` words."""
+    words = text.split()
+    for start in range(0, len(words), size):
+        yield " ".join(words[start : start + size])
+
+
+if __name__ == "__main__":
+    sample = """John Doe
+    john.doe@email.com
+
+    SUMMARY
+    Backend engineer with 6 years of experience.
+
+    Experience ACME CORP
+    Senior Software Engineer, 2019 - Present
+    • Led microservices architecture design
+
+    Skills: Python, Java, Kubernetes
+
+    Education & Training
+    BS in Computer Science
+    """
+    for name, section in split_sections(sample).items():
+        print(f"[{name}]\n{section}\n")
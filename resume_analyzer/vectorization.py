@@ -1,16 +1,57 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
-from gensim.models.doc2vec import Doc2Vec, TaggedDocument
-from gensim.utils import simple_preprocess
+import os
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from resume_analyzer import metrics
+from resume_analyzer.models import SBERT_MODEL, load_sentence_transformer
+from resume_analyzer.sections import CHUNK_WORDS, chunk_text
+
+# Defaults for the web app and batch workers, which build their vectorizer
+# internally: RESUME_ANALYZER_QUANTIZE=1 enables int8 inference and
+# RESUME_ANALYZER_TORCH_THREADS pins the torch intra-op thread count
+QUANTIZE = os.environ.get("RESUME_ANALYZER_QUANTIZE") == "1"
+TORCH_THREADS = int(os.environ.get("RESUME_ANALYZER_TORCH_THREADS") or 0) or None
 
 
 class TextVectorizer:
-    """Converts text to vector representations."""
+    """Converts text to vector representations.
+
+    sentence-transformers (and with it torch), scikit-learn and gensim are
+    imported only when a method that needs them is first called.
+    """
+
+    def __init__(self, model_name=SBERT_MODEL, quantize=None, num_threads=None):
+        """
+        Initialize the vectorizer with a pre-trained SBERT model name.
 
-    def __init__(self, model_name="all-MiniLM-L6-v2"):
-        """Initialize the vectorizer with a pre-trained SBERT model."""
-        self.model = SentenceTransformer(model_name)
+        Args:
+            model_name (str): sentence-transformers model name
+            quantize (bool): Run the model with int8 dynamic quantization on
+                CPU; defaults to ``QUANTIZE``
+            num_threads (int): torch intra-op thread count; defaults to
+                ``TORCH_THREADS``, or torch's own default if that is unset
+        """
+        self.model_name = model_name
+        self.quantize = QUANTIZE if quantize is None else quantize
+        self.num_threads = TORCH_THREADS if num_threads is None else num_threads
+        self._model = None
+
+    @property
+    def embedding_id(self) -> str:
+        """Identifies the embedding space, to tell apart cached embeddings."""
+        return f"{self.model_name}:int8" if self.quantize else self.model_name
+
+    @property
+    def model(self):
+        """SBERT model, loaded on first use."""
+        if self._model is None:
+            with metrics.track_model_memory("sbert_int8" if self.quantize else "sbert"):
+                self._model = load_sentence_transformer(
+                    self.model_name, self.quantize, self.num_threads
+                )
+        return self._model
 
     def calculate_tfidf(self, text):
         """
@@ -18,6 +59,8 @@ class TextVectorizer:
         Args: text (str)
         Returns: numpy.array: TF-IDF vector
         """
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
         vectorizer = TfidfVectorizer()
         tfidf_matrix = vectorizer.fit_transform([text])
         return tfidf_matrix.toarray()
@@ -28,9 +71,58 @@ class TextVectorizer:
         Args: text (str)
         Returns: numpy.array: Word embeddings
         """
-        embeddings = self.model.encode(text)
+        with metrics.stage("embed"):
+            embeddings = self.model.encode(text)
         return embeddings
 
+    def encode_sections(
+        self,
+        documents: List[Dict[str, str]],
+        sections: Optional[Iterable[str]] = None,
+        chunk_words: int = CHUNK_WORDS,
+        batch_size: int = 32,
+    ) -> List[Dict[str, np.ndarray]]:
+        """
+        Embed the sections of many documents in a single batched model call.
+
+        Sections are split into chunks of at most ``chunk_words`` words so the
+        model's token limit never truncates them; a section embedding is the
+        mean of its chunk embeddings.
+
+        Args:
+            documents (List[Dict[str, str]]): Section name to text, per document
+            sections (Iterable[str]): Only encode these sections; all if None
+            chunk_words (int): Longest chunk sent to the model, in words
+            batch_size (int): Encoder batch size
+
+        Returns:
+            List[Dict[str, np.ndarray]]: Section embeddings, per document
+        """
+        wanted = None if sections is None else set(sections)
+        owners = []
+        chunks = []
+        for i, document in enumerate(documents):
+            for name, text in document.items():
+                if wanted is not None and name not in wanted:
+                    continue
+                for chunk in chunk_text(text, chunk_words):
+                    owners.append((i, name))
+                    chunks.append(chunk)
+
+        results: List[Dict[str, np.ndarray]] = [{} for _ in documents]
+        if not chunks:
+            return results
+
+        with metrics.stage("embed"):
+            embeddings = self.model.encode(chunks, batch_size=batch_size)
+
+        grouped = defaultdict(list)
+        for owner, embedding in zip(owners, embeddings):
+            grouped[owner].append(embedding)
+        for (i, name), vectors in grouped.items():
+            results[i][name] = np.mean(vectors, axis=0)
+        return results
+
     def get_document_embedding(self, text, method="sbert"):
         """
         Creates document-level embeddings using either SBERT or Doc2Vec
@@ -44,6 +136,9 @@ class TextVectorizer:
             return self.get_word_embeddings(text)
 
         elif method.lower() == "doc2vec":
+            from gensim.models.doc2vec import Doc2Vec, TaggedDocument
+            from gensim.utils import simple_preprocess
+
             # Preprocess text into tokens
             tokens = simple_preprocess(text)
 
@@ -70,13 +165,14 @@ class TextVectorizer:
         Args: vec1, vec2 (numpy.array)
         Returns: float: Similarity score
         """
-        # Reshape vectors to 2D arrays as required by sklearn
-        vec1_reshaped = vec1.reshape(1, -1)
-        vec2_reshaped = vec2.reshape(1, -1)
-
-        # Calculate similarity
-        similarity = cosine_similarity(vec1_reshaped, vec2_reshaped)
-        return float(similarity[0][0])
+        # Plain numpy cosine similarity, same result as sklearn's
+        # cosine_similarity without importing scikit-learn on the hot path
+        vec1 = np.asarray(vec1, dtype=np.float64).ravel()
+        vec2 = np.asarray(vec2, dtype=np.float64).ravel()
+        norm = np.linalg.norm(vec1) * np.linalg.norm(vec2)
+        if norm == 0:
+            return 0.0
+        return float(np.dot(vec1, vec2) / norm)
 
     def weighted_section_similarity(self, resume_vec, jd_vec, weights):
         """
@@ -79,9 +79,9 @@ document.addEventListener('DOMContentLoaded', () => {
             loadingIndicator.classList.remove('d-none');
             submitButton.disabled = true;
 
-            // Create FormData and submit
+            // Create FormData and submit; results arrive one event at a time
             const formData = new FormData(form);
-            const response = await fetch('/parsing-result', {
+            const response = await fetch('/parsing-result/stream', {
                 method: 'POST',
                 body: formData
             });
@@ -90,15 +90,28 @@ document.addEventListener('DOMContentLoaded', () => {
                 throw new Error(`HTTP error! status: ${response.status}`);
             }
 
-            // Get the response data
-            const result = await response.text();
-            
-            // Insert the response into the page content
             const contentDiv = document.querySelector('.container');
-            contentDiv.innerHTML = result;
-            
-            // Update the URL without triggering a page reload
-            history.pushState({}, '', '/parsing-result');
+            await readEvents(response, (event, data) => {
+                if (event === 'start') {
+                    // Replace the spinner with the results as they come in
+                    loadingIndicator.classList.add('d-none');
+                    renderResultsLayout(contentDiv, data.total);
+                    history.pushState({}, '', '/parsing-result');
+                } else if (event === 'result') {
+                    addResultRow(data.resume, data.scores);
+                    updateProgress(data.done);
+                } else if (event === 'failed') {
+                    addFailedResume(data.resume);
+                    updateProgress(data.done);
+                } else if (event === 'ranking') {
+                    renderRanking(data.top, data.provisional);
+                } else if (event === 'done') {
+                    document.getElementById('streamProgress').textContent =
+                        `Done: ${data.scored} scored, ${data.failed} failed.`;
+                } else if (event === 'error') {
+                    throw new Error(data.message);
+                }
+            });
 
         } catch (error) {
             console.error('Error:', error);
@@ -108,4 +121,116 @@ document.addEventListener('DOMContentLoaded', () => {
             submitButton.disabled = false;
         }
     });
-});
\ No newline at end of file
+});
+
+// Read server-sent events from a fetch response and pass each one to onEvent
+async function readEvents(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const frame = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+
+            let event = 'message';
+            let data = '';
+            frame.split('\n').forEach(line => {
+                if (line.startsWith('event:')) event = line.slice(6).trim();
+                else if (line.startsWith('data:')) data += line.slice(5).trim();
+            });
+            onEvent(event, data ? JSON.parse(data) : null);
+        }
+    }
+}
+
+// Streamed results: progress, a live top-N ranking and a table sorted by total score
+let streamTotal = 0;
+
+function renderResultsLayout(container, total) {
+    streamTotal = total;
+    container.innerHTML = `
+        <h1 class="text-center">Resume Analysis Results</h1>
+        <p id="streamProgress" class="text-center text-muted">Scored 0 of ${total} resumes...</p>
+        <div id="streamFailed" class="alert alert-warning d-none">Could not process: </div>
+        <h4 id="topRankingTitle">Top candidates so far</h4>
+        <ol id="topRanking"></ol>
+        <div class="table-responsive">
+            <table id="resumeTable" class="table table-striped table-bordered">
+                <thead class="thead-dark">
+                    <tr>
+                        <th>Resume</th><th>Email</th><th>Phone</th><th>Location</th>
+                        <th>Skill</th><th>Education</th><th>Job Relevance</th>
+                        <th>Full Text</th><th>Total</th>
+                    </tr>
+                </thead>
+                <tbody></tbody>
+            </table>
+        </div>`;
+}
+
+function updateProgress(done) {
+    document.getElementById('streamProgress').textContent =
+        `Scored ${done} of ${streamTotal} resumes...`;
+}
+
+function percent(value) {
+    return `${Math.round((value || 0) * 100)}%`;
+}
+
+function detailsLink(resume) {
+    const link = document.createElement('a');
+    link.href = `/details?resume=${encodeURIComponent(resume)}`;
+    link.textContent = `Resume: ${resume}`;
+    return link;
+}
+
+function addResultRow(resume, scores) {
+    const row = document.createElement('tr');
+    row.dataset.total = scores.total_score;
+
+    row.insertCell().appendChild(detailsLink(resume));
+    const contact = scores.contact || {};
+    [contact.email, contact.phone, contact.location].forEach(value => {
+        row.insertCell().textContent = value || '';
+    });
+    ['skills_match', 'education_match', 'job_title_relevance', 'overall_similarity', 'total_score']
+        .forEach(field => {
+            const cell = row.insertCell();
+            cell.className = 'centered';
+            cell.textContent = percent(scores[field]);
+        });
+
+    // Keep the table sorted by total score as rows arrive
+    const body = document.querySelector('#resumeTable tbody');
+    const next = Array.from(body.rows).find(
+        other => parseFloat(other.dataset.total) < scores.total_score
+    );
+    body.insertBefore(row, next || null);
+}
+
+function addFailedResume(resume) {
+    const failed = document.getElementById('streamFailed');
+    const separator = failed.classList.contains('d-none') ? '' : ', ';
+    failed.classList.remove('d-none');
+    failed.appendChild(document.createTextNode(separator + resume));
+}
+
+// Provisional rankings cover the resumes scored so far; the final one the whole upload
+function renderRanking(top, provisional) {
+    document.getElementById('topRankingTitle').textContent =
+        provisional ? 'Top candidates so far (provisional)' : 'Top candidates';
+    const list = document.getElementById('topRanking');
+    list.innerHTML = '';
+    top.forEach(entry => {
+        const item = document.createElement('li');
+        item.appendChild(detailsLink(entry.resume));
+        item.appendChild(document.createTextNode(` (${percent(entry.total_score)})`));
+        list.appendChild(item);
+    });
+}
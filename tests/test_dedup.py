@@ -0,0 +1,59 @@
+import pytest
+
+import process
+from resume_analyzer.dedup import DuplicateIndex, group_duplicates, lsh_parameters
+from resume_analyzer.results import ScoreResult
+
+BASE = "senior python developer with experience building data pipelines".split() * 5
+OTHER = "hotel manager with guest relations background".split() * 5
+
+
+def test_near_duplicates_map_to_the_first_copy():
+    duplicates = group_duplicates(
+        [("a", BASE), ("b", BASE + ["kubernetes"]), ("c", OTHER), ("d", BASE)],
+        threshold=0.8,
+    )
+
+    assert duplicates == {"b": "a", "d": "a"}
+
+
+def test_find_or_add_keeps_only_representatives():
+    index = DuplicateIndex(0.9)
+
+    assert index.find_or_add("a", BASE) is None
+    assert index.find_or_add("b", OTHER) is None
+    assert index.find_or_add("c", list(BASE)) == "a"
+    assert index.find_or_add("empty", []) is None
+    assert len(index) == 2
+
+
+def test_invalid_threshold_is_rejected():
+    for threshold in (0, 1.5):
+        with pytest.raises(ValueError):
+            DuplicateIndex(threshold)
+
+
+def test_lsh_bands_use_every_permutation_near_the_threshold():
+    bands, rows = lsh_parameters(0.9, 128)
+
+    assert bands * rows <= 128
+    assert abs((1 / bands) ** (1 / rows) - 0.9) < 0.05
+
+
+def test_processor_scores_every_resume_unless_a_threshold_is_set():
+    resumes = [{"full_text": BASE}, {"full_text": list(BASE)}]
+
+    def score(processor):
+        processor.scorer.score_batch = lambda batch, job_description: [
+            ScoreResult(total_score=0.5) for _ in batch
+        ]
+        duplicates = (
+            DuplicateIndex(processor.dedup_threshold)
+            if processor.dedup_threshold
+            else None
+        )
+        return processor._score_analyzed(["a", "b"], resumes, {}, duplicates, {})
+
+    assert process.ResumeProcessor().dedup_threshold is None
+    assert score(process.ResumeProcessor())["b"].duplicate_of is None
+    assert score(process.ResumeProcessor(dedup_threshold=0.9))["b"].duplicate_of == "a"
@@ -0,0 +1,105 @@
+import io
+import zipfile
+
+import pytest
+
+from resume_analyzer.docx_text import docx_text, iter_paragraphs
+
+NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+)
+
+
+def part(body: str) -> bytes:
+    return f"<w:document {NAMESPACES}><w:body>{body}</w:body></w:document>".encode()
+
+
+def paragraph(*runs: str) -> str:
+    return "<w:p>" + "".join(f"<w:r>{run}</w:r>" for run in runs) + "</w:p>"
+
+
+def text(value: str) -> str:
+    return f"<w:t>{value}</w:t>"
+
+
+def write_docx(parts) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, xml in parts.items():
+            archive.writestr(name, xml)
+    buffer.seek(0)
+    return buffer
+
+
+def test_text_boxes_are_read_once_and_before_their_paragraph():
+    text_box = (
+        "<mc:AlternateContent>"
+        "<mc:Choice><w:drawing><w:txbxContent>"
+        f"{paragraph(text('Skills: Python'))}"
+        "</w:txbxContent></w:drawing></mc:Choice>"
+        "<mc:Fallback><w:pict><w:txbxContent>"
+        f"{paragraph(text('Skills: Python'))}"
+        "</w:txbxContent></w:pict></mc:Fallback>"
+        "</mc:AlternateContent>"
+    )
+    xml = part(paragraph(text("Anchor "), text_box, text("text")))
+
+    assert list(iter_paragraphs(io.BytesIO(xml))) == ["Skills: Python", "Anchor text"]
+
+
+def test_tab_stops_are_not_text_but_tabs_and_breaks_are():
+    tab_stops = '<w:pPr><w:tabs><w:tab w:val="right" w:pos="9000"/></w:tabs></w:pPr>'
+    xml = part(
+        f"<w:p>{tab_stops}<w:r>{text('Engineer')}<w:tab/>{text('2019')}</w:r></w:p>"
+        + paragraph(text("Line one"), "<w:br/>", text("Line two"))
+    )
+
+    assert list(iter_paragraphs(io.BytesIO(xml))) == [
+        "Engineer\t2019",
+        "Line one\nLine two",
+    ]
+
+
+def test_headers_and_footers_frame_the_body_once():
+    header = part(paragraph(text("Jane Doe")) + paragraph())
+    docx = write_docx(
+        {
+            "word/document.xml": part(paragraph(text("Summary")) + paragraph()),
+            "word/header1.xml": header,
+            "word/header2.xml": header,
+            "word/footer1.xml": part(paragraph(text("Page 1"))),
+        }
+    )
+
+    assert docx_text(docx) == "Jane Doe\nSummary\n\nPage 1"
+
+
+def test_missing_body_raises_key_error():
+    with pytest.raises(KeyError):
+        docx_text(write_docx({"word/header1.xml": part("")}))
+
+
+def test_generated_document_matches_python_docx(tmp_path):
+    docx = pytest.importorskip("docx")
+    from benchmarks.docx_fidelity import reference_paragraphs, write_layout_fixture
+
+    path = str(tmp_path / "layout.docx")
+    write_layout_fixture(path)
+    document = docx.Document(path)
+    section = document.sections[0]
+    # The same header on the first page and the others, as templates often do
+    section.different_first_page_header_footer = True
+    section.first_page_header.paragraphs[0].text = section.header.paragraphs[0].text
+    run = document.add_paragraph().add_run("Engineer")
+    run.add_tab()
+    run.add_text("2019")
+    document.save(path)
+
+    lines = docx_text(path).split("\n")
+
+    assert set(lines) - {""} == reference_paragraphs(path)
+    assert lines.count("Jordan Kim | jordan.kim@example.com") == 1
+    assert lines[0] == "Jordan Kim | jordan.kim@example.com"
+    assert lines[-1] == "References available on request"
+    assert "Engineer\t2019" in lines
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from resume_analyzer import embedding_store
+from resume_analyzer.embedding_store import EmbeddingStore, quantize, sign_bits
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(0).normal(size=(1000, 64)).astype(np.float32)
+
+
+def exact_top(vectors, query, k):
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return list(np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:k])
+
+
+def test_quantized_codes_approximate_the_vectors(vectors):
+    codes, scales = quantize(vectors)
+
+    assert codes.dtype == np.int8
+    assert np.abs(codes * scales[:, None] - vectors).max() <= scales.max() / 2 + 1e-6
+    assert sign_bits(vectors).shape == (1000, 4)
+
+
+@pytest.mark.parametrize(
+    "binary, coarse", [(True, "binary"), (True, "int8"), (False, None)]
+)
+def test_search_finds_the_exact_nearest_neighbours(
+    tmp_path, vectors, monkeypatch, binary, coarse
+):
+    # Several blocks, so the shortlist is kept across them
+    monkeypatch.setattr(embedding_store, "BLOCK_ROWS", 128)
+    store = EmbeddingStore(str(tmp_path), embedding_id="test", binary=binary)
+    store.add([f"resume-{i}" for i in range(len(vectors))], vectors)
+    query = vectors[42] + np.random.default_rng(1).normal(scale=0.1, size=64)
+
+    results = store.search(query, k=5, coarse=coarse)
+
+    assert [key for key, _ in results] == [
+        f"resume-{i}" for i in exact_top(vectors, query, 5)
+    ]
+    assert results[0][0] == "resume-42"
+    assert results[0][1] == pytest.approx(
+        float(
+            vectors[42] @ query / np.linalg.norm(vectors[42]) / np.linalg.norm(query)
+        ),
+        abs=1e-5,
+    )
+
+
+def test_reopened_store_keeps_appended_rows(tmp_path, vectors):
+    store = EmbeddingStore(str(tmp_path), embedding_id="test")
+    store.add(["a", "b"], vectors[:2])
+    store.add(["c"], vectors[2:3])
+
+    reopened = EmbeddingStore(str(tmp_path), embedding_id="test")
+
+    assert len(reopened) == 3
+    assert reopened.ids == ["a", "b", "c"]
+    assert reopened.dim == 64
+    assert reopened.search(vectors[2], k=1)[0][0] == "c"
+
+
+def test_uncommitted_rows_are_truncated_on_open(tmp_path, vectors):
+    store = EmbeddingStore(str(tmp_path), embedding_id="test")
+    store.add(["a", "b"], vectors[:2])
+    sizes = store.disk_bytes()
+    # A crash after writing the rows but before committing the count
+    for name, _ in embedding_store._FILES.values():
+        with open(tmp_path / name, "ab") as f:
+            f.write(b"\0" * 100)
+    with open(tmp_path / "ids.txt", "a") as f:
+        f.write("lost\n")
+
+    reopened = EmbeddingStore(str(tmp_path), embedding_id="test")
+
+    assert len(reopened) == 2
+    assert reopened.ids == ["a", "b"]
+    assert reopened.disk_bytes() == sizes
+    reopened.add(["c"], vectors[2:3])
+    assert reopened.search(vectors[2], k=1)[0][0] == "c"
+
+
+def test_mismatched_model_dimension_and_scan_are_rejected(tmp_path, vectors):
+    store = EmbeddingStore(str(tmp_path), embedding_id="model-a", binary=False)
+    store.add(["a"], vectors[:1])
+
+    with pytest.raises(ValueError):
+        EmbeddingStore(str(tmp_path), embedding_id="model-b")
+    with pytest.raises(ValueError):
+        store.add(["b"], np.ones((1, 32)))
+    with pytest.raises(ValueError):
+        store.add(["b", "c"], vectors[:1])
+    with pytest.raises(ValueError):
+        store.search(vectors[0], coarse="binary")
+    with pytest.raises(ValueError):
+        store.search(vectors[0], coarse="float16")
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.import_time import MODULES, measure
+
+# Seconds; generous enough for a loaded CI machine, far below a model load
+BUDGET = 2.0
+
+
+@pytest.mark.parametrize("module", MODULES + ["app"])
+def test_import_is_fast_and_loads_no_heavy_dependencies(module, monkeypatch):
+    # The probe interpreter imports the top-level modules from its cwd
+    monkeypatch.chdir(Path(__file__).resolve().parents[1])
+
+    result = measure(module, repeat=2)
+
+    assert result["heavy"] == []
+    assert result["seconds"] < BUDGET
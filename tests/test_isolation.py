@@ -0,0 +1,64 @@
+import time
+
+import pytest
+
+from resume_analyzer import metrics
+from resume_analyzer.isolation import MIB, Budget, DocumentFailedError, run_isolated
+
+BUDGET = Budget(cpu_seconds=1, wall_seconds=5, memory_bytes=64 * MIB)
+
+
+def spin():
+    while True:
+        pass
+
+
+def allocate():
+    return len(bytearray(512 * MIB))
+
+
+def count_duplicates(count):
+    metrics.DUPLICATES.inc(count)
+    return count
+
+
+def failure_reason(function, *args, budget=BUDGET):
+    """Run a function that must fail and return why; checks it was counted."""
+    before = metrics.ISOLATION_FAILURES.snapshot()
+    with pytest.raises(DocumentFailedError) as failure:
+        run_isolated(function, *args, budget=budget)
+    reason = failure.value.reason
+    assert metrics.ISOLATION_FAILURES.delta(before) == {(reason,): 1}
+    return reason
+
+
+def test_result_and_metrics_come_back_from_the_child():
+    before = metrics.DUPLICATES.value()
+
+    assert run_isolated(count_duplicates, 3, budget=BUDGET) == 3
+    assert metrics.DUPLICATES.value() == before + 3
+
+
+def test_exceptions_are_reported_as_errors():
+    assert failure_reason(int, "x") == "error"
+
+
+def test_cpu_time_budget():
+    assert failure_reason(spin) == "cpu_time"
+
+
+def test_memory_budget():
+    assert failure_reason(allocate) == "memory"
+
+
+def test_wall_clock_budget():
+    start = time.monotonic()
+
+    assert failure_reason(time.sleep, 10, budget=Budget(wall_seconds=0.2)) == (
+        "wall_clock"
+    )
+    assert time.monotonic() - start < 5
+
+
+def test_unpicklable_result_fails_the_document():
+    assert failure_reason(lambda: (lambda: None)) == "error"
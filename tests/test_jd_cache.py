@@ -0,0 +1,74 @@
+import hashlib
+
+import process
+from resume_analyzer.jd_cache import CACHE_VERSION, JobDescriptionCache, content_hash
+from resume_analyzer.scoring import ResumeScorer
+
+
+def test_content_hash_ignores_the_file_name(tmp_path):
+    first, second = tmp_path / "jd.pdf", tmp_path / "copy of jd.pdf"
+    first.write_bytes(b"job description" * 10000)
+    second.write_bytes(b"job description" * 10000)
+
+    assert content_hash(str(first)) == content_hash(str(second))
+    assert content_hash(str(first)) == hashlib.sha256(first.read_bytes()).hexdigest()
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = JobDescriptionCache(max_entries=2)
+    cache.put("a", {"skills": ["Python"]})
+    cache.put("b", {"skills": ["SQL"]})
+
+    assert cache.get("a") == {"skills": ["Python"]}
+    cache.put("c", {"skills": ["Go"]})
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+
+def test_profiles_persist_across_instances(tmp_path):
+    directory = str(tmp_path)
+    JobDescriptionCache(directory=directory).put("a", {"skills": ["Python"]})
+    (tmp_path / f"broken.v{CACHE_VERSION}.pkl").write_bytes(b"not a pickle")
+
+    cache = JobDescriptionCache(max_entries=1, directory=directory)
+
+    assert cache.get("a") == {"skills": ["Python"]}
+    assert "a" in cache
+    assert cache.get("broken") is None
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_processor_analyzes_a_job_description_once_under_any_name(tmp_path):
+    first, renamed = tmp_path / "jd.pdf", tmp_path / "renamed.pdf"
+    first.write_bytes(b"job description")
+    renamed.write_bytes(b"job description")
+    processor = process.ResumeProcessor(jd_cache=JobDescriptionCache())
+    analyzed = []
+
+    def analyze_job_description(path):
+        analyzed.append(path)
+        return {"skills": ["Python"]}
+
+    processor.analyze_job_description = analyze_job_description
+    processor.scorer.embed_job_description = lambda job_description: None
+
+    profiles = [
+        processor.prepare_job_description(str(path)) for path in (first, renamed)
+    ]
+
+    assert analyzed == [str(first)]
+    assert profiles[0] is profiles[1]
+
+
+def test_embeddings_of_another_model_are_not_reused():
+    scorer = ResumeScorer()
+    job_description = {
+        "section_embeddings": {"skills": [1.0]},
+        "embedding_model": scorer.vectorizer.embedding_id,
+    }
+
+    assert scorer._cached_embeddings(job_description) == {"skills": [1.0]}
+    job_description["embedding_model"] = "another-model"
+    assert scorer._cached_embeddings(job_description) == {}
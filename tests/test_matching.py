@@ -0,0 +1,101 @@
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
+
+import numpy as np
+import pytest
+
+from resume_analyzer.matching import (
+    BulkSkillMatcher,
+    SkillMatrix,
+    SkillVocabulary,
+    fuzzy_matrix,
+    popcount,
+)
+from resume_analyzer.scoring import ResumeScorer
+
+
+def test_frozen_vocabulary_rejects_unknown_skills():
+    vocabulary = SkillVocabulary(["Python", "SQL"]).freeze()
+
+    assert vocabulary.add("python") == 0
+    with pytest.raises(ValueError):
+        vocabulary.add("Rust")
+
+
+def test_overlay_continues_ids_of_its_base():
+    vocabulary = SkillVocabulary(["Python", "SQL"]).freeze()
+    overlay = vocabulary.overlay()
+
+    assert overlay.add("SQL") == 1
+    assert overlay.add("Rust") == 2
+    assert overlay.name(2) == "rust" and overlay.name(0) == "python"
+    assert len(vocabulary) == 2 and "Rust" not in vocabulary
+
+
+def test_matching_unknown_skills_leaves_shared_vocabulary_unchanged():
+    vocabulary = SkillVocabulary(["Python", "SQL"]).freeze()
+    matcher = BulkSkillMatcher(vocabulary)
+
+    def match(i):
+        return matcher.match([[f"skill {i}", "Python"]], [f"skill {i}", "Go"])
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(match, range(200)))
+
+    assert len(vocabulary) == 2
+    for i, [(score, matching, missing)] in enumerate(results):
+        assert (score, matching, missing) == (0.5, [f"skill {i}"], ["Go"])
+
+
+def test_popcount_counts_set_bits_per_row():
+    words = np.array([[0, 1], [2**64 - 1, 3]], dtype=np.uint64)
+
+    assert popcount(words).tolist() == [1, 66]
+
+
+def test_skill_matrix_contains_and_intersection_counts():
+    matrix = SkillMatrix([np.array([0, 70]), np.array([], dtype=np.int32)], 128)
+
+    assert matrix.contains(np.array([70, 1, 500])).tolist() == [
+        [True, False, False],
+        [False, False, False],
+    ]
+    assert matrix.intersection_counts(np.array([0, 70, 3])).tolist() == [2, 0]
+
+
+@pytest.mark.parametrize(
+    "resume_skills",
+    [["python", "Java", "Docker"], ["Python", "AWS", "Docker", "SQL"], [], ["sql "]],
+)
+def test_bulk_matching_agrees_with_scalar_matching(resume_skills):
+    jd_skills = ["Python", "AWS", "Docker", "SQL", "python"]
+    scorer = ResumeScorer()
+
+    [bulk] = scorer.match_skills_bulk([resume_skills], jd_skills)
+
+    assert bulk == scorer.match_skills(resume_skills, jd_skills)
+
+
+def test_fuzzy_matching_ignores_punctuation_but_keeps_c_variants_apart():
+    pytest.importorskip("rapidfuzz")
+
+    matches = fuzzy_matrix(["ReactJS", "C++", "..."], ["React.js", "C#", "..."])
+
+    assert matches.tolist() == [
+        [True, False, False],
+        [False, False, False],
+        [False, False, False],
+    ]
+
+
+def test_fuzzy_cutoff_without_rapidfuzz_fails_at_construction(monkeypatch):
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name, *args: None if name == "rapidfuzz" else find_spec(name, *args),
+    )
+
+    assert BulkSkillMatcher().fuzzy_cutoff is None
+    with pytest.raises(ImportError, match="rapidfuzz"):
+        BulkSkillMatcher(fuzzy_cutoff=90)
@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+from resume_analyzer import metrics
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = metrics.Registry()
+    counter = registry.register(metrics.Counter("test_total", "Test.", ["kind"]))
+    histogram = registry.register(
+        metrics.Histogram("test_seconds", "Test.", buckets=(1.0, 10.0))
+    )
+    monkeypatch.setattr(metrics, "REGISTRY", registry)
+    monkeypatch.setattr(metrics, "_multiprocess_dir", None)
+    monkeypatch.setattr(metrics, "_inherited", {})
+    return registry, counter, histogram
+
+
+def samples(text):
+    return dict(
+        line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#")
+    )
+
+
+def test_delta_and_merge_carry_counts_between_registries(registry):
+    registry, counter, histogram = registry
+    counter.inc(kind="a")
+    before = registry.snapshot()
+    counter.inc(2, kind="a")
+    counter.inc(kind="b")
+    histogram.observe(5.0)
+
+    delta = registry.delta(before)
+    registry.merge(delta)
+
+    assert counter.value(kind="a") == 5
+    assert counter.value(kind="b") == 2
+    assert histogram.count() == 2
+    assert samples(registry.expose())['test_seconds_bucket{le="10"}'] == "2"
+
+
+def run_in_worker(registry, directory, work):
+    """Fork a worker as gunicorn would, and return what ``work`` returns."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_fd)
+            metrics._multiprocess_dir = directory
+            metrics._inherited = registry.snapshot()
+            output = work() or ""
+            metrics.write_snapshot(directory, metrics._inherited)
+            with os.fdopen(write_fd, "w") as pipe:
+                pipe.write(output)
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        output = pipe.read()
+    os.waitpid(pid, 0)
+    return output
+
+
+def test_workers_expose_the_totals_of_all_processes(registry, tmp_path):
+    registry, counter, histogram = registry
+    directory = str(tmp_path)
+    # Recorded by the master before forking, e.g. during warm-up
+    counter.inc(kind="warm_up")
+    metrics.write_snapshot(directory)
+
+    def upload():
+        counter.inc(kind="upload")
+        histogram.observe(0.5)
+
+    def scrape():
+        counter.inc(kind="upload")
+        return metrics.expose()
+
+    run_in_worker(registry, directory, upload)
+    run_in_worker(registry, directory, upload)
+    exposed = samples(run_in_worker(registry, directory, scrape))
+
+    assert exposed['test_total{kind="warm_up"}'] == "1"
+    assert exposed['test_total{kind="upload"}'] == "3"
+    assert exposed["test_seconds_count"] == "2"
+    # Exposing does not change the registry of the master
+    assert counter.value(kind="upload") == 0
@@ -0,0 +1,89 @@
+import threading
+import time
+
+import pytest
+
+from resume_analyzer.pipeline import Pipeline, Stage, _square
+
+
+def test_items_pass_through_process_thread_and_batch_stages():
+    batches = []
+
+    def add_one(keys, values):
+        batches.append(len(keys))
+        return [value + 1 for value in values]
+
+    pipeline = Pipeline(
+        [
+            Stage("square", _square, kind="process", workers=2),
+            Stage("negate", lambda key, value: -value, kind="thread", workers=3),
+            Stage("add_one", add_one, kind="batch", batch_size=4),
+        ],
+        queue_size=4,
+    )
+
+    results = dict(pipeline.run((i, i) for i in range(12)))
+
+    assert results == {i: 1 - i * i for i in range(12)}
+    assert max(batches) <= 4
+    assert sum(batches) == 12
+    assert pipeline.report()["square"]["items"] == 12
+
+
+def test_failed_items_are_none_and_skip_later_stages():
+    seen = []
+
+    def parse(key, value):
+        if value == 2:
+            raise ValueError("unreadable")
+        return None if value == 3 else value
+
+    def score(keys, values):
+        seen.extend(keys)
+        return values
+
+    pipeline = Pipeline([Stage("parse", parse), Stage("score", score, kind="batch")])
+
+    results = dict(pipeline.run((i, i) for i in range(5)))
+
+    assert results == {0: 0, 1: 1, 2: None, 3: None, 4: 4}
+    assert sorted(seen) == [0, 1, 4]
+    assert pipeline.report()["parse"]["failed"] == 2
+
+
+def test_failing_batch_fails_every_item_in_it():
+    def score(keys, values):
+        raise RuntimeError("model crashed")
+
+    pipeline = Pipeline([Stage("score", score, kind="batch", batch_size=8)])
+
+    assert dict(pipeline.run((i, i) for i in range(3))) == {0: None, 1: None, 2: None}
+
+
+def test_unknown_stage_kind_is_rejected():
+    with pytest.raises(ValueError):
+        Pipeline([Stage("parse", _square, kind="fiber")])
+
+
+def test_stopping_early_stops_reading_items_and_all_stages():
+    read = []
+
+    def items():
+        for i in range(10_000):
+            read.append(i)
+            yield i, i
+
+    def slow(key, value):
+        time.sleep(0.01)
+        return value
+
+    threads = threading.active_count()
+    pipeline = Pipeline([Stage("slow", slow, workers=2)], queue_size=2)
+    results = pipeline.run(items())
+
+    next(results)
+    results.close()
+
+    # Bounded queues keep the feeder close behind the slow stage
+    assert len(read) < 20
+    assert threading.active_count() == threads
@@ -0,0 +1,93 @@
+import gc
+import json
+import os
+import sys
+
+import pytest
+
+import process
+from resume_analyzer import extraction, preprocessing, scoring, vectorization
+
+
+class FakePipeline:
+    def add_pipe(self, name):
+        return self
+
+    def from_disk(self, path):
+        return self
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Replace every model loader with one that records what it loaded."""
+    loaded = []
+
+    def load_spacy(*args, **kwargs):
+        loaded.append("spacy")
+        return FakePipeline()
+
+    def load_sentence_transformer(*args, **kwargs):
+        loaded.append("sbert")
+        return object()
+
+    for module in (extraction, preprocessing, scoring):
+        monkeypatch.setattr(module, "load_spacy", load_spacy)
+    monkeypatch.setattr(
+        vectorization, "load_sentence_transformer", load_sentence_transformer
+    )
+    return loaded
+
+
+def make_processor():
+    processor = process.ResumeProcessor()
+    # The blank tokenizer is built by spaCy itself rather than loaded
+    processor.cleaner._tokenizer = object()
+    return processor
+
+
+def loads_in_child(processor, loaded):
+    """Fork, load every model again in the child and return what it loaded."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            before = len(loaded)
+            processor.load_models()
+            os.write(write_fd, json.dumps(loaded[before:]).encode())
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        report = f.read()
+    os.waitpid(pid, 0)
+    return json.loads(report)
+
+
+def test_models_load_once_and_forked_workers_inherit_them(loads):
+    processor = make_processor()
+
+    processor.load_models()
+    processor.load_models()
+
+    # Extractor, cleaner and scorer pipelines, and the SBERT model
+    assert sorted(loads) == ["sbert", "spacy", "spacy", "spacy"]
+    assert loads_in_child(processor, loads) == []
+
+
+def test_wsgi_loads_models_in_the_master_before_forking(loads, monkeypatch):
+    app = pytest.importorskip("app")
+    monkeypatch.setattr(app, "processor", make_processor())
+    # Only the model loading of the warm-up; its documents need real models
+    monkeypatch.setattr(app.processor, "warm_up", app.processor.load_models)
+    monkeypatch.setattr(app, "warm_up_state", dict(app.warm_up_state, started=False))
+    monkeypatch.delitem(sys.modules, "wsgi", raising=False)
+
+    try:
+        import wsgi  # noqa: F401
+    finally:
+        gc.unfreeze()
+
+    assert app.warm_up_state["ready"]
+    assert len(loads) == 4
+    assert loads_in_child(app.processor, loads) == []
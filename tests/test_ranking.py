@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from resume_analyzer.ranking import DEFAULT_WEIGHTS, ScoreMatrix, total_score
+
+
+def test_rerank_matches_weighted_totals():
+    results = {
+        "alice": {"skills_match": 0.9, "overall_similarity": 0.4},
+        "bob": {"skills_match": 0.5, "education_match": 1.0},
+        "carol": {"skills_match": 0.7, "job_title_relevance": 1.0},
+    }
+    matrix = ScoreMatrix.from_results(results)
+
+    ranking = matrix.rerank(DEFAULT_WEIGHTS)
+
+    expected = sorted(
+        results, key=lambda name: -total_score(results[name], DEFAULT_WEIGHTS)
+    )
+    assert [name for name, _ in ranking] == expected
+    for name, score in ranking:
+        assert score == pytest.approx(total_score(results[name], DEFAULT_WEIGHTS))
+
+
+@pytest.mark.parametrize("top", [1, 2, 3, 4, None])
+def test_ties_keep_insertion_order_with_and_without_top(top):
+    matrix = ScoreMatrix(capacity=1)
+    for name, score in [("a", 0.5), ("b", 0.9), ("c", 0.5), ("d", 0.5), ("e", 0.1)]:
+        matrix.add(name, {"skills_match": score})
+
+    ranking = [name for name, _ in matrix.rerank({"skills_match": 1.0}, top=top)]
+
+    assert ranking == ["b", "a", "c", "d", "e"][:top]
+
+
+def test_re_adding_replaces_a_row():
+    matrix = ScoreMatrix()
+    matrix.add("a", {"skills_match": 0.2})
+    matrix.add("a", {"skills_match": 0.8})
+
+    assert len(matrix) == 1
+    assert matrix.rerank({"skills_match": 1.0}) == [("a", pytest.approx(0.8))]
+
+
+def test_concurrent_adds_keep_every_row():
+    matrix = ScoreMatrix(capacity=1)
+
+    def add(i):
+        matrix.add(f"resume-{i}", {"skills_match": i / 1000})
+        matrix.rerank({"skills_match": 1.0}, top=5)
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(add, range(1000)))
+
+    assert len(matrix) == 1000
+    ranking = matrix.rerank({"skills_match": 1.0})
+    assert [name for name, _ in ranking[:2]] == ["resume-999", "resume-998"]
+    assert len({name for name, _ in ranking}) == 1000
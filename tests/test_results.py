@@ -0,0 +1,79 @@
+import pytest
+
+import process
+from resume_analyzer.results import Contact, HtmlStore, ScoreResult
+
+
+def make_result():
+    return ScoreResult(
+        skills_match=0.75,
+        total_score=0.62,
+        matching_skills=["Python", "SQL"],
+        missing_skills=["Kubernetes"],
+        contact=Contact(email="jane@example.com"),
+    )
+
+
+def test_json_round_trip_keeps_every_field():
+    result = make_result()
+
+    assert ScoreResult.from_json(result.to_json()) == result
+    assert result.to_dict()["matching_skills"] == ["Python", "SQL"]
+    assert result.to_dict()["contact"]["email"] == "jane@example.com"
+
+
+def test_from_dict_drops_unknown_keys_and_missing_values():
+    data = {**make_result().to_dict(), "resume_ner": "<div/>", "partial": None}
+
+    result = ScoreResult.from_dict(data)
+
+    assert result == make_result()
+    assert not hasattr(result, "resume_ner")
+
+
+def test_key_access_matches_attributes():
+    result = make_result()
+
+    assert result["total_score"] == result.total_score
+    assert result.get("resume_ner", "missing") == "missing"
+    with pytest.raises(KeyError):
+        result["resume_ner"]
+
+
+def test_skill_names_are_interned():
+    first = ScoreResult(matching_skills=["".join(["Pyt", "hon"])])
+    second = ScoreResult(matching_skills=["".join(["Py", "thon"])])
+
+    assert first.matching_skills[0] is second.matching_skills[0]
+
+
+def test_html_store_round_trips_and_evicts_least_recently_used():
+    store = HtmlStore(max_entries=2)
+    store.put("a", "<p>alpha</p>")
+    store.put("b", "<p>beta</p>")
+
+    assert store.get("a") == "<p>alpha</p>"
+    store.put("c", "<p>gamma</p>")
+
+    assert len(store) == 2
+    assert "b" not in store
+    assert store.get("a") == "<p>alpha</p>"
+    assert store.get("c") == "<p>gamma</p>"
+
+
+def test_processor_keys_ner_html_by_content_hash(tmp_path):
+    upload = tmp_path / "resume.pdf"
+    processor = process.ResumeProcessor(ner_store=HtmlStore())
+
+    upload.write_bytes(b"first resume")
+    first_id = process.document_id(str(upload))
+    processor._store_ner(str(upload), {"ner": ["<p>first</p>"]})
+    # A later upload with the same file name must not replace the first one
+    upload.write_bytes(b"second resume")
+    second_id = process.document_id(str(upload))
+    processor._store_ner(str(upload), {"ner": ["<p>second</p>"]})
+    upload.unlink()
+
+    assert processor.ner_store.get(first_id) == "<p>first</p>"
+    assert processor.ner_store.get(second_id) == "<p>second</p>"
+    assert processor.ner_store.get(str(upload)) is None
@@ -0,0 +1,88 @@
+import pytest
+
+from resume_analyzer.rules import DateRange, RuleEngine, default_rules
+
+SAMPLE = (
+    "Jane Doe | jane.doe@example.com | 555-123-4567\n"
+    "Senior Engineer, June 2019 - Present\n"
+    "Engineer, 03/2016 - May 2019\n"
+    "Looking for 5+ years of experience in Python."
+)
+
+
+def test_default_rules_find_contact_details_and_experience():
+    spans = default_rules().scan_by_rule(SAMPLE)
+
+    assert [span.value for span in spans["email"]] == ["jane.doe@example.com"]
+    assert [span.value for span in spans["phone"]] == ["555-123-4567"]
+    assert [span.value for span in spans["experience_years"]] == [5]
+
+
+def test_date_ranges_parse_months_and_open_ends():
+    current, past = [
+        span.value for span in default_rules().scan_by_rule(SAMPLE)["date_range"]
+    ]
+
+    assert DateRange.format_month(current.start) == "2019-06"
+    assert current.current
+    assert past == DateRange(
+        DateRange.parse_month("2016-03"), DateRange.parse_month("2019-05")
+    )
+    assert past.years == pytest.approx(38 / 12)
+
+
+@pytest.mark.parametrize("month", ["0999-01", "2019-06", "2024-12"])
+def test_parse_month_inverts_format_month(month):
+    assert DateRange.format_month(DateRange.parse_month(month)) == month
+
+
+def test_reversed_range_has_no_years():
+    assert (
+        DateRange(
+            DateRange.parse_month("2023-01"), DateRange.parse_month("2022-05")
+        ).years
+        == 0
+    )
+
+
+def test_rule_listed_first_wins_where_rules_overlap():
+    engine = RuleEngine(
+        [
+            {"name": "number", "type": "text", "pattern": r"\d+"},
+            {"name": "years", "type": "years", "pattern": r"(?P<years>\d+) years"},
+        ]
+    )
+
+    assert [(span.rule, span.text) for span in engine.scan("7 years")] == [
+        ("number", "7")
+    ]
+
+
+def test_definitions_expand_and_named_groups_stay_per_rule():
+    engine = RuleEngine(
+        [
+            {"name": "a", "type": "years", "pattern": r"a(?P<years>{{N}})"},
+            {
+                "name": "b",
+                "type": "years",
+                "pattern": r"b(?P<years>{{N}})",
+                "ignore_case": True,
+            },
+        ],
+        {"N": r"{{DIGIT}}+", "DIGIT": r"\d"},
+    )
+
+    assert [(span.rule, span.value) for span in engine.scan("a12 B3")] == [
+        ("a", 12),
+        ("b", 3),
+    ]
+
+
+def test_invalid_rules_are_rejected():
+    with pytest.raises(ValueError):
+        RuleEngine([{"name": "x", "type": "unknown", "pattern": "x"}])
+    with pytest.raises(ValueError):
+        RuleEngine(
+            [{"name": "x", "type": "text", "pattern": "{{A}}"}],
+            {"A": "{{B}}", "B": "{{A}}"},
+        )
@@ -0,0 +1,93 @@
+import pytest
+
+from resume_analyzer.scoring import ResumeScorer
+
+
+def date_range(start, end):
+    return {"kind": "date_range", "start": start, "end": end}
+
+
+def test_job_description_with_only_date_ranges_has_no_requirement():
+    scorer = ResumeScorer()
+    resume = [date_range("2020-01", "2023-01")]
+    jd = [date_range("2024-01", "2024-03")]
+
+    assert scorer.match_experience(resume, jd) == 1.0
+
+
+def test_reversed_resume_range_counts_as_no_experience():
+    scorer = ResumeScorer()
+    resume = [date_range("2023-01", "2022-05")]
+    jd = [{"kind": "stated", "years": 3}]
+
+    assert scorer._total_experience_years(resume) == 0
+    assert scorer.match_experience(resume, jd) == 0.0
+
+
+def test_reversed_range_does_not_shrink_overlapping_ranges():
+    scorer = ResumeScorer()
+    resume = [date_range("2020-01", "2022-01"), date_range("2021-06", "2021-01")]
+
+    assert scorer._total_experience_years(resume) == 2
+
+
+def baseline_match_job_title(resume_titles, jd_titles):
+    """Substring title matching of ResumeScorer before TitleIndex."""
+    if not jd_titles or not resume_titles:
+        return 0.0
+    title_matches = []
+    for jd_title in [title.lower() for title in jd_titles]:
+        matches = [
+            (
+                1.0
+                if jd_title in resume_title
+                else (
+                    0.5
+                    if any(word in resume_title for word in jd_title.split())
+                    else 0.0
+                )
+            )
+            for resume_title in [title.lower() for title in resume_titles]
+        ]
+        title_matches.append(max(matches) if matches else 0.0)
+    return sum(title_matches) / len(jd_titles)
+
+
+@pytest.mark.parametrize(
+    "resume_titles, jd_titles",
+    [
+        (["Web Developers"], ["developer"]),
+        (["Senior Software Engineer"], ["Software Engineer"]),
+        (["Software Engineers"], ["software engineer"]),
+        (
+            ["Data Scientist", "Data Analyst"],
+            ["Data Engineer", "Machine Learning Engineer"],
+        ),
+        (["Project Manager"], ["Product Designer"]),
+        (["Business Analysts"], ["Business Analyst", "Analyst"]),
+        ([], ["Developer"]),
+        (["Developer"], []),
+    ],
+)
+def test_title_matching_agrees_with_the_substring_baseline(resume_titles, jd_titles):
+    scorer = ResumeScorer()
+
+    assert scorer.match_job_title(resume_titles, jd_titles) == baseline_match_job_title(
+        resume_titles, jd_titles
+    )
+
+
+@pytest.mark.parametrize(
+    "resume_titles, jd_titles, expected",
+    [
+        # The baseline matched parts of words
+        (["JavaScript Developer"], ["Java"], 0.0),
+        (["Database Administrator"], ["Data Scientist"], 0.0),
+        # and missed reordered words and plural job description titles
+        (["Engineer, Software"], ["Software Engineer"], 1.0),
+        (["DevOps Engineer"], ["DevOps Engineers"], 1.0),
+    ],
+)
+def test_title_matching_compares_whole_words(resume_titles, jd_titles, expected):
+    assert ResumeScorer().match_job_title(resume_titles, jd_titles) == expected
+    assert baseline_match_job_title(resume_titles, jd_titles) != expected
@@ -0,0 +1,69 @@
+import process
+from resume_analyzer.search import CandidateIndex
+
+
+def build_index(path=":memory:"):
+    index = CandidateIndex(path)
+    index.add("alice", {"skills": ["Kubernetes", "Terraform", "Python"]})
+    index.add("bob", {"skills": ["kubernetes", "Java"]})
+    index.add("carol", {"skills": ["Terraform", "AWS"], "job_titles": ["DevOps"]})
+    return index
+
+
+def test_search_combines_all_any_and_none_of():
+    index = build_index()
+
+    assert index.search(all_of=["Kubernetes", "terraform"]) == {"alice"}
+    assert index.search(any_of=["Java", "AWS"], none_of=["Python"]) == {"bob", "carol"}
+    assert index.search(none_of=["Kubernetes"]) == {"carol"}
+    assert index.search(all_of=["Kubernetes", "Rust"]) == set()
+    assert index.search(all_of=["devops"], field="job_titles") == {"carol"}
+
+
+def test_at_least_ranks_by_matched_terms_then_id():
+    index = build_index()
+
+    assert index.at_least(["Kubernetes", "Terraform", "AWS", "aws"], k=2) == [
+        ("alice", 2),
+        ("carol", 2),
+    ]
+    assert index.at_least(["Java"], k=2) == []
+
+
+def test_shortlist_uses_job_description_skills_and_limit():
+    index = build_index()
+    job_description = {"skills": ["Kubernetes", "Terraform", "Java"]}
+
+    assert index.shortlist(job_description, min_skills=1) == ["alice", "bob", "carol"]
+    assert index.shortlist(job_description, min_skills=2, limit=1) == ["alice"]
+
+
+def test_re_adding_replaces_postings_and_index_persists(tmp_path):
+    path = str(tmp_path / "index.db")
+    index = build_index(path)
+    index.add("bob", {"skills": ["Go"]})
+    index.close()
+
+    reopened = CandidateIndex(path)
+    assert len(reopened) == 3
+    assert reopened.search(any_of=["Java"]) == set()
+    assert reopened.postings("go") == {"bob"}
+    assert reopened.get("carol")["job_titles"] == ["DevOps"]
+
+
+def test_processor_indexes_resumes_by_content_hash(tmp_path):
+    first, renamed = tmp_path / "upload.pdf", tmp_path / "renamed.pdf"
+    first.write_bytes(b"same resume")
+    renamed.write_bytes(b"same resume")
+    processor = process.ResumeProcessor(index=CandidateIndex())
+    processor.scorer.score_batch = lambda resumes, job_description: [None] * len(
+        resumes
+    )
+
+    for path in (first, renamed):
+        processor._score_analyzed([str(path)], [{"skills": ["Python"]}], {}, None, {})
+
+    resume_id = process.document_id(str(first))
+    assert len(processor.index) == 1
+    assert processor.index.search(all_of=["python"]) == {resume_id}
+    assert processor.index.get(resume_id)["file_name"] == "renamed.pdf"
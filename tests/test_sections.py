@@ -0,0 +1,63 @@
+from resume_analyzer.sections import HEADER, chunk_text, split_sections
+
+
+def test_headings_alone_on_their_line_start_sections():
+    text = (
+        "Jane Doe\njane@example.com\nSUMMARY\nBackend engineer.\nWork Experience:\nACME"
+    )
+
+    assert split_sections(text) == {
+        HEADER: "Jane Doe\njane@example.com",
+        "summary": "Backend engineer.",
+        "experience": "ACME",
+    }
+
+
+def test_inline_heading_starts_a_section_at_the_start_of_a_block():
+    text = "Experience ACME CORP\nEngineer\n\nSkills: Python, SQL\n\nEducation & Training\nBS"
+
+    assert split_sections(text) == {
+        "experience": "ACME CORP\nEngineer",
+        "skills": "Python, SQL",
+        "education": "BS",
+    }
+
+
+def test_inline_heading_inside_a_block_is_content():
+    text = (
+        "Experience\n"
+        "Senior Engineer, ACME\n"
+        "• Summary: led the migration to Kubernetes\n"
+        "Skills: Python, SQL\n"
+        "Education ABROAD PROGRAM coordinator\n"
+    )
+
+    assert split_sections(text) == {
+        "experience": "Senior Engineer, ACME\n"
+        "• Summary: led the migration to Kubernetes\n"
+        "Skills: Python, SQL\n"
+        "Education ABROAD PROGRAM coordinator"
+    }
+
+
+def test_job_description_headings_map_to_resume_sections():
+    text = (
+        "Key Responsibilities\nBuild APIs\n\nRequirements\nPython\n\nBenefits\nRemote"
+    )
+
+    assert split_sections(text) == {
+        "experience": "Build APIs",
+        "skills": "Python",
+        "other": "Remote",
+    }
+
+
+def test_repeated_sections_are_concatenated():
+    text = "Skills\nPython\nExperience\nACME\nSkills\nSQL"
+
+    assert split_sections(text)["skills"] == "Python\nSQL"
+
+
+def test_chunk_text_splits_on_word_count():
+    assert list(chunk_text("a b c d e", size=2)) == ["a b", "c d", "e"]
+    assert list(chunk_text("", size=2)) == []
@@ -0,0 +1,24 @@
+"""Production WSGI entry point.
+
+Every model is loaded and warmed up in the master process before workers
+are forked, so all workers share one copy of the spaCy pipelines, the entity
+ruler and the SBERT weights copy-on-write:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import gc
+import logging
+
+from app import app, warm_up
+
+logging.basicConfig(level=logging.INFO)
+
+# Collections during loading would only move fresh objects between
+# generations; freezing afterwards keeps the collector off the models
+gc.disable()
+warm_up()
+gc.freeze()
+gc.enable()
+
+__all__ = ["app"]